@@ -0,0 +1,79 @@
+# ============================================================
+# Benchmark: Barnes–Hut Scaling
+# ============================================================
+# Times barnes_hut_accelerations over a ladder of body counts
+# and compares against direct summation.
+#
+# Run from the python/ directory:
+#   python -m benchmarks.bench_barnes_hut
+# ============================================================
+
+import math
+import sys
+import time
+
+import numpy as np
+
+import utils.constants as C
+from physics.barnes_hut import barnes_hut_accelerations
+from physics.gravity import gravity_accelerations
+
+
+# Body counts for the scaling ladder
+LADDER = (1000, 2000, 4000, 8000, 16000, 32000, 64000)
+
+# Direct summation is only timed up to this count
+DIRECT_LIMIT = 8000
+
+
+# ------------------------------------------------------------
+# Dust-like uniform scene inside the window
+# ------------------------------------------------------------
+def make_scene(n, seed=0):
+    rng = np.random.default_rng(seed)
+    positions = rng.uniform(0, [C.WIDTH, C.HEIGHT], size=(n, 2))
+    radii = rng.uniform(1, 4, size=n)
+    masses = C.MATERIALS["dust"]["density"] * math.pi * radii ** 2
+    return positions, masses, radii
+
+
+# ------------------------------------------------------------
+# Best-of-k wall time of fn()
+# ------------------------------------------------------------
+def best_time(fn, repeats=3):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(theta=C.BH_THETA):
+    print(f"theta = {theta}")
+    print(f"{'N':>8} {'BH (s)':>10} {'direct (s)':>11} {'BH/(N log2 N) ns':>18} {'median err':>11}")
+
+    for n in LADDER:
+        positions, masses, radii = make_scene(n)
+
+        bh = best_time(lambda: barnes_hut_accelerations(positions, masses, radii, C.G, theta))
+        per_nlogn = bh / (n * math.log2(n)) * 1e9
+
+        direct = ""
+        error = ""
+        if n <= DIRECT_LIMIT:
+            direct_time = best_time(lambda: gravity_accelerations(positions, masses, radii, C.G), 1)
+            direct = f"{direct_time:.4f}"
+
+            exact = gravity_accelerations(positions, masses, radii, C.G)
+            approx = barnes_hut_accelerations(positions, masses, radii, C.G, theta)
+            rel = np.linalg.norm(approx - exact, axis=1) / np.linalg.norm(exact, axis=1)
+            error = f"{np.median(rel):.2e}"
+
+        print(f"{n:>8} {bh:>10.4f} {direct:>11} {per_nlogn:>18.1f} {error:>11}")
+
+    # A flat BH/(N log2 N) column means O(n log n) scaling
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else C.BH_THETA)
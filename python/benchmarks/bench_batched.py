@@ -0,0 +1,107 @@
+# ============================================================
+# Benchmark: Batched Universes vs. One World per Universe
+# ============================================================
+# Checks that every universe of a batch follows the World it
+# was loaded from, then times K solar-system presets stepped
+# as one batch against K separate Worlds.
+#
+# Run from the python/ directory:
+#   python -m benchmarks.bench_batched
+# ============================================================
+
+import random
+import sys
+import time
+
+import numpy as np
+
+import utils.constants as C
+from physics.batched import batch_from_worlds
+from physics.world import World
+from simulation.dust_cloud import spawn_dust_cloud
+from simulation.preset1 import spawn_system
+
+
+# Universe counts timed
+LADDER = (1, 10, 100, 1000, 4000)
+
+# Separate Worlds are only timed up to this many universes
+WORLD_LIMIT = 100
+
+DT = 1.0 / C.PHYSICS_HZ
+STEPS = 60
+
+# Max position difference (pixels) allowed in the equivalence check
+TOLERANCE = 1e-6
+
+
+def solar_world(seed, G=C.G, restitution=0.6, damping=1.0):
+    random.seed(seed)
+    world = World(G=G, restitution=restitution, damping=damping)
+    spawn_system(world.bodies, [C.WIDTH / 2, C.HEIGHT / 2])
+    return world
+
+
+# ------------------------------------------------------------
+# Mixed scenes, body counts and parameters vs. separate Worlds
+# ------------------------------------------------------------
+def check_equivalence():
+    worlds = [
+        solar_world(1),
+        solar_world(2, G=150.0, damping=0.999),
+        solar_world(3, restitution=0.9),
+    ]
+    for seed, count in ((4, 12), (5, 20), (6, 7)):
+        world = World(G=50.0 * seed, restitution=0.1 * seed)
+        spawn_dust_cloud(world.bodies, [C.WIDTH / 2, C.HEIGHT - 20], count=count, spread=30.0, seed=seed)
+        world.bodies.radii[:count] *= 4.0      # dense pile: many contacts
+        worlds.append(world)
+
+    batch = batch_from_worlds(worlds)
+    contacts = 0
+    for _ in range(STEPS):
+        batch.step(DT)
+        contacts += int(batch.contacts.sum())
+        for world in worlds:
+            world.step(DT)
+
+    worst = 0.0
+    for k, world in enumerate(worlds):
+        n = len(world)
+        worst = max(worst, float(np.abs(batch.positions[k, :n] - world.bodies.positions[:n]).max()))
+    print(f"equivalence: {len(worlds)} universes, {contacts} contacts, "
+          f"max position difference {worst:.1e} px")
+    return worst <= TOLERANCE
+
+
+def main():
+    if not check_equivalence():
+        print("MISMATCH")
+        sys.exit(1)
+
+    print(f"\n{'K':>6} {'batch (s)':>10} {'worlds (s)':>11} {'speed-up':>9} {'universe-steps/s':>17}")
+    for K in LADDER:
+        worlds = [solar_world(seed) for seed in range(K)]
+        batch = batch_from_worlds(worlds)
+
+        start = time.perf_counter()
+        for _ in range(STEPS):
+            batch.step(DT)
+        batched = time.perf_counter() - start
+
+        separate = ""
+        speedup = ""
+        if K <= WORLD_LIMIT:
+            start = time.perf_counter()
+            for _ in range(STEPS):
+                for world in worlds:
+                    world.step(DT)
+            t = time.perf_counter() - start
+            separate = f"{t:.3f}"
+            speedup = f"{t / batched:.1f}x"
+
+        print(f"{K:>6} {batched:>10.3f} {separate:>11} {speedup:>9} {K * STEPS / batched:>17.0f}")
+
+
+if __name__ == "__main__":
+    main()
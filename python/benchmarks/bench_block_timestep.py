@@ -0,0 +1,104 @@
+# ============================================================
+# Benchmark: Block Timesteps vs. Global Leapfrog
+# ============================================================
+# Clustered scene (simulation/scenes.spawn_clustered): a star
+# with grazing planets inside a wide dust field. Compares the
+# body-body interactions needed by block timesteps and by a
+# single global leapfrog step to reach the same accuracy.
+#
+# Run from the python/ directory:
+#   python -m benchmarks.bench_block_timestep
+# ============================================================
+
+import time
+
+import numpy as np
+
+from physics.gravity import gravity_potential_energy, kinetic_energy
+from physics.world import World
+from simulation.scenes import spawn_clustered
+
+
+# Scene size (dust bodies, square domain in pixels)
+DUST = 600
+SIDE = 4000
+
+# World step and simulated time
+DT = 1.0 / 30.0
+DURATION = 1.0
+
+# Global leapfrog ladder: dt / 2^level
+LEVELS = range(0, 7)
+
+# Reference solution: 4th-order scheme at dt / 2^REFERENCE_LEVEL
+REFERENCE_LEVEL = 6
+
+
+def make_world(integrator):
+    world = World(SIDE, SIDE, integrator=integrator)
+    world.collisions_enabled = False
+    world.boundaries_enabled = False
+    spawn_clustered(world.bodies, DUST, SIDE, SIDE, seed=1)
+    return world
+
+
+def total_energy(world):
+    store = world.bodies
+    n = len(store)
+    return (
+        kinetic_energy(store.velocities[:n], store.masses[:n])
+        + gravity_potential_energy(store.positions[:n], store.masses[:n], store.radii[:n], world.G)
+    )
+
+
+# ------------------------------------------------------------
+# Run DURATION seconds: final positions, energy error, stats
+# ------------------------------------------------------------
+def run(integrator, dt):
+    world = make_world(integrator)
+    e0 = total_energy(world)
+
+    start = time.perf_counter()
+    for _ in range(int(round(DURATION / dt))):
+        world.step(dt)
+    seconds = time.perf_counter() - start
+
+    n = len(world)
+    error = abs((total_energy(world) - e0) / e0)
+    return world.bodies.positions[:n].copy(), error, world.integrator.interactions, seconds, world
+
+
+def main():
+    print(f"clustered scene: {DUST} dust + star + 4 planets, {DURATION} s simulated")
+
+    reference, *_ = run("yoshida4", DT / 2 ** REFERENCE_LEVEL)
+
+    def deviation(positions):
+        return float(np.hypot(*(positions - reference).T).max())
+
+    print(f"{'scheme':>16} {'pos err':>10} {'energy err':>11} {'interactions':>13} {'time (s)':>9}")
+
+    block_pos, block_energy, block_work, block_time, world = run("block", DT)
+    block_dev = deviation(block_pos)
+    print(f"{'block':>16} {block_dev:>10.2e} {block_energy:>11.2e} {block_work:>13.3e} {block_time:>9.2f}")
+
+    matched = None
+    for level in LEVELS:
+        pos, energy, work, seconds, _ = run("leapfrog", DT / 2 ** level)
+        dev = deviation(pos)
+        print(f"{f'leapfrog dt/{2 ** level}':>16} {dev:>10.2e} {energy:>11.2e} {work:>13.3e} {seconds:>9.2f}")
+        if matched is None and dev <= block_dev:
+            matched = (level, work)
+
+    levels = np.bincount(world.integrator.levels, minlength=world.integrator.max_level + 1)
+    print(f"\nbodies per level after the run: {levels.tolist()}")
+
+    if matched is None:
+        print("no global step on the ladder reaches the block accuracy")
+        return
+    level, work = matched
+    print(f"same accuracy needs global dt/{2 ** level}: {work / block_work:.1f}x the interactions of block steps")
+
+
+if __name__ == "__main__":
+    main()
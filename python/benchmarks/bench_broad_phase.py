@@ -0,0 +1,88 @@
+# ============================================================
+# Benchmark: Broad Phase
+# ============================================================
+# Checks that the spatial hash returns exactly the brute-force
+# pair list, then times both over a ladder of body counts.
+#
+# Run from the python/ directory:
+#   python -m benchmarks.bench_broad_phase
+# ============================================================
+
+import math
+import sys
+import time
+
+import numpy as np
+
+import utils.constants as C
+from physics.broad_phase import SpatialHash, brute_force_pairs
+
+
+# Body counts for the ladder
+LADDER = (250, 500, 1000, 2000, 4000, 8000, 16000)
+
+# Brute force is only timed up to this count
+BRUTE_LIMIT = 4000
+
+
+# ------------------------------------------------------------
+# Random scene: mostly small bodies, a few large ones
+# ------------------------------------------------------------
+def make_scene(n, seed=0):
+    rng = np.random.default_rng(seed)
+    positions = rng.uniform(0, [C.WIDTH, C.HEIGHT], size=(n, 2))
+    radii = rng.uniform(1, 6, size=n) * math.sqrt(1000 / max(n, 1))
+    big = rng.random(n) < 0.01
+    radii[big] *= 10
+    return positions, radii
+
+
+# ------------------------------------------------------------
+# Spatial hash vs. brute force must agree exactly
+# ------------------------------------------------------------
+def check_equivalence(seeds=20):
+    grid = SpatialHash()
+    for seed in range(seeds):
+        for n in (0, 1, 2, 50, 400):
+            positions, radii = make_scene(n, seed)
+            if n > 4:
+                positions[1] = positions[0]            # coincident bodies
+                positions[2:5] = positions[2]          # stacked in one cell
+            got = grid.candidate_pairs(positions, radii)
+            want = brute_force_pairs(positions, radii)
+            if not (np.array_equal(got[0], want[0]) and np.array_equal(got[1], want[1])):
+                print(f"MISMATCH seed={seed} n={n}")
+                return False
+    return True
+
+
+def best_time(fn, repeats=3):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    if not check_equivalence():
+        sys.exit(1)
+    print("spatial hash == brute force: OK")
+
+    grid = SpatialHash()
+    print(f"{'N':>8} {'grid (s)':>10} {'brute (s)':>10} {'grid ns/body':>13} {'pairs':>8}")
+    for n in LADDER:
+        positions, radii = make_scene(n)
+        t_grid = best_time(lambda: grid.candidate_pairs(positions, radii))
+        pairs = len(grid.candidate_pairs(positions, radii)[0])
+
+        brute = ""
+        if n <= BRUTE_LIMIT:
+            brute = f"{best_time(lambda: brute_force_pairs(positions, radii), 1):.4f}"
+
+        print(f"{n:>8} {t_grid:>10.4f} {brute:>10} {t_grid / n * 1e9:>13.0f} {pairs:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+# ============================================================
+# Benchmark: Camera Culling vs. Drawing Every Body
+# ============================================================
+# Checks that the broad-phase view query finds every body a
+# brute-force test finds, then times a frame's drawing in a
+# large world with the camera showing a small part of it:
+# all bodies vs. only the visible ones.
+#
+# Run from the python/ directory:
+#   python -m benchmarks.bench_camera
+# ============================================================
+
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame
+
+import utils.constants as C
+from physics.world import World
+from renderer.camera import Camera, visible_rows
+from renderer.splat import draw_bodies_lod
+from renderer.sprites import SpriteCache
+from renderer.text_cache import TextCache
+from simulation.scenes import spawn_uniform
+
+
+# Bodies spread over a square world of WORLD_SIZE world units
+LADDER = (10_000, 50_000, 200_000)
+WORLD_SIZE = 16_000
+
+# Camera views: (zoom, center)
+VIEWS = ((1.0, (8_000, 8_000)), (0.25, (8_000, 8_000)), (4.0, (3_000, 12_000)))
+
+REPEATS = 5
+
+
+def big_world(count, broad_phase=C.BROAD_PHASE):
+    world = World(WORLD_SIZE, WORLD_SIZE, broad_phase=broad_phase)
+    spawn_uniform(world.bodies, count, WORLD_SIZE, WORLD_SIZE, seed=0)
+    return world
+
+
+def best_of(fn):
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+# ------------------------------------------------------------
+# Culled rows == brute-force visible rows (both broad phases)
+# ------------------------------------------------------------
+def check_culling():
+    ok = True
+    for broad_phase in ("grid", "aabb_tree"):
+        world = big_world(20_000, broad_phase)
+        store = world.bodies
+        n = len(store)
+        camera = Camera()
+        missing = 0
+        for zoom, center in VIEWS:
+            camera.zoom = zoom
+            camera.center = list(center)
+            x0, y0, x1, y1 = camera.view_rect(C.CULL_MARGIN)
+            p = store.positions[:n]
+            r = store.radii[:n]
+            expected = np.flatnonzero((p[:, 0] + r >= x0) & (p[:, 0] - r <= x1)
+                                      & (p[:, 1] + r >= y0) & (p[:, 1] - r <= y1))
+            missing += len(np.setdiff1d(expected, visible_rows(world, camera)))
+        print(f"culling ({broad_phase}): {missing} visible bodies missed")
+        ok = ok and missing == 0
+    return ok
+
+
+def main():
+    if not check_culling():
+        print("MISMATCH")
+        sys.exit(1)
+
+    pygame.init()
+    screen = pygame.Surface((C.WIDTH, C.HEIGHT))
+    sprites = SpriteCache()
+    text_cache = TextCache()
+    camera = Camera()
+
+    print(f"\n{'bodies':>8} {'zoom':>6} {'visible':>8} {'all ms':>8} {'culled ms':>10} {'speedup':>8}")
+    for count in LADDER:
+        world = big_world(count)
+        store = world.bodies
+        for zoom, center in VIEWS:
+            camera.zoom = zoom
+            camera.center = list(center)
+
+            def draw_all():
+                screen.fill(C.BACKGROUND_COLOR)
+                positions = camera.world_to_screen(store.positions[:count])
+                draw_bodies_lod(screen, store, sprites, text_cache, positions, scale=camera.zoom)
+
+            def draw_culled():
+                screen.fill(C.BACKGROUND_COLOR)
+                rows = visible_rows(world, camera)
+                positions = camera.world_to_screen(store.positions[rows])
+                draw_bodies_lod(screen, store, sprites, text_cache, positions, rows=rows,
+                                scale=camera.zoom)
+
+            visible = len(visible_rows(world, camera))
+            full = best_of(draw_all)
+            culled = best_of(draw_culled)
+            print(f"{count:>8} {zoom:>6} {visible:>8} {full * 1e3:>8.2f} {culled * 1e3:>10.2f} "
+                  f"{full / culled:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+# ============================================================
+# Benchmark: Checkpoint Save / Load
+# ============================================================
+# Checks that a World resumed from a checkpoint (mapped and
+# eagerly read) continues exactly like the World that kept
+# running, then times for growing worlds: the consistent copy
+# (the only part a step waits for), the background write, and
+# loading with and without memory mapping.
+#
+# Run from the python/ directory:
+#   python -m benchmarks.bench_checkpoint
+# ============================================================
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+import utils.constants as C
+from physics.checkpoint import CheckpointWriter, capture, load_checkpoint, save_checkpoint
+from physics.world import World
+from simulation.scenes import spawn_mixed_materials, spawn_uniform
+
+
+LADDER = (10_000, 100_000, 1_000_000)
+
+STEPS = 40
+
+
+def same_world(a, b):
+    n = len(a.bodies)
+    return (n == len(b.bodies) and a.steps == b.steps
+            and a.bodies.next_serial == b.bodies.next_serial
+            and a.bodies.palette == b.bodies.palette
+            and all(np.array_equal(getattr(a.bodies, name)[:n], getattr(b.bodies, name)[:n])
+                    for name in ("positions", "velocities", "masses", "radii",
+                                 "material_index", "color_index", "ids", "serials")))
+
+
+# ------------------------------------------------------------
+# Save mid-run, resume, compare with the uninterrupted run
+# ------------------------------------------------------------
+def check_resume(folder):
+    world = World(gravity_solver="barnes_hut", G=C.G * 2, damping=0.999)
+    spawn_mixed_materials(world.bodies, 600, seed=0)
+    for _ in range(STEPS):
+        world.step(1 / C.PHYSICS_HZ)
+
+    path = os.path.join(folder, "resume.ckpt")
+    save_checkpoint(world, path, {"body_counter": 7})
+    for _ in range(STEPS):
+        world.step(1 / C.PHYSICS_HZ)
+
+    ok = True
+    for mmap in (True, False):
+        resumed, meta = load_checkpoint(path, mmap=mmap)
+        params_ok = (resumed.G == world.G and resumed.damping == world.damping
+                     and resumed.gravity_solver == "barnes_hut" and meta == {"body_counter": 7})
+        for _ in range(STEPS):
+            resumed.step(1 / C.PHYSICS_HZ)
+        identical = params_ok and same_world(world, resumed)
+        print(f"resume (mmap={mmap}): parameters restored and {STEPS} more steps identical: {identical}")
+        ok = ok and identical
+
+    # Edits to a mapped store (and growing it) never reach the file
+    resumed, _ = load_checkpoint(path)
+    resumed.bodies.positions[0] = -1.0
+    resumed.add_body([1.0, 1.0], [0.0, 0.0], 1.0, 1.0, C.WHITE)
+    untouched = same_world(load_checkpoint(path)[0], load_checkpoint(path, mmap=False)[0])
+    print(f"mapped store edits and growth leave the file unchanged: {untouched}")
+    return ok and untouched
+
+
+def best_of(fn, repeats=3):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    with tempfile.TemporaryDirectory() as folder:
+        if not check_resume(folder):
+            print("MISMATCH")
+            sys.exit(1)
+
+        print(f"\n{'bodies':>9} {'MB':>7} {'copy ms':>8} {'write ms':>9} "
+              f"{'mmap load ms':>13} {'+touch ms':>10} {'eager load ms':>14}")
+        path = os.path.join(folder, "big.ckpt")
+        for count in LADDER:
+            world = World(16_000, 16_000)
+            spawn_uniform(world.bodies, count, 16_000, 16_000, seed=0)
+
+            copy = best_of(lambda: capture(world))
+            writer = CheckpointWriter()
+
+            def background_save():
+                writer.save(world, path)
+                writer.close()
+
+            write = best_of(background_save) - copy
+            size = os.path.getsize(path) / 1e6
+
+            mapped = best_of(lambda: load_checkpoint(path))
+            touched = best_of(lambda: load_checkpoint(path)[0].bodies.positions.sum())
+            eager = best_of(lambda: load_checkpoint(path, mmap=False))
+            print(f"{count:>9} {size:>7.1f} {copy * 1e3:>8.2f} {write * 1e3:>9.2f} "
+                  f"{mapped * 1e3:>13.2f} {touched * 1e3:>10.2f} {eager * 1e3:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+# ============================================================
+# Benchmark: Integrator Energy Error vs. Step Size
+# ============================================================
+# Runs the solar-system preset (simulation/preset1.py) under
+# gravity only and reports the worst relative energy error of
+# each integrator over a ladder of step sizes, plus the force
+# evaluations per simulated second.
+#
+# Run from the python/ directory:
+#   python -m benchmarks.bench_integrators
+# ============================================================
+
+import random
+
+import numpy as np
+
+import utils.constants as C
+from physics.gravity import gravity_potential_energy, kinetic_energy
+from physics.integrator import FIXED_STEP_INTEGRATORS
+from physics.world import World
+from simulation.preset1 import spawn_system
+
+
+# Step sizes (seconds), finest first
+STEPS = (1 / 960, 1 / 480, 1 / 240, 1 / 120, 1 / 60, 1 / 30, 1 / 15, 1 / 8, 1 / 4)
+
+# Simulated time per run (the outer planet's period is ≈ 13 s)
+DURATION = 20.0
+
+# The preset places planets at random angles and they attract each
+# other; with this seed no two planets pass closer than ≈ 70 px within
+# DURATION, so the error measures the integrator, not a near collision
+SEED = 4
+
+
+def make_world(integrator, seed=SEED):
+    random.seed(seed)
+    world = World(G=C.G, integrator=integrator)
+    world.collisions_enabled = False
+    world.boundaries_enabled = False
+    spawn_system(world.bodies, [C.WIDTH / 2, C.HEIGHT / 2])
+    return world
+
+
+def total_energy(world):
+    store = world.bodies
+    n = len(store)
+    return (
+        kinetic_energy(store.velocities[:n], store.masses[:n])
+        + gravity_potential_energy(store.positions[:n], store.masses[:n], store.radii[:n], world.G)
+    )
+
+
+# ------------------------------------------------------------
+# Worst |ΔE / E0| over the run and force evaluations per second
+# ------------------------------------------------------------
+def run(integrator, dt):
+    world = make_world(integrator)
+    e0 = total_energy(world)
+    worst = 0.0
+
+    for _ in range(int(round(DURATION / dt))):
+        world.step(dt)
+        worst = max(worst, abs((total_energy(world) - e0) / e0))
+
+    return worst, world.integrator.force_evaluations / DURATION
+
+
+def main():
+    errors = {}
+    evals = {}
+
+    print(f"{'integrator':>10} " + " ".join(f"{f'dt=1/{round(1 / dt)}':>10}" for dt in STEPS))
+    for name in FIXED_STEP_INTEGRATORS:
+        row = [run(name, dt) for dt in STEPS]
+        errors[name] = [e for e, _ in row]
+        evals[name] = [f for _, f in row]
+        print(f"{name:>10} " + " ".join(f"{e:>10.2e}" for e in errors[name]))
+
+    # --------------------------------------------------------
+    # Largest step (and its cost) that matches the energy error
+    # of the original scheme at the default physics rate
+    # --------------------------------------------------------
+    reference = errors["euler"][STEPS.index(1 / C.PHYSICS_HZ)]
+    print(f"\ntarget: euler error at dt=1/{C.PHYSICS_HZ} = {reference:.2e}")
+    print(f"{'integrator':>10} {'largest dt':>11} {'dt gain':>8} {'evals/s':>8}")
+
+    for name in FIXED_STEP_INTEGRATORS:
+        ok = [k for k, e in enumerate(errors[name]) if e <= reference]
+        if not ok:
+            print(f"{name:>10} {'-':>11}")
+            continue
+        k = max(ok, key=lambda k: STEPS[k])
+        gain = STEPS[k] * C.PHYSICS_HZ
+        print(f"{name:>10} {f'1/{round(1 / STEPS[k])}':>11} {gain:>7.0f}x {evals[name][k]:>8.0f}")
+
+    # Same physics in all schemes: energies must stay finite
+    if not all(np.isfinite(e) for row in errors.values() for e in row):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# ============================================================
+# Benchmark: Parallel Gravity Speed-up vs. Workers
+# ============================================================
+# Checks the shared-memory process-pool backend against the
+# scalar apply_gravity path, then times it over a ladder of
+# worker counts against single-process gravity_accelerations.
+#
+# Run from the python/ directory:
+#   python -m benchmarks.bench_parallel_gravity
+# ============================================================
+
+import os
+import sys
+import time
+
+import numpy as np
+
+import utils.constants as C
+from physics.body import Body
+from physics.gravity import apply_gravity, gravity_accelerations
+from physics.parallel_gravity import ParallelGravity
+from benchmarks.bench_barnes_hut import make_scene, best_time
+
+
+# Body counts timed
+SIZES = (4000, 16000)
+
+# Bodies in the scalar equivalence check
+CHECK_N = 150
+
+# Relative tolerance against the scalar path
+TOLERANCE = 1e-9
+
+
+# ------------------------------------------------------------
+# Same velocity kick as repeated apply_gravity calls
+# ------------------------------------------------------------
+def check_equivalence(backend, dt=1.0 / 60.0):
+    positions, masses, radii = make_scene(CHECK_N, seed=5)
+    bodies = [
+        Body(positions[i], [0.0, 0.0], masses[i], radii[i], C.WHITE, i + 1)
+        for i in range(CHECK_N)
+    ]
+    for i in range(CHECK_N):
+        for j in range(i + 1, CHECK_N):
+            apply_gravity(bodies[i], bodies[j], C.G, dt)
+    scalar = np.array([b.velocity for b in bodies])
+
+    parallel = backend.accelerations(positions, masses, radii, C.G) * dt
+    error = np.abs(parallel - scalar).max() / np.abs(scalar).max()
+    print(f"max relative difference vs apply_gravity: {error:.1e}")
+    return error <= TOLERANCE
+
+
+def worker_ladder():
+    cores = os.cpu_count() or 1
+    ladder = [1]
+    while ladder[-1] * 2 <= cores:
+        ladder.append(ladder[-1] * 2)
+    if ladder[-1] != cores:
+        ladder.append(cores)
+    return ladder
+
+
+def main():
+    ladder = worker_ladder()
+    print(f"CPU cores: {os.cpu_count()}")
+
+    backends = {w: ParallelGravity(w) for w in ladder}
+    try:
+        if not check_equivalence(backends[ladder[0]]):
+            print("MISMATCH")
+            sys.exit(1)
+
+        for n in SIZES:
+            positions, masses, radii = make_scene(n)
+            single = best_time(lambda: gravity_accelerations(positions, masses, radii, C.G), 2)
+            print(f"\nN = {n}: single process {single:.3f} s")
+            print(f"{'workers':>8} {'time (s)':>9} {'vs single':>10} {'vs 1 worker':>12}")
+
+            one = None
+            for w in ladder:
+                backend = backends[w]
+                backend.accelerations(positions, masses, radii, C.G)    # warm-up: pool + mappings
+                t = best_time(lambda: backend.accelerations(positions, masses, radii, C.G), 2)
+                one = one or t
+                print(f"{w:>8} {t:>9.3f} {single / t:>9.2f}x {one / t:>11.2f}x")
+    finally:
+        for backend in backends.values():
+            backend.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+# ============================================================
+# Benchmark: Splat Level of Detail vs. Circle Sprites
+# ============================================================
+# Checks that the bilinear splat conserves every body's weight,
+# then times drawing dust clouds of growing size with sprites
+# only (draw_bodies) and with splats (draw_bodies_lod).
+#
+# Run from the python/ directory:
+#   python -m benchmarks.bench_splat
+# ============================================================
+
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame
+
+import utils.constants as C
+from physics.world import World
+from renderer.splat import accumulate, draw_bodies_lod, splat_bodies
+from renderer.sprites import SpriteCache, draw_bodies
+from renderer.text_cache import TextCache
+from simulation.dust_cloud import spawn_dust_cloud
+
+
+# Dust body counts timed
+LADDER = (5_000, 20_000, 100_000, 500_000)
+
+# Sprites are only timed up to this many bodies
+SPRITE_LIMIT = 100_000
+
+REPEATS = 5
+
+
+def dust_world(count):
+    world = World()
+    spawn_dust_cloud(world.bodies, [C.WIDTH / 2, C.HEIGHT / 2], count=count, spread=300.0, seed=0)
+    return world
+
+
+def best_of(fn):
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+# ------------------------------------------------------------
+# Splats neither lose nor invent weight (bodies fully inside)
+# ------------------------------------------------------------
+def check_conservation():
+    rng = np.random.default_rng(1)
+    positions = rng.uniform(1.0, 99.0, size=(10_000, 2))
+    weights = rng.uniform(0.5, 2.0, size=10_000)
+    image = accumulate(positions, weights, 100, 100)
+    error = abs(image.sum() - weights.sum()) / weights.sum()
+
+    # A body exactly on a pixel center lands in that pixel only
+    single = accumulate(np.array([[10.5, 20.5]]), np.ones(1), 100, 100)
+    exact = single[10, 20] == 1.0 and single.sum() == 1.0
+
+    print(f"conservation: relative weight error {error:.1e}, pixel-center splat exact: {exact}")
+    return error < 1e-9 and exact
+
+
+def main():
+    if not check_conservation():
+        print("MISMATCH")
+        sys.exit(1)
+
+    pygame.init()
+    screen = pygame.Surface((C.WIDTH, C.HEIGHT))
+    sprites = SpriteCache()
+    text_cache = TextCache()
+
+    print(f"\n{'bodies':>8} {'sprites ms':>11} {'lod ms':>9} {'density ms':>11} {'speedup':>8}")
+    for count in LADDER:
+        store = dust_world(count).bodies
+        positions = store.positions[:count]
+
+        def lod():
+            screen.fill(C.BACKGROUND_COLOR)
+            draw_bodies_lod(screen, store, sprites, text_cache)
+
+        def density():
+            screen.fill(C.BACKGROUND_COLOR)
+            splat_bodies(screen, positions, store.color_index[:count], None, mode="density")
+
+        splat = best_of(lod)
+        dense = best_of(density)
+        if count <= SPRITE_LIMIT:
+            def sprite_only():
+                screen.fill(C.BACKGROUND_COLOR)
+                draw_bodies(screen, store, sprites, text_cache)
+
+            sprite = best_of(sprite_only)
+            print(f"{count:>8} {sprite * 1e3:>11.2f} {splat * 1e3:>9.2f} {dense * 1e3:>11.2f} "
+                  f"{sprite / splat:>7.1f}x")
+        else:
+            print(f"{count:>8} {'-':>11} {splat * 1e3:>9.2f} {dense * 1e3:>11.2f} {'-':>8}")
+
+
+if __name__ == "__main__":
+    main()
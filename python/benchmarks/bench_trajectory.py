@@ -0,0 +1,130 @@
+# ============================================================
+# Benchmark: Trajectory Recording and Seeking
+# ============================================================
+# Records a run (with a spawn mid-run) in every encoding and
+# checks the decoded positions against the true ones, that a
+# seek lands on exactly the state sequential playback gives
+# and reads at most about one keyframe interval. Then times
+# one record call against one step to report the overhead.
+#
+# Run from the python/ directory:
+#   python -m benchmarks.bench_trajectory
+# ============================================================
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+import utils.constants as C
+from physics.trajectory import ENCODINGS, TrajectoryReader, TrajectoryWriter
+from physics.world import World
+from simulation.scenes import spawn_mixed_materials, spawn_uniform
+
+
+# Largest decode error allowed per encoding (world units); float16
+# errs by half a float16 step of one step's motion, which collisions
+# and wall bounces make a few units now and then
+TOLERANCE = {"float64": 0.0, "float32": 1e-3, "float16": 5e-2,
+             "quantized": 0.5 * C.TRAJECTORY_QUANTUM + 1e-9}
+
+CHECK_STEPS = 600
+CHECK_INTERVAL = 100
+SPAWN_AT = 250
+
+# (bodies, gravity solver) for the overhead timings
+LADDER = ((2_000, "pairwise"), (20_000, "barnes_hut"), (100_000, "particle_mesh"))
+TIMED_STEPS = 3
+TIMED_RECORDS = 50
+
+
+# ------------------------------------------------------------
+# Decoded == true positions (within tolerance); seek == play
+# ------------------------------------------------------------
+def check_encoding(folder, encoding):
+    world = World()
+    spawn_mixed_materials(world.bodies, 400, seed=0)
+    path = os.path.join(folder, f"{encoding}.traj")
+    world.recorder = TrajectoryWriter(path, world, 1 / C.PHYSICS_HZ, encoding, CHECK_INTERVAL)
+
+    truth = [world.bodies.positions[:len(world)].copy()]
+    for step in range(1, CHECK_STEPS):
+        if step == SPAWN_AT:
+            world.add_body([400.0, 400.0], [0.0, 0.0], 50.0, 10.0, C.WHITE)
+        world.step(1 / C.PHYSICS_HZ)
+        truth.append(world.bodies.positions[:len(world)].copy())
+    world.recorder.close()
+
+    # Sequential playback
+    reader = TrajectoryReader(path)
+    played, error = [], 0.0
+    state = reader.seek(0)
+    while state is not None:
+        played.append(state.positions.copy())
+        error = max(error, np.abs(state.positions - truth[state.frame]).max())
+        state = reader.next()
+
+    # Seeks: same state, bounded reads
+    n = len(world)
+    keyframe_bytes = n * 42 + 1024
+    bound = 2 * keyframe_bytes + CHECK_INTERVAL * (n * ENCODINGS[encoding] + 13)
+    rng = np.random.default_rng(0)
+    exact, most = True, 0
+    for frame in rng.integers(0, reader.frames, 40):
+        before = reader.bytes_read
+        exact = exact and np.array_equal(reader.seek(frame).positions, played[frame])
+        most = max(most, reader.bytes_read - before)
+    reader.close()
+
+    size = os.path.getsize(path)
+    ok = (len(played) == CHECK_STEPS and reader.frames == CHECK_STEPS and error <= TOLERANCE[encoding]
+          and exact and most <= bound)
+    print(f"{encoding:>9}: {len(played)} frames, max error {error:.2e}, seeks exact: {exact}, "
+          f"most read per seek {most / 1e3:.0f} kB of {size / 1e3:.0f} kB")
+    return ok
+
+
+def per_call(fn, calls):
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls
+
+
+def main():
+    with tempfile.TemporaryDirectory() as folder:
+        ok = all([check_encoding(folder, encoding) for encoding in ENCODINGS])
+        if not ok:
+            print("MISMATCH")
+            sys.exit(1)
+
+        # Recording cost per step (one record call) vs. the step itself
+        print(f"\n{'bodies':>8} {'solver':>14} {'encoding':>9} {'step ms':>8} "
+              f"{'record ms':>10} {'overhead':>9} {'kB/step':>8} {'seek ms':>8}")
+        path = os.path.join(folder, "timed.traj")
+        for count, solver in LADDER:
+            world = World(16_000, 16_000, gravity_solver=solver)
+            spawn_uniform(world.bodies, count, 16_000, 16_000, seed=0)
+            world.step(1 / C.PHYSICS_HZ)
+            step = per_call(lambda: world.step(1 / C.PHYSICS_HZ), TIMED_STEPS)
+            for encoding in ("float32", "float16", "quantized"):
+                writer = TrajectoryWriter(path, world, 1 / C.PHYSICS_HZ, encoding)
+                start_bytes = writer.bytes_written
+                record = per_call(lambda: writer.record(world), TIMED_RECORDS)
+                size = (writer.bytes_written - start_bytes) / TIMED_RECORDS
+                writer.close()
+
+                reader = TrajectoryReader(path)
+                start = time.perf_counter()
+                reader.seek(reader.frames - 1)
+                seek = time.perf_counter() - start
+                reader.close()
+                print(f"{count:>8} {solver:>14} {encoding:>9} {step * 1e3:>8.2f} "
+                      f"{record * 1e3:>10.3f} {record / step * 100:>8.2f}% "
+                      f"{size / 1e3:>8.1f} {seek * 1e3:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
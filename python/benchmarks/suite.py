@@ -0,0 +1,483 @@
+# ============================================================
+# Benchmark Suite (Per-Stage Timings + Regression Check)
+# ============================================================
+# Times every stage of a simulation step (gravity, collisions,
+# boundaries, drawing) and the full World step over a ladder of
+# body counts and scene types, over several runs, writes the
+# timings as JSON and compares them against the committed
+# baseline with a per-stage noise threshold.
+#
+# Run from the python/ directory:
+#   python -m benchmarks.suite                    # compare, exit 1 on regression
+#   python -m benchmarks.suite --update-baseline  # record a new baseline
+# ============================================================
+
+import argparse
+import copy
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+import numpy as np
+
+import utils.constants as C
+from physics.body_store import COLUMNS, BodyStore
+from physics.broad_phase import SpatialHash
+from physics.collision import resolve_collisions_batched
+from physics.gravity import gravity_accelerations
+from physics.world import World
+from simulation.preset1 import spawn_system
+from simulation.scenes import spawn_clustered, spawn_uniform
+
+# Drawing is timed without a window; skipped if pygame is missing
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+try:
+    import pygame
+    from renderer.draw import draw_body
+    from renderer.sprites import SpriteCache, draw_bodies
+    from renderer.text_cache import TextCache
+except ImportError:
+    pygame = None
+
+
+# Body counts per scene (the preset always has 5 bodies)
+LADDER = (100, 400, 1600)
+QUICK_LADDER = (100, 400)
+
+# Timing: ROUNDS passes over the stages of a scene / count
+# group; per pass each stage repeats until MIN_TIME seconds and
+# MIN_REPEATS runs
+ROUNDS = 5
+MIN_TIME = 0.02
+MIN_REPEATS = 2
+MAX_REPEATS = 40
+
+# Whole-suite runs per baseline / per comparison; each stage's
+# timing is the median over runs of its fastest repeat, its
+# spread the MAD over runs (scaled to a standard deviation)
+BASELINE_RUNS = 7
+COMPARE_RUNS = 5
+MAD_TO_SIGMA = 1.4826
+
+# Regression when the (machine-normalized) timing grows by more
+# than REL_TOLERANCE, NOISE_FACTOR x the stage's combined spread
+# (baseline and current, in quadrature) and ABS_FLOOR seconds
+REL_TOLERANCE = 0.25
+NOISE_FACTOR = 3.0
+ABS_FLOOR = 20e-6
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+DT = 1.0 / C.PHYSICS_HZ
+
+
+# ------------------------------------------------------------
+# Scenes: name → builder(count) → World
+# ------------------------------------------------------------
+def _uniform(count):
+    world = World()
+    spawn_uniform(world.bodies, count, C.WIDTH, C.HEIGHT, seed=0)
+    return world
+
+
+def _clustered(count):
+    world = World()
+    spawn_clustered(world.bodies, count, C.WIDTH, C.HEIGHT, seed=0)
+    return world
+
+
+def _preset(count):
+    random.seed(0)
+    world = World()
+    spawn_system(world.bodies, [C.WIDTH / 2, C.HEIGHT / 2])
+    return world
+
+
+SCENES = {"uniform": _uniform, "clustered": _clustered, "preset": _preset}
+
+
+# ------------------------------------------------------------
+# One pass of repeats of fn → their times. With setup, every
+# repeat times fn(setup()) and setup runs outside the timed
+# region (fresh input for mutating stages).
+# ------------------------------------------------------------
+def repeat(fn, setup=None):
+    def once():
+        if setup is None:
+            start = time.perf_counter()
+            fn()
+        else:
+            state = setup()
+            start = time.perf_counter()
+            fn(state)
+        return time.perf_counter() - start
+
+    once()  # warm-up (caches, scratch buffers)
+    times = []
+    total = 0.0
+    while (total < MIN_TIME or len(times) < MIN_REPEATS) and len(times) < MAX_REPEATS:
+        t = once()
+        times.append(t)
+        total += t
+    return times
+
+
+# ------------------------------------------------------------
+# Fastest run, median and median absolute deviation of times
+# ------------------------------------------------------------
+def summarize(times):
+    times = np.array(times)
+    median = float(np.median(times))
+    return {
+        "min": float(times.min()),
+        "median": median,
+        "mad": float(np.median(np.abs(times - median))),
+        "repeats": len(times),
+    }
+
+
+# ------------------------------------------------------------
+# Fixed workload: how fast is this machine? Mostly small-array
+# NumPy calls and Python loops, like the stages themselves
+# ------------------------------------------------------------
+def calibration():
+    rng = np.random.default_rng(0)
+    small = rng.random((64, 2))
+    large = rng.random((400, 400))
+
+    def work():
+        total = 0.0
+        for _ in range(200):
+            total += float(np.sqrt((small * small).sum(axis=1)).max())
+        for value in range(2000):
+            total += value * 0.5
+        return total + float(np.sqrt(large).sum())
+
+    return summarize(repeat(work))
+
+
+def _copy_store(store):
+    n = len(store)
+    columns = {name: getattr(store, name)[:n].copy() for name in COLUMNS}
+    return BodyStore.from_columns(columns, store.palette, store.next_serial)
+
+
+# ------------------------------------------------------------
+# Stage functions on one World: name → (setup, fn). Stages that
+# move bodies get a setup returning a fresh copy, so every repeat
+# does the same work (the first collision pass would otherwise
+# resolve the overlaps for all later ones)
+# ------------------------------------------------------------
+def stages(world, surface=None, text_cache=None):
+    store = world.bodies
+    n = len(store)
+    grid = SpatialHash()
+
+    # Steps start warm (integrator cache, broad phase) from one
+    # step in, and each repeat steps its own copy of that state
+    stepped = copy.deepcopy(world)
+    stepped.step(DT)
+
+    timed = {
+        "gravity": (None, lambda: gravity_accelerations(
+            store.positions[:n], store.masses[:n], store.radii[:n], world.G
+        )),
+        "collisions": (lambda: _copy_store(store), lambda bodies: resolve_collisions_batched(
+            bodies, *grid.candidate_pairs_for(bodies), world.restitution
+        )),
+        "boundaries": (lambda: _copy_store(store),
+                       lambda bodies: bodies.handle_boundary_collisions(world.width, world.height)),
+        "step": (lambda: copy.deepcopy(stepped), lambda w: w.step(DT)),
+    }
+    if surface is not None:
+        def draw():
+            for body in store:
+                draw_body(surface, body, text_cache)
+        timed["draw"] = (None, draw)
+
+        sprites = SpriteCache()
+        timed["draw_batched"] = (None, lambda: draw_bodies(surface, store, sprites, text_cache))
+    return timed
+
+
+def run_suite(ladder, verbose=True):
+    surface = text_cache = None
+    if pygame is not None:
+        pygame.init()
+        surface = pygame.Surface((C.WIDTH, C.HEIGHT))
+        text_cache = TextCache()
+
+    results = {}
+    samples = []
+    groups = []
+    for scene, build in SCENES.items():
+        counts = (5,) if scene == "preset" else ladder
+        for count in counts:
+            # Fresh World per stage: earlier stages move bodies
+            timed = {
+                stage: stages(build(count), surface, text_cache)[stage]
+                for stage in stages(build(count), surface, text_cache)
+            }
+
+            # The machine has slow spells; rounds spread every stage's
+            # repeats (and the calibration) over the group's time
+            times = {stage: [] for stage in timed}
+            local = []
+            for _ in range(ROUNDS):
+                local.append(calibration())
+                for stage, (setup, fn) in timed.items():
+                    times[stage] += repeat(fn, setup)
+            samples += local
+
+            keys = []
+            for stage in timed:
+                key = f"{scene}/{count}/{stage}"
+                results[key] = summarize(times[stage])
+                keys.append(key)
+                if verbose:
+                    print(f"{key:<28} {results[key]['min'] * 1e3:>10.3f} ms")
+            groups.append((keys, min(sample["min"] for sample in local)))
+
+    results["calibration"] = min(samples, key=lambda sample: sample["min"])
+
+    # A spell longer than a whole group slows its calibration as
+    # much as its stages: rescale each group to the run's fastest
+    # calibration
+    for keys, local in groups:
+        factor = results["calibration"]["min"] / local
+        for key in keys:
+            for field in ("min", "median", "mad"):
+                results[key][field] *= factor
+            results[key]["slowdown"] = 1.0 / factor
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+# ------------------------------------------------------------
+# Several suite runs → per key: median of the runs' fastest
+# times and their spread across runs. Each run is first scaled
+# to the median calibration: the machine's speed drifts from
+# run to run as well
+# ------------------------------------------------------------
+def combine(runs):
+    calibrations = np.array([run["results"]["calibration"]["min"] for run in runs])
+    factors = np.median(calibrations) / calibrations
+
+    results = {}
+    for key in runs[0]["results"]:
+        mins = np.array([run["results"][key]["min"] for run in runs])
+        if key != "calibration":
+            mins *= factors
+        median = float(np.median(mins))
+        results[key] = {
+            "min": median,
+            "spread": float(MAD_TO_SIGMA * np.median(np.abs(mins - median))),
+            "runs": mins.tolist(),
+        }
+    return {"meta": dict(runs[0]["meta"], runs=len(runs)), "results": results}
+
+
+def run_many(ladder, runs):
+    samples = []
+    for k in range(runs):
+        print(f"run {k + 1}/{runs}")
+        samples.append(run_suite(ladder, verbose=k == 0))
+    return combine(samples)
+
+
+# ------------------------------------------------------------
+# Compare against a baseline; returns the regressed keys
+# ------------------------------------------------------------
+def compare(current, baseline):
+    new = current["results"]
+    old = baseline["results"]
+
+    # Normalize for machine speed with the calibration workload
+    speed = new["calibration"]["min"] / old["calibration"]["min"]
+    scale = speed
+    print(f"\nmachine speed factor vs baseline: {speed:.2f} (timings divided by {scale:.2f})")
+    print(f"{'benchmark':<28} {'baseline ms':>12} {'now ms':>10} {'change':>8}")
+
+    regressions = []
+    for key, entry in new.items():
+        if key == "calibration":
+            continue
+        if key not in old:
+            print(f"{key:<28} {'-':>12} {entry['min'] * 1e3:>10.3f}      new")
+            continue
+
+        base = old[key]["min"]
+        now = entry["min"] / scale
+        spread = float(np.hypot(old[key].get("spread", 0.0), entry.get("spread", 0.0) / scale))
+        allowed = max(REL_TOLERANCE * base, NOISE_FACTOR * spread, ABS_FLOOR)
+        flag = "REGRESSED" if now - base > allowed else ""
+        if flag:
+            regressions.append(key)
+        print(f"{key:<28} {base * 1e3:>12.3f} {now * 1e3:>10.3f} {now / base - 1:>+7.0%} {flag}")
+
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Per-stage benchmark suite")
+    parser.add_argument("--quick", action="store_true", help="smaller body-count ladder")
+    parser.add_argument("--out", default="benchmark_results.json", help="results file (JSON)")
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--runs", type=int, default=None,
+                        help=f"suite runs (default {COMPARE_RUNS}, {BASELINE_RUNS} for a baseline)")
+    args = parser.parse_args(argv)
+
+    runs = args.runs or (BASELINE_RUNS if args.update_baseline else COMPARE_RUNS)
+    current = run_many(QUICK_LADDER if args.quick else LADDER, runs)
+    with open(args.out, "w") as f:
+        json.dump(current, f, indent=1)
+
+    if args.update_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(current, f, indent=1)
+        print(f"\nbaseline written: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"\nno baseline at {args.baseline}; run with --update-baseline")
+        return 2
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+
+    regressions = compare(current, baseline)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1
+    print("\nno regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+
+
+
+# ======================================================================
+#                           TEACHING SECTION
+# ======================================================================
+#
+# File: suite.py
+#
+# Role of this file:
+# ------------------
+# One command that answers "did this change make anything slower?".
+#
+# ----------------------------------------------------------------------
+#
+# =========================
+# WHAT IS TIMED
+# =========================
+#
+# Scenes : uniform (spawn_uniform), clustered (spawn_clustered) at each
+#          count of the ladder, and the 5-body spawn_system preset
+# Stages : gravity     - gravity_accelerations (apply_gravity's job)
+#          collisions  - broad phase + resolve_collisions_batched
+#                        (resolve_body_collision's job)
+#          boundaries  - BodyStore.handle_boundary_collisions
+#                        (Body.handle_boundary_collision's job)
+#          draw        - draw_body for every body onto an off-screen
+#                        Surface (SDL dummy driver, no window)
+#          draw_batched - renderer/sprites.draw_bodies (sprites + blits)
+#          step        - one full World.step
+#
+# Within one suite run, a stage's time is its fastest repeat:
+# interruptions by other processes only ever make a repeat slower. A
+# shared (virtual) CPU also has slow spells of 0.1 s to over a second,
+# in which everything runs up to ~1.7x slower; one block of repeats can
+# fall entirely inside one. So each scene / count group is timed in
+# ROUNDS passes over all its stages (each at least MIN_REPEATS repeats
+# / MIN_TIME seconds, after a warm-up), and the calibration is sampled
+# once per pass: every stage's repeats are spread over the group's
+# time, and its fastest one is very likely from a fast spell.
+#
+# That number still moves between runs (CPU frequency, cache and
+# allocator state, a busy neighbour for a whole stage), and by a
+# different amount for every stage: a 20 µs boundary pass jitters far
+# more, relatively, than a 10 ms gravity pass. So the whole suite runs
+# several times (BASELINE_RUNS for a baseline, COMPARE_RUNS to compare)
+# and each entry stores
+#
+#   min    : median over runs of the fastest repeat
+#   spread : 1.4826 x MAD over runs (≈ standard deviation, robust to
+#            one bad run)
+#   runs   : the per-run values
+#
+# Every stage is timed on a freshly built World (same seed), because
+# collisions and steps move the bodies and change the work. Within a
+# stage the same holds between repeats: the first collision pass
+# resolves the overlaps, so later passes on the same store would time
+# an emptier workload (and the noise threshold would learn from that
+# skewed spread). collisions and boundaries therefore run each repeat
+# on a fresh copy of the store, step on a fresh copy (copy.deepcopy)
+# of the World one warm step in; the copies are made outside the timed
+# region (repeat's setup).
+#
+# ----------------------------------------------------------------------
+#
+# =========================
+# REGRESSION RULE
+# =========================
+#
+# The machine's speed is not constant: the same (virtual) machine
+# measured 1.2 ms and 1.85 ms for the calibration workload in runs a
+# minute apart, and slow spells inside a run can outlast a whole
+# scene / count group. A fixed workload ("calibration", small arrays
+# and Python loops, like the stages themselves) is therefore timed in
+# every round of every group and timings are normalized at three
+# levels:
+#
+#   group : scaled by (run's fastest calibration / group's fastest)
+#   run   : scaled to the median calibration over runs (combine)
+#   file  : divided by (calibration now / calibration in baseline),
+#           which also covers a baseline from another machine
+#
+# Most stages are bound by Python / NumPy call overhead rather than raw
+# arithmetic, which is why the calibration is too. Each entry keeps its
+# group's "slowdown" (≥ 1) for inspection.
+#
+# A benchmark regresses when (now / base = "min" entries)
+#
+#   now − base > max(REL_TOLERANCE * base,
+#                    NOISE_FACTOR * sqrt(spread_base² + spread_now²),
+#                    ABS_FLOOR)
+#
+# (independent noise adds in quadrature), so each stage's threshold
+# follows its own measured run-to-run noise;
+# REL_TOLERANCE only matters for stages that are steady.
+#
+# Exit codes: 0 = no regressions, 1 = regressions, 2 = no baseline.
+#
+# Baseline: benchmarks/baseline.json (commit it after intentional
+# performance changes with --update-baseline).
+#
+# ======================================================================
+#                       IMPROVEMENT SECTION
+# ======================================================================
+#
+# 1. History
+#    - Append every run to a results log and plot trends.
+#
+# 2. Memory
+#    - Track peak allocations per stage with tracemalloc.
+#
+# ======================================================================
@@ -5,12 +5,19 @@
 # ============================================================
 
 import math
+import os
 import random
+from time import perf_counter
+import numpy as np
 import pygame
 
 import utils.constants as C
 from physics.body import Body
+from physics.checkpoint import CheckpointWriter, restore_checkpoint
+from physics.trajectory import TrajectoryWriter
+from renderer.camera import Camera
 from simulation.preset1 import spawn_system
+from simulation.dust_cloud import spawn_dust_cloud
 
 
 # ============================================================
@@ -22,28 +29,161 @@ from simulation.preset1 import spawn_system
 # ============================================================
 gravity_enabled = True
 paused = False
+gravity_solver = C.GRAVITY_SOLVERS[0]
+show_telemetry = False
+profile_requested = False
+
+# Trajectory recording (set on the physics thread) / replay
+recording = False
+replaying = False
+replay_requested = False
 
 # ============================================================
 # Mouse / Interaction State
 # ============================================================
 is_dragging = False
 drag_offset = [0.0, 0.0]
-active_body = None
+
+# Serial (stable key) of the selected body; bodies live on the
+# physics thread, so the UI never holds one directly
+active_serial = None
+
+# ============================================================
+# Camera (World ⇄ Screen Mapping)
+# ============================================================
+camera = Camera()
+is_panning = False
+
+# ============================================================
+# HUD Status Message (Results of Background Work)
+# ============================================================
+# (text, color, perf_counter time until which it is shown);
+# set from any thread, drawn by the simulation loop
+status = None
+
+
+def show_status(text, color):
+    global status
+    status = (text, color, perf_counter() + C.STATUS_SECONDS)
+
+
+# ============================================================
+# Checkpoints (F5 Save / F9 Load)
+# ============================================================
+def _report_checkpoint(path, seconds):
+    show_status(f"SAVED {path} ({seconds * 1e3:.0f} ms)", (120, 255, 120))
+
+
+def _report_checkpoint_failed(path, error):
+    show_status(f"SAVE FAILED {path}: {error}", (255, 80, 80))
+
+
+checkpoint_writer = CheckpointWriter(_report_checkpoint, _report_checkpoint_failed)
 
 # ============================================================
 # Body / Physics Parameters
 # ============================================================
+
+# Largest body id in the world (saved with checkpoints); ids are
+# handed out on the physics thread from BodyStore.next_id()
 body_counter = 0
 THROW_STRENGTH = 50
 BAT_FORCE = 1200
 DAMPING_COEFF = 0.98
 
+# ------------------------------------------------------------
+# Mouse position in world coordinates
+# ------------------------------------------------------------
+def mouse_world_pos():
+    return camera.screen_to_world(*pygame.mouse.get_pos())
+
+
+# ============================================================
+# Body Commands (run by the physics worker between steps)
+# ============================================================
+def _row(world, serial):
+    store = world.bodies
+    rows = np.flatnonzero(store.serials[:len(store)] == serial)
+    return rows[0] if len(rows) else None
+
+
+def _sync_body_counter(world):
+    global body_counter
+    body_counter = world.bodies.next_id() - 1
+
+
+def _add_body(world, body):
+    global active_serial
+
+    # Numbered here, past every id the presets handed out
+    body.id = world.bodies.next_id()
+    world.bodies.append(body)
+    _sync_body_counter(world)
+
+    # Newly spawned body becomes active
+    active_serial = int(world.bodies.serials[body.index])
+
+
+def _spawn(world, spawn, position):
+    spawn(world.bodies, position)
+    _sync_body_counter(world)
+
+
+def _move_body(world, serial, position=None, velocity=None):
+    row = _row(world, serial)
+    if row is None:
+        return
+    if position is not None:
+        world.bodies.positions[row] = position
+    if velocity is not None:
+        world.bodies.velocities[row] = velocity
+
+
+def _push_body(world, serial, dvx, dvy):
+    row = _row(world, serial)
+    if row is not None:
+        world.bodies.velocities[row] += (dvx, dvy)
+
+
+def _save_checkpoint(world, path):
+    # Copies the state between two steps; the file is written
+    # on the checkpoint thread
+    checkpoint_writer.save(world, path, {"body_counter": body_counter})
+
+
+def _toggle_recording(world, path):
+    global recording
+    if world.recorder is not None:
+        world.recorder.close()
+        world.recorder = None
+    else:
+        world.recorder = TrajectoryWriter(path, world, 1.0 / C.PHYSICS_HZ)
+    recording = world.recorder is not None
+
+
+def _load_checkpoint(world, path):
+    global body_counter, active_serial, gravity_enabled, gravity_solver
+    try:
+        meta = restore_checkpoint(world, path)
+    except (OSError, ValueError) as exc:
+        show_status(f"LOAD FAILED {path}: {exc}", (255, 80, 80))
+        return
+    show_status(f"LOADED {path}", (120, 255, 120))
+
+    # UI state follows the loaded world
+    body_counter = max(meta.get("body_counter", 0), world.bodies.next_id() - 1)
+    gravity_enabled = world.gravity_enabled
+    gravity_solver = world.gravity_solver
+    active_serial = None
+
+
 #============================================================
 # Event Handling
 # ============================================================
-def handle_events(bodies, dt):
-    global is_dragging, drag_offset, active_body
-    global body_counter, gravity_enabled, paused
+def handle_events(snapshot, worker, dt):
+    global is_dragging, drag_offset, active_serial, is_panning
+    global gravity_enabled, paused, gravity_solver, show_telemetry
+    global profile_requested, replay_requested
     global THROW_STRENGTH, BAT_FORCE, DAMPING_COEFF
 
     for event in pygame.event.get():
@@ -58,13 +198,12 @@ def handle_events(bodies, dt):
         # Spawn New Body (Key: N)
         # ----------------------------------------------------
         if event.type == pygame.KEYDOWN and event.key == pygame.K_n:
-            mouse_x, mouse_y = pygame.mouse.get_pos()
-            body_counter += 1
+            mouse_x, mouse_y = mouse_world_pos()
 
             # Weighted material selection (many small, few large)
             material_name = random.choices(
                 population=list(C.MATERIALS.keys()),
-                weights=[1000, 500, 100, 50, 1,0.1],
+                weights=C.MATERIAL_WEIGHTS,
                 k=1
             )[0]
 
@@ -81,13 +220,11 @@ def handle_events(bodies, dt):
                 mass=mass,
                 radius=radius,
                 color=material["color"],
-                body_id=body_counter
+                body_id=0,                  # numbered by _add_body
+                material=material_name
             )
 
-            bodies.append(new_body)
-
-            # Newly spawned body becomes active
-            active_body = new_body
+            worker.submit(_add_body, new_body)
             is_dragging = False
 
         # ----------------------------------------------------
@@ -100,25 +237,84 @@ def handle_events(bodies, dt):
             if event.key == pygame.K_SPACE:
                 paused = not paused
 
+            # Cycle gravity solver (Key: B)
+            if event.key == pygame.K_b:
+                i = C.GRAVITY_SOLVERS.index(gravity_solver)
+                gravity_solver = C.GRAVITY_SOLVERS[(i + 1) % len(C.GRAVITY_SOLVERS)]
+
+            # Frame timing overlay (Key: T)
+            if event.key == pygame.K_t:
+                show_telemetry = not show_telemetry
+
+            # Start / stop a profile capture (Key: P)
+            if event.key == pygame.K_p:
+                profile_requested = True
+
+            # Camera: follow the active body (Key: F), home view (Key: H)
+            if event.key == pygame.K_f:
+                camera.following = not camera.following
+            if event.key == pygame.K_h:
+                camera.reset()
+
+            # Save / load the world (Keys: F5 / F9)
+            if event.key == pygame.K_F5:
+                worker.submit(_save_checkpoint, C.CHECKPOINT_PATH)
+            if event.key == pygame.K_F9 and os.path.exists(C.CHECKPOINT_PATH):
+                is_dragging = False
+                worker.submit(_load_checkpoint, C.CHECKPOINT_PATH)
+
+            # Record the run (Key: R) / replay the recording (Key: L)
+            if event.key == pygame.K_r and not replaying:
+                worker.submit(_toggle_recording, C.TRAJECTORY_PATH)
+            if event.key == pygame.K_l:
+                replay_requested = True
+
+            # Replay seeking (PAGE UP / PAGE DOWN / HOME)
+            if replaying:
+                if event.key == pygame.K_PAGEUP:
+                    worker.seek_by(-C.REPLAY_SEEK_SECONDS)
+                if event.key == pygame.K_PAGEDOWN:
+                    worker.seek_by(C.REPLAY_SEEK_SECONDS)
+                if event.key == pygame.K_HOME:
+                    worker.seek(0)
+
+        # ----------------------------------------------------
+        # Camera: Wheel Zooms at the Cursor, Middle Drag Pans
+        # ----------------------------------------------------
+        if event.type == pygame.MOUSEWHEEL:
+            camera.zoom_at(C.CAMERA_ZOOM_STEP ** event.y, *pygame.mouse.get_pos())
+
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 2:
+            is_panning = True
+
+        if event.type == pygame.MOUSEBUTTONUP and event.button == 2:
+            is_panning = False
+
+        if event.type == pygame.MOUSEMOTION and is_panning:
+            camera.pan(*event.rel)
+
         # ----------------------------------------------------
         # Spawn Preset Solar System (Key: Z)
         # ----------------------------------------------------
         if event.type == pygame.KEYDOWN and event.key == pygame.K_z:
-            mouse_x, mouse_y = pygame.mouse.get_pos()
-            spawn_system(bodies, [mouse_x, mouse_y])
+            mouse_x, mouse_y = mouse_world_pos()
+            worker.submit(_spawn, spawn_system, [mouse_x, mouse_y])
 
         # ----------------------------------------------------
-        # Right Click: Teleport Active Body
+        # Spawn Dust Cloud (Key: C)
         # ----------------------------------------------------
-        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 3 and active_body:
-            mouse_x, mouse_y = pygame.mouse.get_pos()
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_c:
+            mouse_x, mouse_y = mouse_world_pos()
+            worker.submit(_spawn, spawn_dust_cloud, [mouse_x, mouse_y])
 
-            active_body.position[0] = mouse_x
-            active_body.position[1] = mouse_y
+        # ----------------------------------------------------
+        # Right Click: Teleport Active Body
+        # ----------------------------------------------------
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 3 and active_serial is not None:
+            mouse_x, mouse_y = mouse_world_pos()
 
             # Kill velocity after teleport
-            active_body.velocity[0] = 0.0
-            active_body.velocity[1] = 0.0
+            worker.submit(_move_body, active_serial, (mouse_x, mouse_y), (0.0, 0.0))
 
             is_dragging = False
 
@@ -126,20 +322,20 @@ def handle_events(bodies, dt):
         # Left Click: Grab Body
         # ----------------------------------------------------
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            mouse_x, mouse_y = pygame.mouse.get_pos()
+            mouse_x, mouse_y = mouse_world_pos()
 
-            for body in reversed(bodies):
-                dx = mouse_x - body.position[0]
-                dy = mouse_y - body.position[1]
-                dist_sq = dx * dx + dy * dy
+            # Topmost (last drawn) body under the cursor
+            n = len(snapshot)
+            delta = snapshot.positions[:n] - (mouse_x, mouse_y)
+            hits = np.flatnonzero((delta ** 2).sum(axis=1) <= snapshot.radii[:n] ** 2)
 
-                if dist_sq <= body.radius ** 2:
-                    active_body = body
-                    is_dragging = True
-                    drag_offset[0] = body.position[0] - mouse_x
-                    drag_offset[1] = body.position[1] - mouse_y
-                    body.velocity = [0, 0]
-                    break
+            if len(hits):
+                row = hits[-1]
+                active_serial = int(snapshot.serials[row])
+                is_dragging = True
+                drag_offset[0] = snapshot.positions[row, 0] - mouse_x
+                drag_offset[1] = snapshot.positions[row, 1] - mouse_y
+                worker.submit(_move_body, active_serial, None, (0.0, 0.0))
 
         # ----------------------------------------------------
         # Release Body
@@ -150,30 +346,35 @@ def handle_events(bodies, dt):
         # ----------------------------------------------------
         # Dragging Motion
         # ----------------------------------------------------
-        if event.type == pygame.MOUSEMOTION and is_dragging and active_body:
-            mouse_x, mouse_y = pygame.mouse.get_pos()
-
-            active_body.position[0] = mouse_x + drag_offset[0]
-            active_body.position[1] = mouse_y + drag_offset[1]
+        if event.type == pygame.MOUSEMOTION and is_dragging and active_serial is not None:
+            mouse_x, mouse_y = mouse_world_pos()
 
+            # Mouse motion in world units
             dx, dy = event.rel
-            active_body.velocity[0] = dx * THROW_STRENGTH
-            active_body.velocity[1] = dy * THROW_STRENGTH
+            worker.submit(
+                _move_body, active_serial,
+                (mouse_x + drag_offset[0], mouse_y + drag_offset[1]),
+                (dx / camera.zoom * THROW_STRENGTH, dy / camera.zoom * THROW_STRENGTH)
+            )
 
         # ----------------------------------------------------
         # Keyboard Force Control (When Not Dragging)
         # ----------------------------------------------------
-        if not is_dragging and active_body:
+        if not is_dragging and active_serial is not None:
             keys = pygame.key.get_pressed()
+            dvx = dvy = 0.0
 
             if keys[pygame.K_w] or keys[pygame.K_UP]:
-                active_body.velocity[1] -= BAT_FORCE * dt
+                dvy -= BAT_FORCE * dt
             if keys[pygame.K_s] or keys[pygame.K_DOWN]:
-                active_body.velocity[1] += BAT_FORCE * dt
+                dvy += BAT_FORCE * dt
             if keys[pygame.K_a] or keys[pygame.K_LEFT]:
-                active_body.velocity[0] -= BAT_FORCE * dt
+                dvx -= BAT_FORCE * dt
             if keys[pygame.K_d] or keys[pygame.K_RIGHT]:
-                active_body.velocity[0] += BAT_FORCE * dt
+                dvx += BAT_FORCE * dt
+
+            if dvx or dvy:
+                worker.submit(_push_body, active_serial, dvx, dvy)
 
     return True
 
@@ -0,0 +1,391 @@
+# ============================================================
+# Physics Worker (Background Stepping + State Snapshots)
+# ============================================================
+# Runs the World on its own thread at the fixed physics rate.
+# After each batch of steps it copies what the renderer needs
+# into a snapshot and publishes it through a triple buffer;
+# the pygame loop draws the latest snapshot and sends every
+# change to the bodies through a command queue, applied
+# between two steps. A slow step no longer stalls input or
+# drawing.
+# ============================================================
+
+import queue
+import threading
+from time import perf_counter
+
+import numpy as np
+
+import utils.constants as C
+from physics.body_store import MIN_CAPACITY
+from physics.broad_phase import SpatialHash
+from utils.time import FixedTimestep
+
+
+# ------------------------------------------------------------
+# Read-only copy of the columns the renderer and input read
+# ------------------------------------------------------------
+# Same attribute names as a BodyStore, so the renderer draws a
+# snapshot in place of a store.
+class Snapshot:
+    def __init__(self):
+        self.count = 0
+        self.capacity = 0
+        self.palette = []
+
+        # World state when published
+        self.steps = 0
+        self.phase_times = {}
+
+        # Broad-phase pair tests / contacts, summed over all steps
+        self.pair_tests = 0
+        self.contacts = 0
+
+        # perf_counter time at which the state was one step old
+        # (render alpha = (now - time) / dt)
+        self.time = 0.0
+
+        # View queries (camera culling) without the live index
+        self.index = SpatialHash()
+
+        self._allocate(MIN_CAPACITY)
+
+    def _allocate(self, capacity):
+        self.positions = np.zeros((capacity, 2), dtype=np.float64)
+        self.previous = np.zeros((capacity, 2), dtype=np.float64)   # before the last step
+        self.radii = np.zeros(capacity, dtype=np.float64)
+        self.color_index = np.zeros(capacity, dtype=np.uint16)
+        self.ids = np.zeros(capacity, dtype=np.int64)
+        self.serials = np.zeros(capacity, dtype=np.int64)
+        self.capacity = capacity
+
+    def _reserve(self, n):
+        if n > self.capacity:
+            self._allocate(max(n, self.capacity * 2))
+
+    # --------------------------------------------------------
+    # Writer side (physics thread)
+    # --------------------------------------------------------
+    def capture_previous(self, store):
+        n = len(store)
+        self._reserve(n)
+        self.previous[:n] = store.positions[:n]
+
+    def copy_bodies(self, store):
+        # Rows of a BodyStore (or a recorded frame); the view index
+        # is re-bucketed on the next query
+        n = len(store)
+        self._reserve(n)
+        self.positions[:n] = store.positions[:n]
+        self.radii[:n] = store.radii[:n]
+        self.color_index[:n] = store.color_index[:n]
+        self.ids[:n] = store.ids[:n]
+        self.serials[:n] = store.serials[:n]
+        if len(self.palette) != len(store.palette):
+            self.palette = list(store.palette)
+        self.count = n
+        self.index.serials = np.zeros(0, dtype=np.int64)
+
+    def fill(self, world, moved, pair_tests, contacts, time):
+        self.copy_bodies(world.bodies)
+        if not moved:
+            self.previous[:self.count] = self.positions[:self.count]
+
+        self.steps = world.steps
+        self.phase_times = dict(world.phase_times)
+        self.pair_tests = pair_tests
+        self.contacts = contacts
+        self.time = time
+
+        # Copy the grid the collision pass just built; otherwise the
+        # first query re-buckets
+        if world.indexed and isinstance(world.broad_phase, SpatialHash):
+            self.index.copy_from(world.broad_phase)
+
+    # --------------------------------------------------------
+    # Reader side (render thread)
+    # --------------------------------------------------------
+    def __len__(self):
+        return self.count
+
+    def palette_array(self):
+        if not self.palette:
+            return np.zeros((0, 3), dtype=np.uint8)
+        return np.array(self.palette, dtype=np.uint8)
+
+    def row_of(self, serial):
+        rows = np.flatnonzero(self.serials[:self.count] == serial)
+        return int(rows[0]) if len(rows) else None
+
+    def query_region(self, x0, y0, x1, y1):
+        return self.index.query_region(self, x0, y0, x1, y1)
+
+    def interpolated(self, alpha, rows=None):
+        # previous + (current - previous) * alpha
+        n = self.count
+        current = self.positions[:n]
+        previous = self.previous[:n]
+        if rows is not None:
+            current = current[rows]
+            previous = previous[rows]
+        return previous + (current - previous) * alpha
+
+
+# ------------------------------------------------------------
+# Triple buffer: the writer never waits for the reader
+# ------------------------------------------------------------
+class TripleBuffer:
+    def __init__(self, factory):
+        self.slots = [factory(), factory(), factory()]
+        self.back, self.ready, self.front = 0, 1, 2
+        self.fresh = False
+
+        # Held only to swap two indices
+        self._lock = threading.Lock()
+
+    @property
+    def writing(self):
+        return self.slots[self.back]
+
+    def publish(self):
+        with self._lock:
+            self.back, self.ready = self.ready, self.back
+            self.fresh = True
+
+    def latest(self):
+        with self._lock:
+            if self.fresh:
+                self.front, self.ready = self.ready, self.front
+                self.fresh = False
+        return self.slots[self.front]
+
+
+# ------------------------------------------------------------
+# Steps a World on a thread (or inline) and publishes snapshots
+# ------------------------------------------------------------
+class PhysicsWorker:
+    def __init__(self, world, hz=C.PHYSICS_HZ, max_substeps=C.MAX_SUBSTEPS,
+                 threaded=C.PHYSICS_THREADED):
+        self.world = world
+        self.timestep = FixedTimestep(hz, max_substeps)
+        self.dt = self.timestep.dt
+        self.threaded = threaded
+
+        # Written by the render thread, read between steps
+        self.paused = False
+
+        # (fn, args) → fn(world, *args) on the physics thread
+        self.commands = queue.SimpleQueue()
+
+        self.buffers = TripleBuffer(Snapshot)
+        self.pair_tests = 0
+        self.contacts = 0
+
+        # Exception that stopped the thread (re-raised by latest)
+        self.error = None
+
+        self._thread = None
+        self._running = False
+        self._wake = threading.Event()
+
+        self._publish(moved=False)
+
+    # --------------------------------------------------------
+    # Render-thread API
+    # --------------------------------------------------------
+    def start(self):
+        if self.threaded and self._thread is None:
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name="physics", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        if self._thread is not None:
+            self._running = False
+            self._wake.set()
+            self._thread.join()
+            self._thread = None
+
+    @property
+    def alive(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def submit(self, fn, *args):
+        self.commands.put((fn, args))
+        self._wake.set()
+
+    def pump(self, frame_dt):
+        # Inline mode: step on the caller's thread, once per frame
+        if not self.threaded:
+            self._advance(frame_dt)
+
+    def latest(self):
+        if self.error is not None:
+            raise RuntimeError("physics worker stopped") from self.error
+        return self.buffers.latest()
+
+    def alpha(self, snapshot):
+        return min(max((perf_counter() - snapshot.time) / self.dt, 0.0), 1.0)
+
+    # --------------------------------------------------------
+    # Physics thread
+    # --------------------------------------------------------
+    def _run(self):
+        try:
+            last = perf_counter()
+            while self._running:
+                now = perf_counter()
+                self._advance(now - last)
+                last = now
+
+                # Sleep until the next step is due or a command arrives
+                self._wake.wait(max(self.dt - self.timestep.accumulator, 0.0))
+                self._wake.clear()
+        except BaseException as exc:
+            self.error = exc
+
+    def _apply_commands(self):
+        applied = 0
+        while True:
+            try:
+                fn, args = self.commands.get_nowait()
+            except queue.Empty:
+                return applied
+            fn(self.world, *args)
+            applied += 1
+
+    def _advance(self, elapsed):
+        applied = self._apply_commands()
+
+        if self.paused:
+            self.timestep.reset()
+            steps = 0
+        else:
+            steps = self.timestep.advance(elapsed)
+
+        # Fixed steps; the snapshot keeps the state before the last one
+        world = self.world
+        for k in range(steps):
+            if k == steps - 1:
+                self.buffers.writing.capture_previous(world.bodies)
+            world.step(self.dt)
+            self.pair_tests += world.pair_tests
+            self.contacts += world.contacts
+
+        if steps or applied:
+            self._publish(moved=steps > 0)
+
+    def _publish(self, moved):
+        time = perf_counter() - self.timestep.accumulator
+        self.buffers.writing.fill(self.world, moved, self.pair_tests, self.contacts, time)
+        self.buffers.publish()
+
+
+
+
+
+# ======================================================================
+#                           TEACHING SECTION
+# ======================================================================
+#
+# File: physics_worker.py
+#
+# Role of this file:
+# ------------------
+# With physics and drawing in one loop, a frame waits for every physics
+# step it schedules: a heavy step (a big dust cloud, the pairwise
+# solver) freezes input and drawing until it is done. Here the World
+# belongs to a worker thread; the render thread only ever reads copies.
+#
+#   render thread                         physics thread
+#   -------------                         --------------
+#   handle_events ── submit(fn, ...) ──▶  apply queued commands
+#   latest() ◀── triple buffer ────────── step ×k, fill + publish
+#   draw snapshot                         sleep until next step
+#
+# NumPy releases the GIL inside its large array kernels, so the two
+# threads overlap whenever the step is array work; pure-Python stretches
+# still take turns.
+#
+# ----------------------------------------------------------------------
+#
+# =========================
+# CLASS: Snapshot
+# =========================
+#
+# positions, previous, radii, color_index, ids, serials, palette, count
+#   - Named like the BodyStore columns, so draw_bodies / draw_bodies_lod
+#     take a snapshot as their store
+# previous   : positions before the last step → interpolated(alpha, rows)
+# steps, phase_times, pair_tests, contacts
+#   - Totals when published; the loop turns differences between the
+#     snapshots it sees into telemetry
+# index      : copy of the collision pass's grid (SpatialHash.copy_from)
+#              for query_region / camera culling. With the AABB tree, or
+#              collisions off, the first query re-buckets the snapshot.
+# row_of(serial) : current row of a body (rows move on swap-remove,
+#                  serials never do)
+# copy_bodies(store) : rows only, from a store or a recorded frame
+#                      (replay, core/replay.py)
+#
+# Arrays are preallocated and grow by doubling, so publishing is a few
+# memcpys of the live columns, no allocation per step.
+#
+# ----------------------------------------------------------------------
+#
+# =========================
+# CLASS: TripleBuffer
+# =========================
+#
+#   back  : being written by the physics thread
+#   ready : last complete snapshot, not yet taken
+#   front : being drawn by the render thread
+#
+# publish() swaps back ⇄ ready, latest() swaps ready ⇄ front if a new
+# one arrived. The writer never touches front and the reader never
+# touches back, so nothing is copied twice and neither side waits for
+# the other: the lock only guards two index swaps. Snapshots the
+# renderer was too slow to take are overwritten (it always draws the
+# newest state).
+#
+# ----------------------------------------------------------------------
+#
+# =========================
+# CLASS: PhysicsWorker
+# =========================
+#
+# PhysicsWorker(world, hz, max_substeps, threaded=C.PHYSICS_THREADED)
+#
+# start() / stop()     : run / join the physics thread (alive: running)
+# submit(fn, *args)    : queue fn(world, *args); every change to bodies
+#                        or World settings goes through here and runs
+#                        between two steps, so a step never sees a
+#                        half-applied edit (queue.SimpleQueue: put and
+#                        get never block each other for long)
+# paused               : plain flag, checked before each batch of steps
+# latest()             : newest snapshot (re-raises a worker crash)
+# alpha(snapshot)      : interpolation factor from the snapshot's age
+# pump(frame_dt)       : threaded=False → step inline once per frame,
+#                        same API (debugging, profiling, determinism)
+#
+# Stepping uses FixedTimestep as before: the thread wakes when a step
+# is due (or a command arrives), catches up at most max_substeps steps
+# and publishes once per batch.
+#
+# cProfile only sees the thread it runs on: a profile capture (key: P)
+# enables a second profiler on the physics thread through submit() and
+# merges it with the render thread's (core/profiler.py).
+#
+# ======================================================================
+#                       IMPROVEMENT SECTION
+# ======================================================================
+#
+# 1. Process Worker
+#    - Step in another process with the columns in shared memory, so
+#      pure-Python parts of a step stop competing for the GIL.
+#
+# 2. Command Replies
+#    - Return futures from submit for commands whose result the UI
+#      needs (e.g. the row of a spawned body).
+#
+# ======================================================================
@@ -0,0 +1,277 @@
+# ============================================================
+# On-Demand Profile Capture
+# ============================================================
+# Profiles a window of frames (or headless World steps) with
+# cProfile and records one span per simulation phase. Writes a
+# .pstats file (function-level profile) and a Chrome trace
+# (chrome://tracing, ui.perfetto.dev) of the phases.
+# ============================================================
+
+import cProfile
+import json
+import os
+import pstats
+import threading
+import time
+from time import perf_counter
+
+import utils.constants as C
+
+
+class ProfileCapture:
+    def __init__(self, out_dir=C.PROFILE_DIR):
+        self.out_dir = out_dir
+        self.frames = 0
+        self.frames_done = 0
+        self.paths = None
+
+        self._profile = None
+        self._spans = None
+        self._targets = ()
+        self._frame_start = 0.0
+
+        # Physics thread (PhysicsWorker): its own profile and spans,
+        # started / stopped by worker commands
+        self._worker = None
+        self._thread_profile = None
+        self._thread_spans = None
+        self._thread_stopped = threading.Event()
+
+    @property
+    def active(self):
+        return self._profile is not None
+
+    # --------------------------------------------------------
+    # Begin capturing; targets (World, FrameTimer) record their
+    # phase spans into the capture while it runs. A threaded
+    # worker's World is profiled on the physics thread.
+    # --------------------------------------------------------
+    def start(self, frames=C.PROFILE_FRAMES, *targets, worker=None):
+        if self.active:
+            return
+
+        self.frames = frames
+        self.frames_done = 0
+        self.paths = None
+        self._spans = []
+        if worker is not None and not worker.threaded:
+            targets += (worker.world,)
+        self._targets = targets
+        for target in targets:
+            target.trace = self._spans
+
+        self._worker = worker if worker is not None and worker.threaded else None
+        self._thread_profile = None
+        self._thread_spans = None
+        self._thread_stopped.clear()
+        if self._worker is not None:
+            self._worker.submit(self._start_thread)
+
+        self._profile = cProfile.Profile()
+        self._frame_start = perf_counter()
+        self._profile.enable()
+
+    # --------------------------------------------------------
+    # Call once per frame; stops after the requested frames and
+    # returns the written paths then (None otherwise)
+    # --------------------------------------------------------
+    def end_frame(self):
+        if self._profile is None:
+            return None
+
+        now = perf_counter()
+        self._spans.append(("frame", self._frame_start, now))
+        self._frame_start = now
+
+        self.frames_done += 1
+        if self.frames_done >= self.frames:
+            return self.stop()
+        return None
+
+    # --------------------------------------------------------
+    # Stop early (or at the end) and write both files
+    # --------------------------------------------------------
+    def stop(self):
+        if self._profile is None:
+            return self.paths
+
+        self._profile.disable()
+        for target in self._targets:
+            target.trace = None
+        self._stop_thread_capture()
+
+        os.makedirs(self.out_dir, exist_ok=True)
+        now = time.time()
+        stamp = time.strftime("%Y%m%d_%H%M%S", time.localtime(now)) + f"_{int(now * 1000) % 1000:03d}"
+        stem = os.path.join(self.out_dir, "profile_" + stamp)
+        pstats_path = stem + ".pstats"
+        trace_path = stem + ".trace.json"
+
+        # One .pstats for both threads
+        stats = pstats.Stats(self._profile)
+        if self._thread_profile is not None:
+            stats.add(self._thread_profile)
+        stats.dump_stats(pstats_path)
+
+        tracks = {"simulation": self._spans}
+        if self._thread_spans is not None:
+            tracks["physics"] = self._thread_spans
+        with open(trace_path, "w") as f:
+            json.dump(chrome_trace(tracks), f)
+
+        self._profile = None
+        self._spans = None
+        self._targets = ()
+        self._worker = None
+        self._thread_profile = None
+        self._thread_spans = None
+        self.paths = (pstats_path, trace_path)
+        return self.paths
+
+    # --------------------------------------------------------
+    # Worker commands (run on the physics thread)
+    # --------------------------------------------------------
+    def _start_thread(self, world):
+        self._thread_spans = []
+        world.trace = self._thread_spans
+
+        # cProfile only sees the thread that enables it (Python 3.12+
+        # allows one profiler at a time, which then sees every thread)
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            return
+        self._thread_profile = profile
+
+    def _stop_thread(self, world):
+        world.trace = None
+        if self._thread_profile is not None:
+            self._thread_profile.disable()
+        self._thread_stopped.set()
+
+    def _stop_thread_capture(self):
+        # Wait for the physics thread to stop its profile (at most one
+        # batch of steps); a stopped worker keeps no physics results
+        worker = self._worker
+        if worker is None:
+            return
+        worker.submit(self._stop_thread)
+        while not self._thread_stopped.wait(0.05):
+            if not worker.alive:
+                self._thread_profile = None
+                self._thread_spans = None
+                return
+
+
+# ------------------------------------------------------------
+# {thread name: (phase, start, end) spans} → Chrome trace-event
+# JSON, one track (tid) per thread
+# ------------------------------------------------------------
+def chrome_trace(tracks):
+    origin = min((start for spans in tracks.values() for _, start, _ in spans), default=0.0)
+    events = []
+    for tid, (thread, spans) in enumerate(tracks.items(), start=1):
+        events.append({"name": "thread_name", "ph": "M", "pid": 1, "tid": tid, "args": {"name": thread}})
+        for name, start, end in spans:
+            events.append({
+                "name": name,
+                "cat": "frame" if name == "frame" else "phase",
+                "ph": "X",                                   # complete event
+                "ts": (start - origin) * 1e6,                # microseconds
+                "dur": (end - start) * 1e6,
+                "pid": 1,
+                "tid": tid,
+            })
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+# ------------------------------------------------------------
+# Headless: profile `steps` World steps (one "frame" per step)
+# ------------------------------------------------------------
+def profile_world(world, steps, dt, out_dir=C.PROFILE_DIR):
+    capture = ProfileCapture(out_dir)
+    capture.start(steps, world)
+    for _ in range(steps):
+        world.step(dt)
+        capture.end_frame()
+    return capture.paths
+
+
+
+
+
+# ======================================================================
+#                           TEACHING SECTION
+# ======================================================================
+#
+# File: profiler.py
+#
+# Role of this file:
+# ------------------
+# The telemetry HUD says WHICH phase is slow; a profile says WHY (which
+# functions, how many calls). Slowdowns in an interactive session come
+# and go, so capture starts on demand — key P in the simulation, or
+# ProfileCapture / profile_world from scripts — for a fixed number of
+# frames.
+#
+# ----------------------------------------------------------------------
+#
+# =========================
+# OUTPUT (C.PROFILE_DIR)
+# =========================
+#
+# profile_<time>.pstats      : cProfile data (time to the millisecond)
+#   python -m pstats profiles/profile_<time>.pstats   (sort cumtime, stats 20)
+#   or snakeviz / tuna for a graphical view
+#   - render thread and physics thread merged (pstats.Stats.add)
+#
+# profile_<time>.trace.json  : Chrome trace-event format; open in
+#   chrome://tracing or https://ui.perfetto.dev
+#   - "simulation" track: "frame" spans (frame to frame, including the
+#     clock's sleep) and nested events, render, flip (FrameTimer)
+#   - "physics" track: gravity, collisions, boundaries per physics
+#     substep (World), as recorded on the worker thread
+#
+# ----------------------------------------------------------------------
+#
+# =========================
+# THREADS
+# =========================
+#
+# cProfile only sees the thread that calls enable(). With
+# start(frames, timer, worker=worker) the capture submits a command
+# that enables a second profile ON the physics thread (and points
+# world.trace at a second span list); stop() submits the matching
+# command, waits for it and merges both. An inline worker
+# (C.PHYSICS_THREADED = False) steps on the render thread, so the
+# World is simply one more target there.
+#
+# ----------------------------------------------------------------------
+#
+# =========================
+# COST WHEN OFF
+# =========================
+#
+# No profiler is installed until start(). World and FrameTimer only
+# check `trace is not None` at each phase end; spans are collected only
+# while a capture runs. (cProfile itself slows Python-heavy code by
+# roughly 1.5–2x while on, so phase spans inside a capture read long.)
+#
+# ----------------------------------------------------------------------
+#
+# Headless use:
+#   from core.profiler import profile_world
+#   pstats_path, trace_path = profile_world(world, steps=200, dt=1 / 120)
+#
+# ======================================================================
+#                       IMPROVEMENT SECTION
+# ======================================================================
+#
+# 1. Sampling Profiler
+#    - Low-overhead stack sampling (e.g. py-spy) for long captures.
+#
+# 2. Counters in the Trace
+#    - Emit body / contact counts as trace "C" events next to the spans.
+#
+# ======================================================================
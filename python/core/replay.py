@@ -0,0 +1,138 @@
+# ============================================================
+# Replay (Recorded Trajectory → Renderer, No Physics)
+# ============================================================
+# Plays a trajectory recording back through the same API the
+# simulation loop uses for the physics worker: latest() gives
+# a Snapshot to draw, pump() advances it in real time. Nothing
+# is simulated; seeking jumps through the keyframe index.
+# ============================================================
+
+from time import perf_counter
+
+import numpy as np
+
+import utils.constants as C
+from core.physics_worker import Snapshot
+from physics.trajectory import TrajectoryReader
+from utils.time import FixedTimestep
+
+
+class ReplayPlayer:
+    def __init__(self, path, max_substeps=C.MAX_SUBSTEPS):
+        self.reader = TrajectoryReader(path)
+        self.timestep = FixedTimestep(1.0 / self.reader.dt, max_substeps)
+        self.dt = self.reader.dt
+        self.frames = self.reader.frames
+        self.paused = False
+
+        self.snapshot = Snapshot()
+        self.seek(0)
+
+    @property
+    def frame(self):
+        return self.reader.frame
+
+    # --------------------------------------------------------
+    # Same calls as PhysicsWorker
+    # --------------------------------------------------------
+    def start(self):
+        pass
+
+    def stop(self):
+        self.reader.close()
+
+    def submit(self, fn, *args):
+        # A recording is read-only: body edits are ignored
+        pass
+
+    def latest(self):
+        return self.snapshot
+
+    def alpha(self, snapshot):
+        return min(max((perf_counter() - snapshot.time) / self.dt, 0.0), 1.0)
+
+    # --------------------------------------------------------
+    # Advance by real time, one recorded step per physics step
+    # --------------------------------------------------------
+    def pump(self, frame_dt):
+        if self.paused or self.frame >= self.frames - 1:
+            self.timestep.reset()
+            return
+
+        steps = min(self.timestep.advance(frame_dt), self.frames - 1 - self.frame)
+        for k in range(steps):
+            if k == steps - 1:
+                self.snapshot.capture_previous(self.reader.state)
+            self._show(self.reader.next(), moved=True)
+
+    # --------------------------------------------------------
+    # Jump to a frame (keyframe index, then at most one
+    # interval of deltas)
+    # --------------------------------------------------------
+    def seek(self, frame):
+        self.timestep.reset()
+        self._show(self.reader.seek(frame), moved=False)
+
+    def seek_by(self, seconds):
+        self.seek(self.frame + round(seconds / self.dt))
+
+    def _show(self, state, moved):
+        snapshot = self.snapshot
+
+        # Interpolate only between two states of the same bodies
+        n = len(state)
+        same_rows = n == snapshot.count and np.array_equal(snapshot.serials[:n], state.serials)
+        snapshot.copy_bodies(state)
+        if not (moved and same_rows):
+            snapshot.previous[:n] = snapshot.positions[:n]
+
+        snapshot.steps = self.reader.header["start_step"] + state.frame
+        snapshot.time = perf_counter() - self.timestep.accumulator
+
+
+
+
+
+# ======================================================================
+#                           TEACHING SECTION
+# ======================================================================
+#
+# File: replay.py
+#
+# Role of this file:
+# ------------------
+# Key L swaps the physics worker for a ReplayPlayer over
+# C.TRAJECTORY_PATH (recorded with key R). The loop does not know the
+# difference: it draws latest(), interpolates with alpha(), and its
+# camera, culling, labels and selection all work on the recorded
+# bodies. Body edits (spawn, drag, ...) are dropped by submit().
+#
+# ----------------------------------------------------------------------
+#
+# =========================
+# CLASS: ReplayPlayer
+# =========================
+#
+# pump(frame_dt)   : FixedTimestep at the recorded rate (1 / dt), one
+#                    reader.next() per recorded step, so playback runs
+#                    in real time whatever the FPS; stops at the end
+# paused           : SPACE, as for live physics
+# seek(frame)      : TrajectoryReader.seek → O(1) index lookup + at most
+#                    one keyframe interval of deltas
+# seek_by(seconds) : PAGE UP / PAGE DOWN (C.REPLAY_SEEK_SECONDS),
+#                    HOME seeks to frame 0
+#
+# Only the frames drawn are decoded; the file is never read as a whole.
+#
+# ======================================================================
+#                       IMPROVEMENT SECTION
+# ======================================================================
+#
+# 1. Playback Speed
+#    - Scale frame_dt (slow motion / fast forward), seek when the
+#      decode backlog exceeds one keyframe interval.
+#
+# 2. Timeline Bar
+#    - Draw the position in the recording and seek by clicking it.
+#
+# ======================================================================
@@ -2,78 +2,223 @@
 # Core Simulation Loop
 # ============================================================
 
+import os
+from time import perf_counter
+
 import pygame
 import utils.constants as C
-from renderer.draw import clear_screen,draw_body,draw_active_shadow
-from physics.gravity import apply_gravity
-from physics.collision import resolve_body_collision
-from physics.body import Body
+from renderer.camera import visible_rows
+from renderer.draw import draw_telemetry, draw_world_bounds
+from renderer.dirty_rects import DirtyRectRenderer
+from renderer.splat import draw_bodies_lod
+from renderer.sprites import SpriteCache
+from renderer.text_cache import TextCache
+from physics.world import World
+from core.physics_worker import PhysicsWorker
+from core.replay import ReplayPlayer
+from core.telemetry import create_frame_timer
+from core.profiler import ProfileCapture
 import core.input as input_state
+
+
 # ------------------------------------------------------------
 # Run the physics + rendering loop
 # ------------------------------------------------------------
 
 def run_simulation(screen,clock) :
-    bodies = []
+    world = World(C.WORLD_WIDTH, C.WORLD_HEIGHT, C.G)
+    worker = PhysicsWorker(world, C.PHYSICS_HZ, C.MAX_SUBSTEPS)
+    snapshot = worker.latest()
+
+    # What is drawn: the worker, or a ReplayPlayer (same API)
+    source = worker
+    timer = create_frame_timer()
+    capture = ProfileCapture()
+    text_cache = TextCache()
+    sprites = SpriteCache()
+    renderer = DirtyRectRenderer(screen, C.BACKGROUND_COLOR)
+    hud_font = pygame.font.SysFont("monospace", 14)
     running = True
+    settings = None
 
+    # Physics steps on its own thread from here on
+    worker.start()
 
     while running:
-        # Delta time (seconds)
+        # Frame time (seconds); physics runs in fixed steps on the worker
         dt = clock.tick(C.FPS) / 1000.0
-        # Handle input & events
-        running = input_state.handle_events(bodies, dt)
+        timer.start_frame()
+
+        # Handle input & events (body changes are queued to the worker)
+        running = input_state.handle_events(snapshot, source, dt)
+        timer.lap("events")
+
+        # Start / stop a profile capture (both threads + phase spans)
+        if input_state.profile_requested:
+            input_state.profile_requested = False
+            if capture.active:
+                _report_profile(capture.stop())
+            else:
+                capture.start(C.PROFILE_FRAMES, timer, worker=worker)
+
+        # Switch between live physics and replaying the recording
+        if input_state.replay_requested:
+            input_state.replay_requested = False
+            if source is not worker:
+                source.stop()
+                source = worker
+            elif not input_state.recording and os.path.exists(C.TRAJECTORY_PATH):
+                source = ReplayPlayer(C.TRAJECTORY_PATH)
+            input_state.replaying = source is not worker
+            snapshot = source.latest()
 
         # ----------------------------------------------------
-        # Physics Update (Skipped When Paused)
+        # Physics Update (Skipped When Paused or Replaying)
         # ----------------------------------------------------
+        worker.paused = input_state.paused or input_state.replaying
+        source.paused = input_state.paused
         if not input_state.paused:
-
-            # Mutual gravity (pairwise)
-            if input_state.gravity_enabled:
-                for i in range(len(bodies)):
-                    for j in range(i + 1, len(bodies)):
-                        apply_gravity(bodies[i], bodies[j], C.G, dt)
-
-            # Integrate motion
-            for body in bodies:
-                body.update(dt)
-
-            # Body-body collisions
-            for i in range(len(bodies)):
-                for j in range(i + 1, len(bodies)):
-                    resolve_body_collision(bodies[i], bodies[j])
-
-            # Boundary collisions + damping
-            for body in bodies:
-                body.handle_boundary_collision(C.WIDTH, C.HEIGHT)
-                body.velocity[0] *=  input_state.DAMPING_COEFF
-                body.velocity[1] *=  input_state.DAMPING_COEFF
+            # Sync UI toggles into the headless world when they change
+            # (DAMPING_COEFF is per 1/FPS frame; rescale to the step size)
+            wanted = (
+                input_state.gravity_enabled, input_state.gravity_solver,
+                input_state.DAMPING_COEFF ** (worker.dt * C.FPS),
+            )
+            if wanted != settings:
+                settings = wanted
+                worker.submit(_sync_settings, *settings)
+
+        # Steps here only when the worker is not threaded (a replay
+        # advances its recording here)
+        source.pump(dt)
+
+        # Newest published state; the physics phases and counters
+        # are what the worker did since the last snapshot drawn
+        previous = snapshot
+        snapshot = source.latest()
+        timer.lap_world(snapshot, previous.phase_times)
+        timer.count(
+            steps=snapshot.steps - previous.steps,
+            pair_tests=snapshot.pair_tests - previous.pair_tests,
+            contacts=snapshot.contacts - previous.contacts,
+        )
+        alpha = source.alpha(snapshot) if not input_state.paused else 1.0
 
         # ----------------------------------------------------
         # Rendering
         # ----------------------------------------------------
-        clear_screen(screen, C.BACKGROUND_COLOR)
-
-        font = pygame.font.SysFont(None, 18)
-
-        for body in bodies:
-            if body == input_state.active_body:
-                draw_active_shadow(screen, body)
-            draw_body(screen, body, font)
+        # Erase what was drawn last frame (cached background)
+        renderer.begin_frame()
+
+        active = input_state.active_serial
+        active_index = snapshot.row_of(active) if active is not None else None
+
+        # Camera: follow the active body, then only the bodies in
+        # view (snapshot's copy of the broad phase), interpolated
+        # between the last two physics states and mapped to the screen
+        camera = input_state.camera
+        if camera.following and active_index is not None:
+            camera.follow(snapshot.interpolated(alpha, [active_index])[0])
+        rows = visible_rows(snapshot, camera, active_index)
+        positions = camera.world_to_screen(snapshot.interpolated(alpha, rows))
+
+        # Visible bodies (+ active highlight and labels) in one blits
+        # call; dust of very large scenes is splatted instead
+        draw_bodies_lod(
+            screen, snapshot, sprites, text_cache, positions, active_index, renderer,
+            rows, camera.zoom
+        )
+        if not camera.is_home:
+            for rect in draw_world_bounds(screen, camera, world.width, world.height, C.LIGHT_GRAY):
+                renderer.mark(rect)
 
         # ----------------------------------------------------
         # UI State Indicators
         # ----------------------------------------------------
         if input_state.paused:
-            paused_text = font.render("PAUSED", True, (255, 80, 80))
-            screen.blit(paused_text, (10, 10))
+            paused_text = text_cache.render("PAUSED", C.LABEL_FONT_SIZE, (255, 80, 80))
+            renderer.mark(screen.blit(paused_text, (10, 10)))
 
         if not input_state.gravity_enabled:
-            grav_text = font.render("GRAVITY OFF", True, (80, 180, 255))
-            screen.blit(grav_text, (10, 30))
+            grav_text = text_cache.render("GRAVITY OFF", C.LABEL_FONT_SIZE, (80, 180, 255))
+            renderer.mark(screen.blit(grav_text, (10, 30)))
+
+        if input_state.gravity_solver != C.GRAVITY_SOLVERS[0]:
+            solver_text = text_cache.render(
+                input_state.gravity_solver.upper(), C.LABEL_FONT_SIZE, (180, 255, 120)
+            )
+            renderer.mark(screen.blit(solver_text, (10, 50)))
+
+        if not camera.is_home:
+            label = f"ZOOM {camera.zoom:.2f}x" + (" FOLLOW" if camera.following else "")
+            camera_text = text_cache.render(label, C.LABEL_FONT_SIZE, (200, 200, 255))
+            renderer.mark(screen.blit(camera_text, (10, 90)))
+
+        if input_state.recording:
+            rec_text = text_cache.render("REC", C.LABEL_FONT_SIZE, (255, 60, 60))
+            renderer.mark(screen.blit(rec_text, (10, 110)))
+
+        # Changes every frame: rendered directly, not cached
+        if capture.active:
+            profile_text = text_cache.font(C.LABEL_FONT_SIZE).render(
+                f"PROFILING {capture.frames_done}/{capture.frames}", True, (255, 200, 80)
+            )
+            renderer.mark(screen.blit(profile_text, (10, 70)))
+
+        if input_state.replaying:
+            replay_text = text_cache.font(C.LABEL_FONT_SIZE).render(
+                f"REPLAY {source.frame}/{source.frames - 1}", True, (255, 120, 220)
+            )
+            renderer.mark(screen.blit(replay_text, (10, 130)))
+
+        # Result of background work (checkpoint saved / failed, ...)
+        status = input_state.status
+        if status is not None and perf_counter() < status[2]:
+            status_text = text_cache.render(status[0], C.LABEL_FONT_SIZE, status[1])
+            renderer.mark(screen.blit(status_text, (10, 150)))
+
+        if input_state.show_telemetry:
+            renderer.mark(draw_telemetry(screen, hud_font, timer.stats(), timer.last_counters))
+        timer.lap("render")
+
+        # Push only the changed regions (or flip when most changed)
+        renderer.present()
+        timer.lap("flip")
+        timer.count(bodies=len(snapshot), visible=len(rows))
+        timer.end_frame()
+        _report_profile(capture.end_frame())
+
+    # Finish an open capture (needs the physics thread), stop the
+    # thread, then write out the recording, queued checkpoints and
+    # buffered telemetry rows
+    if capture.active:
+        _report_profile(capture.stop())
+    if source is not worker:
+        source.stop()
+    worker.stop()
+    if world.recorder is not None:
+        world.recorder.close()
+    input_state.checkpoint_writer.close()
+    timer.close()
 
-        pygame.display.flip()
     #Tell caller that simulation ended
     return "EXIT"
 
+
+# ------------------------------------------------------------
+# Worker command: UI toggles → World (between two steps)
+# ------------------------------------------------------------
+def _sync_settings(world, gravity_enabled, gravity_solver, damping):
+    world.gravity_enabled = gravity_enabled
+    world.gravity_solver = gravity_solver
+    world.damping = damping
+
+
+# ------------------------------------------------------------
+# Written capture → HUD status row
+# ------------------------------------------------------------
+def _report_profile(paths):
+    if paths:
+        stem = os.path.splitext(paths[0])[0]
+        input_state.show_status(f"PROFILE {stem} (.pstats, .trace.json)", (255, 200, 80))
+
@@ -0,0 +1,238 @@
+# ============================================================
+# Frame Telemetry (Per-Phase Timing)
+# ============================================================
+# Measures where each frame's time goes (events, physics
+# phases, rendering, display flip), keeps a rolling window for
+# the on-screen HUD and optionally logs every frame to a CSV or
+# JSONL file for offline analysis.
+# ============================================================
+
+import csv
+import json
+from time import perf_counter
+
+import numpy as np
+
+import utils.constants as C
+
+
+# Timed phases of one frame, in loop order
+PHASES = ("events", "gravity", "collisions", "boundaries", "render", "flip")
+
+# Per-frame columns: the phases, unattributed time ("other"),
+# the whole frame's work and the frame-to-frame interval (with
+# the clock's sleep)
+COLUMNS = PHASES + ("other", "work", "interval")
+
+# Per-frame counts
+COUNTERS = ("steps", "bodies", "visible", "pair_tests", "contacts")
+
+
+# ------------------------------------------------------------
+# Buffered CSV / JSONL log, one row per frame
+# ------------------------------------------------------------
+class TelemetrySink:
+    def __init__(self, path, flush_rows=C.TELEMETRY_FLUSH_ROWS):
+        self.path = path
+        self.format = "jsonl" if path.endswith(".jsonl") else "csv"
+        self.flush_rows = flush_rows
+        self._rows = []
+        self._file = open(path, "w", newline="")
+        self._writer = None
+
+    def write(self, row):
+        self._rows.append(row)
+        if len(self._rows) >= self.flush_rows:
+            self.flush()
+
+    def flush(self):
+        if not self._rows:
+            return
+
+        if self.format == "jsonl":
+            self._file.write("".join(json.dumps(row) + "\n" for row in self._rows))
+        else:
+            if self._writer is None:
+                self._writer = csv.DictWriter(self._file, fieldnames=list(self._rows[0]))
+                self._writer.writeheader()
+            self._writer.writerows(self._rows)
+
+        self._file.flush()
+        self._rows.clear()
+
+    def close(self):
+        self.flush()
+        self._file.close()
+
+
+# ------------------------------------------------------------
+# Per-phase frame timer with a rolling window
+# ------------------------------------------------------------
+class FrameTimer:
+    def __init__(self, window=C.TELEMETRY_WINDOW, sink=None):
+        self.sink = sink
+        self.history = np.zeros((window, len(COLUMNS)))   # seconds
+        self.frames = 0
+
+        self.current = dict.fromkeys(PHASES, 0.0)
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.last_counters = dict(self.counters)
+
+        # (phase, start, end) spans while a profile capture runs
+        self.trace = None
+
+        self._start_time = perf_counter()
+        self._frame_start = self._last = self._start_time
+        self._previous_frame_start = None
+
+    # --------------------------------------------------------
+    # Frame boundaries
+    # --------------------------------------------------------
+    def start_frame(self):
+        now = perf_counter()
+        self._previous_frame_start = self._frame_start if self.frames else None
+        self._frame_start = self._last = now
+        for phase in PHASES:
+            self.current[phase] = 0.0
+        for name in COUNTERS:
+            self.counters[name] = 0
+
+    def end_frame(self):
+        now = perf_counter()
+        work = now - self._frame_start
+        interval = now - self._previous_frame_start if self._previous_frame_start else work
+
+        row = self.history[self.frames % len(self.history)]
+        for c, phase in enumerate(PHASES):
+            row[c] = self.current[phase]
+        row[len(PHASES)] = max(work - sum(self.current.values()), 0.0)
+        row[-2] = work
+        row[-1] = interval
+
+        self.last_counters = dict(self.counters)
+        self.frames += 1
+
+        if self.sink is not None:
+            record = {"frame": self.frames, "t": round(self._frame_start - self._start_time, 4)}
+            for c, name in enumerate(COLUMNS):
+                record[name + "_ms"] = round(row[c] * 1e3, 4)
+            record.update(self.last_counters)
+            self.sink.write(record)
+
+    # --------------------------------------------------------
+    # Time since the last lap goes to `phase`
+    # --------------------------------------------------------
+    def lap(self, phase):
+        now = perf_counter()
+        self.current[phase] += now - self._last
+        if self.trace is not None:
+            self.trace.append((phase, self._last, now))
+        self._last = now
+
+    # --------------------------------------------------------
+    # Physics phases: growth of world.phase_times since `before`
+    # --------------------------------------------------------
+    def lap_world(self, world, before):
+        for phase, seconds in world.phase_times.items():
+            self.current[phase] += seconds - before[phase]
+        self._last = perf_counter()
+
+    def count(self, **counts):
+        for name, value in counts.items():
+            self.counters[name] += value
+
+    # --------------------------------------------------------
+    # Rolling mean / percentiles (milliseconds) per column
+    # --------------------------------------------------------
+    def stats(self):
+        filled = self.history[:min(self.frames, len(self.history))] * 1e3
+        if len(filled) == 0:
+            return {}
+
+        mean = filled.mean(axis=0)
+        p50, p95, p99 = np.percentile(filled, (50, 95, 99), axis=0)
+        return {
+            name: {"mean": mean[c], "p50": p50[c], "p95": p95[c], "p99": p99[c]}
+            for c, name in enumerate(COLUMNS)
+        }
+
+    def close(self):
+        if self.sink is not None:
+            self.sink.close()
+            self.sink = None
+
+
+# ------------------------------------------------------------
+# Timer with the log configured in constants (if any)
+# ------------------------------------------------------------
+def create_frame_timer():
+    sink = TelemetrySink(C.TELEMETRY_PATH) if C.TELEMETRY_PATH else None
+    return FrameTimer(C.TELEMETRY_WINDOW, sink)
+
+
+
+
+
+# ======================================================================
+#                           TEACHING SECTION
+# ======================================================================
+#
+# File: telemetry.py
+#
+# Role of this file:
+# ------------------
+# "The frame rate dropped" is not actionable; "collisions went from 2 ms
+# to 30 ms when the dust cloud spawned" is. The simulation loop marks
+# the end of each phase, and this file turns those marks into per-frame
+# timings, a rolling summary for the HUD (key: T) and an optional log.
+#
+# ----------------------------------------------------------------------
+#
+# =========================
+# WHAT IS MEASURED
+# =========================
+#
+# events      : input_state.handle_events
+# gravity     : integration under gravity (World.phase_times)
+# collisions  : broad + narrow phase        (World.phase_times)
+# boundaries  : walls + damping             (World.phase_times)
+# render      : clearing, drawing bodies, UI text, HUD
+# flip        : pygame.display.flip
+# other       : everything else in the frame (interpolation, loop code)
+# work        : the whole frame without the clock's sleep
+# interval    : start of previous frame → end of this one (1 / fps)
+#
+# Counters per frame: physics steps, bodies, visible (bodies the camera
+# drew), broad-phase pair tests, contacts (summed over the frame's steps).
+#
+# Timers are time.perf_counter (monotonic, sub-microsecond); a frame
+# costs a handful of calls, far below anything it measures.
+#
+# ----------------------------------------------------------------------
+#
+# =========================
+# HUD AND LOG
+# =========================
+#
+# stats() : mean / p50 / p95 / p99 in ms over the last
+#           TELEMETRY_WINDOW frames (ring buffer, no allocation per frame)
+#
+# TelemetrySink(path) : ".jsonl" → one JSON object per line, otherwise
+#           CSV with a header. Rows wait in memory until
+#           TELEMETRY_FLUSH_ROWS have accumulated (bounded buffer), then
+#           go to disk in one write. Set C.TELEMETRY_PATH to enable.
+#
+# Row: frame, t (s since start), <column>_ms for every column above,
+#      steps, bodies, visible, pair_tests, contacts
+#
+# ======================================================================
+#                       IMPROVEMENT SECTION
+# ======================================================================
+#
+# 1. Background Writer
+#    - Hand full buffers to a thread so disk stalls never hit a frame.
+#
+# 2. Frame Graph
+#    - Plot the last window of frame times as a bar strip in the HUD.
+#
+# ======================================================================
@@ -101,11 +101,12 @@ if __name__ == "__main__":
 #
 # ----------------------------------------------------------------------
 #
-# handle_events(bodies, dt)
-# -------------------------
+# handle_events(snapshot, worker, dt)
+# -----------------------------------
 # Inputs:
-#   - bodies : list[Body]
-#   - dt     : float (delta time in seconds)
+#   - snapshot : latest physics Snapshot (read-only)
+#   - worker   : PhysicsWorker (body changes are queued to it)
+#   - dt       : float (delta time in seconds)
 # Returns:
 #   - bool (whether the simulation should continue running)
 # Purpose:
@@ -188,28 +189,18 @@ if __name__ == "__main__":
 #
 # ----------------------------------------------------------------------
 #
-# draw_body(screen, body, font)
-# -----------------------------
+# draw_body(screen, body, text_cache)
+# -----------------------------------
 # Inputs:
-#   - screen : pygame.Surface
-#   - body   : Body
-#   - font   : pygame.font.Font
+#   - screen     : pygame.Surface
+#   - body       : Body
+#   - text_cache : TextCache (cached fonts + rendered labels)
 # Purpose:
 #   - Draws a body as a circle
 #   - Renders body metadata (id, mass, etc.)
-#   - Provides visual feedback for simulation state
-#
-# ----------------------------------------------------------------------
-#
-# draw_active_shadow(screen, body)
-# --------------------------------
-# Inputs:
-#   - screen : pygame.Surface
-#   - body   : Body
-# Purpose:
-#   - Highlights the currently active body
-#   - Improves user interaction clarity
-#   - Helps track which object is being controlled
+#   - Legacy per-body path, kept as the benchmark baseline; the loop
+#     draws with renderer/sprites.draw_bodies (which also rings the
+#     active body)
 #
 # ----------------------------------------------------------------------
 #
@@ -0,0 +1,363 @@
+# ============================================================
+# Dynamic AABB Tree (Bounding-Volume Hierarchy)
+# ============================================================
+# Binary tree of fattened bounding boxes, kept in NumPy node
+# arrays and walked a whole level of node pairs at a time.
+# Handles scenes mixing 1-pixel dust with 150-pixel stars,
+# where a single-resolution grid breaks down.
+# ============================================================
+
+import numpy as np
+
+import utils.constants as C
+
+
+NULL = -1
+
+
+# ------------------------------------------------------------
+# Z-order (Morton) keys of points: close keys, close points
+# ------------------------------------------------------------
+def _spread_bits(v):
+    # 16-bit integers → the even bits of 32-bit integers
+    v = (v | (v << 8)) & 0x00FF00FF
+    v = (v | (v << 4)) & 0x0F0F0F0F
+    v = (v | (v << 2)) & 0x33333333
+    v = (v | (v << 1)) & 0x55555555
+    return v
+
+
+def morton_keys(positions):
+    lo = positions.min(axis=0)
+    span = np.maximum(positions.max(axis=0) - lo, 1e-9)
+    q = ((positions - lo) / span * 65535.0).astype(np.int64)
+    return _spread_bits(q[:, 0]) | (_spread_bits(q[:, 1]) << 1)
+
+
+def _overlap(boxes_a, boxes_b):
+    return ((boxes_a[:, 0] <= boxes_b[:, 2]) & (boxes_a[:, 2] >= boxes_b[:, 0])
+            & (boxes_a[:, 1] <= boxes_b[:, 3]) & (boxes_a[:, 3] >= boxes_b[:, 1]))
+
+
+class AABBTree:
+    def __init__(self, margin=C.AABB_MARGIN, rebuild_factor=C.AABB_REBUILD_FACTOR):
+        self.margin = margin
+        self.rebuild_factor = rebuild_factor
+
+        # ----------------------------------------------------
+        # Node arrays: leaves are nodes 0 .. leaves-1 (one per
+        # body row), internal nodes follow
+        # ----------------------------------------------------
+        self.leaves = 0
+        self.box = np.zeros((0, 4))                   # x0, y0, x1, y1
+        self.child1 = np.zeros(0, dtype=np.intp)      # NULL for leaves
+        self.child2 = np.zeros(0, dtype=np.intp)
+        self.root = NULL
+
+        # Internal node id ranges, bottom-up (refit order), and the
+        # children of each range
+        self._levels = []
+
+        # Total internal perimeter right after the last build
+        self._built_cost = 0.0
+
+        # Leaves given a new fat box (body left the old one) and
+        # full rebuilds (body set changed or tree quality dropped)
+        self.refits = 0
+        self.rebuilds = 0
+
+    def _fat_boxes(self, positions, radii):
+        extent = (radii + self.margin)[:, None]
+        return np.hstack((positions - extent, positions + extent))
+
+    # --------------------------------------------------------
+    # Bulk build: leaves in Morton order, paired level by level
+    # --------------------------------------------------------
+    def build(self, positions, radii):
+        n = len(radii)
+        self.leaves = n
+        self.rebuilds += 1
+        self._levels = []
+        if n == 0:
+            self.box = np.zeros((0, 4))
+            self.child1 = self.child2 = np.zeros(0, dtype=np.intp)
+            self.root = NULL
+            self._built_cost = 0.0
+            return
+
+        total = 2 * n - 1
+        self.box = np.empty((total, 4))
+        self.box[:n] = self._fat_boxes(positions, radii)
+        self.child1 = np.full(total, NULL, dtype=np.intp)
+        self.child2 = np.full(total, NULL, dtype=np.intp)
+
+        # Neighbours in Z-order are neighbours in space, so pairing
+        # consecutive nodes gives compact parents; an odd node out
+        # moves up a level unpaired
+        level = np.argsort(morton_keys(positions), kind="stable")
+        next_id = n
+        while len(level) > 1:
+            pairs = len(level) // 2
+            first, second = level[0:2 * pairs:2], level[1:2 * pairs:2]
+            self.child1[next_id:next_id + pairs] = first
+            self.child2[next_id:next_id + pairs] = second
+            self._levels.append((next_id, next_id + pairs, first, second))
+            level = np.concatenate((np.arange(next_id, next_id + pairs), level[2 * pairs:]))
+            next_id += pairs
+
+        self.root = int(level[0])
+        self._refit()
+        self._built_cost = self.cost()
+
+    # --------------------------------------------------------
+    # Parents = union of their children, one NumPy pass per level
+    # --------------------------------------------------------
+    def _refit(self):
+        box = self.box
+        for start, end, first, second in self._levels:
+            np.minimum(box[first, :2], box[second, :2], out=box[start:end, :2])
+            np.maximum(box[first, 2:], box[second, 2:], out=box[start:end, 2:])
+
+    # --------------------------------------------------------
+    # Sum of internal node perimeters (tree quality: lower is
+    # tighter)
+    # --------------------------------------------------------
+    def cost(self):
+        inner = self.box[self.leaves:]
+        return float(2.0 * ((inner[:, 2] - inner[:, 0]) + (inner[:, 3] - inner[:, 1])).sum())
+
+    # --------------------------------------------------------
+    # Same bodies, new positions: refit the leaves that left
+    # their fat box; rebuild once the tree has grown too loose
+    # --------------------------------------------------------
+    def update(self, positions, radii):
+        n = self.leaves
+        box = self.box
+        escaped = np.flatnonzero(
+            (positions[:, 0] - radii < box[:n, 0]) | (positions[:, 1] - radii < box[:n, 1])
+            | (positions[:, 0] + radii > box[:n, 2]) | (positions[:, 1] + radii > box[:n, 3])
+        )
+        if len(escaped) == 0:
+            return
+
+        box[escaped] = self._fat_boxes(positions[escaped], radii[escaped])
+        self.refits += len(escaped)
+        self._refit()
+
+        if self.cost() > self.rebuild_factor * self._built_cost:
+            self.build(positions, radii)
+
+    # --------------------------------------------------------
+    # Leaves whose fat box overlaps a region (one pass per depth)
+    # --------------------------------------------------------
+    def query(self, x0, y0, x1, y1):
+        if self.root == NULL:
+            return np.zeros(0, dtype=np.intp)
+
+        region = np.array([[x0, y0, x1, y1]])
+        found = []
+        nodes = np.array([self.root], dtype=np.intp)
+        while len(nodes):
+            nodes = nodes[_overlap(self.box[nodes], region)]
+            leaf = nodes < self.leaves
+            found.append(nodes[leaf])
+            inner = nodes[~leaf]
+            nodes = np.concatenate((self.child1[inner], self.child2[inner]))
+        return np.concatenate(found)
+
+    # --------------------------------------------------------
+    # All overlapping leaf pairs: the tree against itself, one
+    # frontier of node pairs per pass
+    # --------------------------------------------------------
+    def overlapping_pairs(self):
+        n = self.leaves
+        if n < 2:
+            empty = np.zeros(0, dtype=np.intp)
+            return empty, empty
+
+        box, child1, child2 = self.box, self.child1, self.child2
+        perimeter = (box[:, 2] - box[:, 0]) + (box[:, 3] - box[:, 1])
+
+        # Descending a node against itself ends in the pairs of
+        # its two children, so start from every internal node's
+        firsts, seconds = [], []
+        a = child1[n:]
+        b = child2[n:]
+        while len(a):
+            hit = _overlap(box[a], box[b])
+            a, b = a[hit], b[hit]
+
+            a_leaf = a < n
+            b_leaf = b < n
+            both = a_leaf & b_leaf
+            firsts.append(a[both])
+            seconds.append(b[both])
+
+            # Split the bigger node (an internal one if the other
+            # is a leaf)
+            split_a = ~a_leaf & (b_leaf | (perimeter[a] > perimeter[b]))
+            split_b = ~both & ~split_a
+            a_split, b_keep = a[split_a], b[split_a]
+            a_keep, b_split = a[split_b], b[split_b]
+            a = np.concatenate((child1[a_split], child2[a_split], a_keep, a_keep))
+            b = np.concatenate((b_keep, b_keep, child1[b_split], child2[b_split]))
+
+        return np.concatenate(firsts), np.concatenate(seconds)
+
+
+# ------------------------------------------------------------
+# Broad phase keeping one tree leaf per body of a BodyStore
+# ------------------------------------------------------------
+class AABBTreeBroadPhase:
+    def __init__(self, margin=C.AABB_MARGIN, rebuild_factor=C.AABB_REBUILD_FACTOR):
+        self.tree = AABBTree(margin, rebuild_factor)
+
+        # Store serials the leaves were built for (leaf k = row k)
+        self._row_serials = np.zeros(0, dtype=np.int64)
+
+        # Statistics of the last query
+        self.pair_tests = 0
+
+    # --------------------------------------------------------
+    # Bring the tree in line with the store
+    # --------------------------------------------------------
+    def sync(self, store):
+        n = len(store)
+        serials = store.serials[:n]
+        positions = store.positions[:n]
+        radii = store.radii[:n]
+
+        # Bodies added, removed or reordered: rebuild (vectorized);
+        # otherwise only escaped leaves are refitted
+        if len(self._row_serials) != n or not np.array_equal(self._row_serials, serials):
+            self.tree.build(positions, radii)
+            self._row_serials = serials.copy()
+        else:
+            self.tree.update(positions, radii)
+
+    # --------------------------------------------------------
+    # Candidate pairs (i < j, sorted) whose AABBs overlap
+    # --------------------------------------------------------
+    def candidate_pairs_for(self, store):
+        self.sync(store)
+        n = len(store)
+        positions = store.positions[:n]
+        radii = store.radii[:n]
+
+        a, b = self.tree.overlapping_pairs()
+        self.pair_tests = len(a)
+
+        # Tight AABB filter (tree boxes are fattened)
+        reach = radii[a] + radii[b]
+        delta = np.abs(positions[a] - positions[b])
+        hit = (delta[:, 0] <= reach) & (delta[:, 1] <= reach)
+
+        i = np.minimum(a[hit], b[hit])
+        j = np.maximum(a[hit], b[hit])
+        sort = np.argsort(i * n + j, kind="stable")
+        return i[sort], j[sort]
+
+    # --------------------------------------------------------
+    # Rows of the bodies whose AABB overlaps a region
+    # --------------------------------------------------------
+    def query_region(self, store, x0, y0, x1, y1):
+        self.sync(store)
+        n = len(store)
+        rows = self.tree.query(x0, y0, x1, y1)
+
+        positions = store.positions[:n][rows]
+        radii = store.radii[:n][rows]
+        inside = ((positions[:, 0] + radii >= x0) & (positions[:, 0] - radii <= x1)
+                  & (positions[:, 1] + radii >= y0) & (positions[:, 1] - radii <= y1))
+        return np.sort(rows[inside])
+
+
+
+
+
+
+# ======================================================================
+#                           TEACHING SECTION
+# ======================================================================
+#
+# File: aabb_tree.py
+#
+# Role of this file:
+# ------------------
+# A uniform grid needs one cell size. With radii from 1 px (dust) to
+# 150 px (stars), any single size is wrong for most bodies: the grid
+# sends every star to an all-bodies test. A bounding volume hierarchy
+# adapts to every size: big bodies make big boxes, small ones small.
+#
+# ----------------------------------------------------------------------
+#
+# =========================
+# CLASS: AABBTree
+# =========================
+#
+# Binary tree of axis-aligned bounding boxes in NumPy arrays:
+#   - Leaves  : nodes 0 .. n-1, one "fat" box per body row (tight box
+#               + margin)
+#   - Parents : nodes n .. 2n-2, union of their two children's boxes
+#   box (x0, y0, x1, y1), child1, child2 (NULL for leaves)
+#
+# Nothing walks the tree one node at a time in Python; every operation
+# is a handful of array passes:
+#
+# build(positions, radii)
+#   - Sort the leaves by Morton (Z-order) key of their centre, then pair
+#     neighbours level by level (log2 n passes). Close in Z-order means
+#     close in space, so parents stay compact.
+#
+# update(positions, radii)
+#   - One vectorized test finds the bodies that left their fat box; only
+#     those get a new one (refits), then parents are refitted, one pass
+#     per level. The margin is what keeps slow bodies inside their box
+#     for many frames.
+#   - Refitting keeps the shape of the tree; a body that drifted far
+#     makes its ancestors' boxes grow. When the internal perimeter sum
+#     (cost) exceeds rebuild_factor x its value after the last build,
+#     the tree is rebuilt (rebuilds).
+#
+# query(x0, y0, x1, y1) → leaves whose fat box overlaps the region
+#   - Breadth-first: one overlap test for all nodes of a depth
+#
+# overlapping_pairs() → all overlapping leaf pairs
+#   - The tree against itself as a frontier of node pairs, starting
+#     from the two children of every internal node. Each pass tests the
+#     whole frontier, keeps leaf-leaf hits and replaces every other
+#     overlapping pair by the two pairs of the bigger node's children.
+#     About 2 x depth passes in total.
+#
+# ----------------------------------------------------------------------
+#
+# =========================
+# CLASS: AABBTreeBroadPhase
+# =========================
+#
+# Leaf k is store row k. The store serials of the last build tell
+# whether rows are unchanged (update) or bodies were added, removed or
+# swapped (build again; a full vectorized build of 10k bodies takes a
+# few milliseconds).
+#
+# candidate_pairs_for(store) → (i, j) rows, same format as SpatialHash
+# query_region(store, x0, y0, x1, y1) → rows inside a region
+#
+# Benchmark (mixed materials, spawn weights from C.MATERIAL_WEIGHTS):
+#   python -m benchmarks.bench_aabb_tree   (run from python/)
+#
+# ======================================================================
+#                       IMPROVEMENT SECTION
+# ======================================================================
+#
+# 1. Velocity-Predicted Boxes
+#    - Extend fat boxes along the velocity to cut refits further.
+#
+# 2. Pair Cache
+#    - Only re-query refitted leaves and keep the remaining pairs.
+#
+# 3. SAH Build
+#    - Split by surface-area heuristic instead of Morton order for
+#      tighter trees when radii vary a lot within a neighbourhood.
+#
+# ======================================================================
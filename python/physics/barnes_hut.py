@@ -0,0 +1,380 @@
+# ============================================================
+# Barnes–Hut Gravity
+# ============================================================
+# Approximates gravity from distant groups of bodies using a
+# quadtree. The tree is stored as flat NumPy arrays (one entry
+# per node) and traversed for many bodies at once.
+# ============================================================
+
+import numpy as np
+
+import utils.constants as C
+
+
+# Nodes holding this many bodies or fewer are not subdivided
+LEAF_SIZE = 8
+
+# Bits per axis of the Morton key → maximum tree depth
+MORTON_BITS = 16
+
+# Bodies traversed together (bounds the interaction list memory)
+BODY_CHUNK = 2048
+
+
+# ------------------------------------------------------------
+# Spread the low 16 bits of v onto the even bit positions
+# ------------------------------------------------------------
+def _part1by1(v):
+    v = v & np.uint64(0xFFFF)
+    v = (v | (v << np.uint64(8))) & np.uint64(0x00FF00FF)
+    v = (v | (v << np.uint64(4))) & np.uint64(0x0F0F0F0F)
+    v = (v | (v << np.uint64(2))) & np.uint64(0x33333333)
+    v = (v | (v << np.uint64(1))) & np.uint64(0x55555555)
+    return v
+
+
+# ------------------------------------------------------------
+# Reduce values over disjoint, increasing [start, end) ranges
+# ------------------------------------------------------------
+def _range_reduce(ufunc, values, starts, ends, pad):
+    padded = np.append(values, pad)
+    bounds = np.empty(2 * len(starts), dtype=np.intp)
+    bounds[0::2] = starts
+    bounds[1::2] = ends
+    return ufunc.reduceat(padded, bounds)[0::2]
+
+
+# ------------------------------------------------------------
+# Concatenate index ranges [start, end) (vectorized)
+# ------------------------------------------------------------
+def _expand_ranges(starts, counts):
+    total = int(counts.sum())
+    offsets = np.repeat(np.cumsum(counts) - counts, counts)
+    return np.repeat(starts, counts) + (np.arange(total) - offsets)
+
+
+# ------------------------------------------------------------
+# Quadtree stored as flat per-node arrays
+# ------------------------------------------------------------
+class QuadTree:
+    def __init__(self, positions, masses, radii, leaf_size=LEAF_SIZE):
+        n = len(masses)
+
+        # ----------------------------------------------------
+        # Square root cell covering every body
+        # ----------------------------------------------------
+        lo = positions.min(axis=0)
+        extent = float((positions.max(axis=0) - lo).max())
+        if extent <= 0:
+            extent = 1.0
+        extent *= 1.0 + 1e-9
+        cells = 1 << MORTON_BITS
+
+        # ----------------------------------------------------
+        # Morton keys → bodies sorted along a Z-order curve
+        # ----------------------------------------------------
+        q = ((positions - lo) * (cells / extent)).astype(np.int64)
+        np.clip(q, 0, cells - 1, out=q)
+        q = q.astype(np.uint64)
+        keys = _part1by1(q[:, 0]) | (_part1by1(q[:, 1]) << np.uint64(1))
+
+        order = np.argsort(keys, kind="stable")
+        keys = keys[order]
+
+        self.order = order
+        self.x = positions[order, 0]
+        self.y = positions[order, 1]
+        self.m = masses[order]
+        self.r = radii[order]
+
+        # ----------------------------------------------------
+        # Level-by-level build: only nodes with more than
+        # leaf_size bodies are split into their children
+        # ----------------------------------------------------
+        starts = [np.array([0], dtype=np.intp)]
+        ends = [np.array([n], dtype=np.intp)]
+        levels = [np.zeros(1, dtype=np.int64)]
+        child_first = []
+        child_count = []
+
+        level = 0
+        node_offset = 0
+        level_start, level_end = starts[0], ends[0]
+
+        while True:
+            counts = level_end - level_start
+            if level < MORTON_BITS:
+                split = counts > leaf_size
+            else:
+                split = np.zeros(len(counts), dtype=bool)
+
+            first = np.full(len(counts), -1, dtype=np.intp)
+            kids = np.zeros(len(counts), dtype=np.intp)
+
+            if not split.any():
+                child_first.append(first)
+                child_count.append(kids)
+                break
+
+            # Bodies of the nodes being split, with their child prefix
+            parent_start = level_start[split]
+            parent_count = counts[split]
+            idx = _expand_ranges(parent_start, parent_count)
+            shift = np.uint64(2 * (MORTON_BITS - level - 1))
+            prefix = keys[idx] >> shift
+
+            # A child begins where a parent begins or the prefix changes
+            is_first = np.zeros(len(idx), dtype=bool)
+            is_first[np.cumsum(parent_count) - parent_count] = True
+            is_first[1:] |= prefix[1:] != prefix[:-1]
+            boundary = np.flatnonzero(is_first)
+
+            next_start = idx[boundary]
+            next_end = np.empty_like(next_start)
+            next_end[:-1] = idx[boundary[1:] - 1] + 1
+            next_end[-1] = idx[-1] + 1
+
+            # Children per split parent (contiguous in the next level)
+            parent_of_body = np.repeat(np.arange(len(parent_start)), parent_count)
+            parent_of_child = parent_of_body[boundary]
+            per_parent = np.bincount(parent_of_child, minlength=len(parent_start))
+
+            next_offset = node_offset + len(counts)
+            kids[split] = per_parent
+            first[split] = next_offset + np.cumsum(per_parent) - per_parent
+            child_first.append(first)
+            child_count.append(kids)
+
+            level += 1
+            node_offset = next_offset
+            level_start, level_end = next_start, next_end
+            starts.append(level_start)
+            ends.append(level_end)
+            levels.append(np.full(len(level_start), level, dtype=np.int64))
+
+        self.start = np.concatenate(starts)
+        self.end = np.concatenate(ends)
+        self.child_first = np.concatenate(child_first)
+        self.child_count = np.concatenate(child_count)
+        self.size = extent / (2.0 ** np.concatenate(levels))
+
+        # ----------------------------------------------------
+        # Aggregate mass, centre of mass and softening radius
+        # (one reduction per level, ranges are increasing)
+        # ----------------------------------------------------
+        mass = []
+        mx = []
+        my = []
+        min_r = []
+        for s, e in zip(starts, ends):
+            mass.append(_range_reduce(np.add, self.m, s, e, 0.0))
+            mx.append(_range_reduce(np.add, self.m * self.x, s, e, 0.0))
+            my.append(_range_reduce(np.add, self.m * self.y, s, e, 0.0))
+            min_r.append(_range_reduce(np.minimum, self.r, s, e, np.inf))
+
+        self.mass = np.concatenate(mass)
+        self.com_x = np.concatenate(mx)
+        self.com_y = np.concatenate(my)
+        self.min_radius = np.concatenate(min_r)
+
+        has_mass = self.mass > 0
+        np.divide(self.com_x, self.mass, out=self.com_x, where=has_mass)
+        np.divide(self.com_y, self.mass, out=self.com_y, where=has_mass)
+
+    def __len__(self):
+        return len(self.start)
+
+
+# ------------------------------------------------------------
+# Add softened point-mass accelerations into (ax, ay)
+# ------------------------------------------------------------
+def _accumulate(ax, ay, target, dx, dy, mass, softening, G):
+    dist_sq = dx * dx + dy * dy
+    distance = np.sqrt(dist_sq)
+    softening = softening * 0.1
+    dist_sq += softening * softening
+
+    # G * M / (r * (r² + ε²)), zero for coincident bodies
+    factor = dist_sq * distance
+    np.divide(G * mass, factor, out=factor, where=factor > 0)
+
+    size = len(ax)
+    ax += np.bincount(target, weights=factor * dx, minlength=size)
+    ay += np.bincount(target, weights=factor * dy, minlength=size)
+
+
+# ------------------------------------------------------------
+# Accelerations of all bodies (Barnes–Hut approximation)
+# ------------------------------------------------------------
+def barnes_hut_accelerations(positions, masses, radii, G, theta=C.BH_THETA,
+                             leaf_size=LEAF_SIZE, out=None):
+    n = len(masses)
+    if out is None:
+        out = np.zeros((n, 2))
+    else:
+        out[:] = 0.0
+    if n < 2:
+        return out
+
+    tree = QuadTree(positions, masses, radii, leaf_size)
+    theta_sq = theta * theta
+    x, y, m, r = tree.x, tree.y, tree.m, tree.r
+
+    for c0 in range(0, n, BODY_CHUNK):
+        c1 = min(c0 + BODY_CHUNK, n)
+        ax = np.zeros(c1 - c0)
+        ay = np.zeros(c1 - c0)
+
+        # Interaction list: (target body, tree node), starting at the root
+        target = np.arange(c0, c1)
+        node = np.zeros(c1 - c0, dtype=np.intp)
+
+        while len(target):
+            dx = tree.com_x[node] - x[target]
+            dy = tree.com_y[node] - y[target]
+            size = tree.size[node]
+
+            # Opening criterion s / d < θ, never for a node holding the target
+            inside = (tree.start[node] <= target) & (target < tree.end[node])
+            accept = (size * size < theta_sq * (dx * dx + dy * dy)) & ~inside
+
+            if accept.any():
+                t = target[accept]
+                k = node[accept]
+                _accumulate(
+                    ax, ay, t - c0, dx[accept], dy[accept],
+                    tree.mass[k], np.minimum(r[t], tree.min_radius[k]), G
+                )
+
+            opened = ~accept
+            kids = tree.child_count[node]
+
+            # Opened leaves: exact pairwise sums over their bodies
+            leaf = opened & (kids == 0)
+            if leaf.any():
+                k = node[leaf]
+                counts = tree.end[k] - tree.start[k]
+                t = np.repeat(target[leaf], counts)
+                j = _expand_ranges(tree.start[k], counts)
+                other = j != t
+                t = t[other]
+                j = j[other]
+                _accumulate(
+                    ax, ay, t - c0, x[j] - x[t], y[j] - y[t],
+                    m[j], np.minimum(r[t], r[j]), G
+                )
+
+            # Opened internal nodes: replace by their children
+            inner = opened & (kids > 0)
+            k = node[inner]
+            counts = kids[inner]
+            node = _expand_ranges(tree.child_first[k], counts)
+            target = np.repeat(target[inner], counts)
+
+        out[tree.order[c0:c1], 0] = ax
+        out[tree.order[c0:c1], 1] = ay
+
+    return out
+
+
+# ------------------------------------------------------------
+# Apply Barnes–Hut gravity to all bodies of a store
+# ------------------------------------------------------------
+def apply_gravity_barnes_hut(store, G, dt, theta=C.BH_THETA):
+    n = len(store)
+    if n < 2:
+        return
+
+    acc = barnes_hut_accelerations(
+        store.positions[:n], store.masses[:n], store.radii[:n], G, theta
+    )
+    store.velocities[:n] += acc * dt
+
+
+
+
+
+# ======================================================================
+#                           TEACHING SECTION
+# ======================================================================
+#
+# File: barnes_hut.py
+#
+# Role of this file:
+# ------------------
+# Direct summation costs O(n²). Barnes–Hut groups distant bodies into
+# quadtree nodes and treats each node as one point mass located at its
+# centre of mass, giving O(n log n) work per step.
+#
+# ----------------------------------------------------------------------
+#
+# =========================
+# CLASS: QuadTree
+# =========================
+#
+# Build steps:
+#   1. Compute a square root cell around all bodies
+#   2. Quantize positions and interleave x/y bits → Morton (Z-order) key
+#   3. Sort bodies by key: every quadtree node is now a contiguous
+#      range [start, end) of the sorted arrays
+#   4. Level by level, split nodes with more than leaf_size bodies where
+#      the next two key bits change
+#
+# Per-node arrays (index = node id, root = 0):
+#   start, end        : body range in sorted order
+#   child_first       : node id of the first child (-1 for leaves)
+#   child_count       : number of children (0 for leaves)
+#   size              : side length of the node's cell
+#   mass              : total mass
+#   com_x, com_y      : centre of mass
+#   min_radius        : smallest body radius (for softening)
+#
+# No per-node Python objects are created.
+#
+# ----------------------------------------------------------------------
+#
+# =========================
+# FUNCTION: barnes_hut_accelerations
+# =========================
+#
+# barnes_hut_accelerations(positions, masses, radii, G, theta=C.BH_THETA)
+#
+# Traversal works on an interaction list of (body, node) pairs:
+#   - s / d < θ (and the body is not inside the node)
+#       → accept the node as a point mass
+#   - otherwise, leaf  → exact pairwise sum over its bodies
+#   - otherwise        → replace the pair by (body, child) pairs
+#
+# Softening matches apply_gravity:
+#   ε = min(r_body, r_other) * 0.1
+# where r_other is the smallest radius inside an accepted node.
+#
+# θ trades accuracy for speed:
+#   θ = 0    → exact direct summation (slow)
+#   θ = 0.5  → typical, ~0.1–1 % force error
+#   θ ≥ 1    → fast but coarse
+#
+# ----------------------------------------------------------------------
+#
+# apply_gravity_barnes_hut(store, G, dt, theta=C.BH_THETA)
+# --------------------------------------------------------
+# Drop-in replacement for apply_gravity_all. World uses
+# barnes_hut_accelerations through its integrator instead.
+#
+# Scaling benchmark:
+#   python -m benchmarks.bench_barnes_hut   (run from python/)
+#
+# ======================================================================
+#                       IMPROVEMENT SECTION
+# ======================================================================
+#
+# 1. Quadrupole Moments
+#    - Improve accuracy of accepted nodes at the same θ.
+#
+# 2. Tree Reuse
+#    - Refit node masses instead of rebuilding every step.
+#
+# 3. C++ Traversal
+#    - Port the traversal loop to the native backend.
+#
+# ======================================================================
@@ -0,0 +1,365 @@
+# ============================================================
+# Batched Universes
+# ============================================================
+# K independent small simulations stored along a leading batch
+# axis: positions[k, i] is body i of universe k. Every stage
+# (gravity, integration, collisions, boundaries, damping) runs
+# as a few NumPy calls for all K universes at once.
+# ============================================================
+
+import numpy as np
+
+import utils.constants as C
+from physics.body_store import BodyStore
+
+
+# Gravity processes this many (universe x pair) entries at a time
+BATCH_BLOCK = 1 << 20
+
+
+class BatchedUniverses:
+    def __init__(self, universes, max_bodies, width=C.WIDTH, height=C.HEIGHT):
+        K, N = universes, max_bodies
+        self.width = width
+        self.height = height
+
+        # ----------------------------------------------------
+        # Bodies (inactive slots: zero mass/radius/velocity)
+        # ----------------------------------------------------
+        self.positions = np.zeros((K, N, 2))
+        self.velocities = np.zeros((K, N, 2))
+        self.masses = np.zeros((K, N))
+        self.inv_masses = np.zeros((K, N))
+        self.radii = np.zeros((K, N))
+        self.active = np.zeros((K, N), dtype=bool)
+
+        # Identity, carried along unchanged so unload() returns the
+        # same bodies: ids, material (MATERIAL_NAMES index) and colour
+        # (index into the batch-wide palette; 0 = white)
+        self.ids = np.zeros((K, N), dtype=np.int64)
+        self.material_index = np.full((K, N), -1, dtype=np.int16)
+        self.color_index = np.zeros((K, N), dtype=np.uint16)
+        self.palette = [tuple(C.WHITE)]
+        self._palette_index = {tuple(C.WHITE): 0}
+
+        # ----------------------------------------------------
+        # Per-universe parameters
+        # ----------------------------------------------------
+        self.G = np.full(K, float(C.G))
+        self.restitution = np.full(K, 0.6)
+        self.boundary_restitution = np.full(K, 0.9)
+        self.damping = np.ones(K)
+
+        # All pairs i < j in the brute-force order used by the World
+        self.pairs_i, self.pairs_j = np.triu_indices(N, k=1)
+
+        # Accelerations at the end of the last step (leapfrog cache)
+        self._acc = None
+
+        self.contacts = np.zeros(K, dtype=np.int64)
+        self.steps = 0
+
+    @property
+    def universes(self):
+        return self.positions.shape[0]
+
+    @property
+    def max_bodies(self):
+        return self.positions.shape[1]
+
+    def counts(self):
+        return self.active.sum(axis=1)
+
+    # --------------------------------------------------------
+    # Copy a BodyStore into universe k (and back)
+    # --------------------------------------------------------
+    def _color_to_index(self, color):
+        color = tuple(color)
+        index = self._palette_index.get(color)
+        if index is None:
+            index = len(self.palette)
+            self.palette.append(color)
+            self._palette_index[color] = index
+        return index
+
+    def load(self, k, store):
+        n = len(store)
+        if n > self.max_bodies:
+            raise ValueError(f"universe {k}: {n} bodies > max_bodies {self.max_bodies}")
+
+        for name in ("positions", "velocities", "masses", "inv_masses", "radii", "ids"):
+            column = getattr(self, name)[k]
+            column[:] = 0
+            column[:n] = getattr(store, name)[:n]
+        self.material_index[k] = -1
+        self.material_index[k, :n] = store.material_index[:n]
+
+        # The store's palette indices → batch palette indices
+        lookup = np.array([self._color_to_index(c) for c in store.palette] or [0],
+                          dtype=np.uint16)
+        self.color_index[k] = 0
+        self.color_index[k, :n] = lookup[store.color_index[:n]]
+
+        self.active[k] = False
+        self.active[k, :n] = True
+        self._acc = None
+
+    def unload(self, k):
+        # Same palette order as the batch, so colour indices carry over
+        store = BodyStore()
+        for color in self.palette:
+            store.color_to_index(color)
+
+        rows = np.flatnonzero(self.active[k])
+        start, end = store.add_many(
+            self.positions[k, rows], self.velocities[k, rows],
+            self.masses[k, rows], self.radii[k, rows],
+            self.palette[0], self.ids[k, rows]
+        )
+        store.material_index[start:end] = self.material_index[k, rows]
+        store.color_index[start:end] = self.color_index[k, rows]
+        return store
+
+    # --------------------------------------------------------
+    # Gravity: accelerations of every body of every universe
+    # --------------------------------------------------------
+    def accelerations(self):
+        K, N = self.masses.shape
+        out = np.zeros((K, N, 2))
+        block = max(1, BATCH_BLOCK // max(N * N, 1))
+
+        for k0 in range(0, K, block):
+            k1 = min(k0 + block, K)
+            x = self.positions[k0:k1]
+            r = self.radii[k0:k1]
+
+            # dx[k, i, j] = x_j − x_i
+            dx = x[:, None, :, 0] - x[:, :, None, 0]
+            dy = x[:, None, :, 1] - x[:, :, None, 1]
+            d2 = dx * dx + dy * dy
+            d = np.sqrt(d2)
+
+            # Same softening and pair factor as gravity_accelerations
+            soft = np.minimum(r[:, :, None], r[:, None, :]) * 0.1
+            d2 += soft * soft
+            d2 *= d
+            f = np.zeros_like(d2)
+            np.divide(self.G[k0:k1, None, None], d2, out=f, where=d2 > 0)
+
+            # Inactive bodies have zero mass: they pull nothing
+            m = self.masses[k0:k1, :, None]
+            out[k0:k1, :, 0] = ((dx * f) @ m)[..., 0]
+            out[k0:k1, :, 1] = ((dy * f) @ m)[..., 0]
+
+        out *= self.active[:, :, None]
+        return out
+
+    # --------------------------------------------------------
+    # Body-body collisions, pair by pair across all universes
+    # --------------------------------------------------------
+    def resolve_collisions(self):
+        x = self.positions
+        v = self.velocities
+        r = self.radii
+        m = self.masses
+        restitution = np.clip(self.restitution, 0.0, 1.0)
+
+        # Candidate pairs from the positions at the start of the
+        # sweep (bounding boxes overlap), as the World's broad phase
+        reach = r[:, self.pairs_i] + r[:, self.pairs_j]
+        delta = np.abs(x[:, self.pairs_i] - x[:, self.pairs_j])
+        candidate = (delta[..., 0] <= reach) & (delta[..., 1] <= reach)
+        candidate &= self.active[:, self.pairs_i] & self.active[:, self.pairs_j]
+
+        contacts = np.zeros(self.universes, dtype=np.int64)
+        for p in np.flatnonzero(candidate.any(axis=0)):
+            i = self.pairs_i[p]
+            j = self.pairs_j[p]
+            k = np.flatnonzero(candidate[:, p])
+
+            # Relative position (zero distance → scalar path fallback)
+            dx = x[k, j, 0] - x[k, i, 0]
+            dy = x[k, j, 1] - x[k, i, 1]
+            distance = np.hypot(dx, dy)
+            zero = distance == 0
+            dx[zero] = 1e-6
+            dy[zero] = 0
+            distance[zero] = 1e-6
+
+            overlap = r[k, i] + r[k, j] - distance
+            hit = overlap > 0
+            if not hit.any():
+                continue
+            k = k[hit]
+            overlap = overlap[hit]
+            contacts[k] += 1
+
+            nx = dx[hit] / distance[hit]
+            ny = dy[hit] / distance[hit]
+
+            # Positional correction (mass-weighted)
+            mass_a = m[k, i]
+            mass_b = m[k, j]
+            total_mass = mass_a + mass_b
+            x[k, i, 0] -= nx * overlap * (mass_b / total_mass)
+            x[k, i, 1] -= ny * overlap * (mass_b / total_mass)
+            x[k, j, 0] += nx * overlap * (mass_a / total_mass)
+            x[k, j, 1] += ny * overlap * (mass_a / total_mass)
+
+            # Impulse for closing pairs
+            vel_along_normal = (v[k, j, 0] - v[k, i, 0]) * nx + (v[k, j, 1] - v[k, i, 1]) * ny
+            closing = vel_along_normal <= 0
+            k = k[closing]
+            nx = nx[closing]
+            ny = ny[closing]
+            mass_a = mass_a[closing]
+            mass_b = mass_b[closing]
+
+            impulse = -(1 + restitution[k]) * vel_along_normal[closing]
+            impulse /= (self.inv_masses[k, i] + self.inv_masses[k, j])
+            ix = impulse * nx
+            iy = impulse * ny
+            v[k, i, 0] -= ix / mass_a
+            v[k, i, 1] -= iy / mass_a
+            v[k, j, 0] += ix / mass_b
+            v[k, j, 1] += iy / mass_b
+
+        return contacts
+
+    # --------------------------------------------------------
+    # Window walls (same order as BodyStore.handle_boundary_collisions)
+    # --------------------------------------------------------
+    def handle_boundary_collisions(self):
+        r = self.radii
+        bounce = -self.boundary_restitution[:, None]
+        moved = False
+
+        for axis, limit in ((0, self.width), (1, self.height)):
+            p = self.positions[..., axis]
+            v = self.velocities[..., axis]
+
+            hit = (p - r < 0) & self.active
+            p[hit] = r[hit]
+            v[:] = np.where(hit, v * bounce, v)
+            moved |= bool(hit.any())
+
+            hit = (p + r > limit) & self.active
+            p[hit] = limit - r[hit]
+            v[:] = np.where(hit, v * bounce, v)
+            moved |= bool(hit.any())
+
+        return moved
+
+    # --------------------------------------------------------
+    # One leapfrog (kick-drift-kick) step of every universe
+    # --------------------------------------------------------
+    def step(self, dt, collisions=True, boundaries=True):
+        a0 = self._acc if self._acc is not None else self.accelerations()
+
+        self.velocities += a0 * (0.5 * dt)
+        self.positions += self.velocities * dt
+        a1 = self.accelerations()
+        self.velocities += a1 * (0.5 * dt)
+        self._acc = a1
+
+        # Contacts/bounces move bodies: the cached forces are stale
+        if collisions:
+            self.contacts = self.resolve_collisions()
+            if self.contacts.any():
+                self._acc = None
+        if boundaries and self.handle_boundary_collisions():
+            self._acc = None
+
+        self.velocities *= self.damping[:, None, None]
+        self.steps += 1
+
+
+# ------------------------------------------------------------
+# Batch of universes built from Worlds (bodies + parameters)
+# ------------------------------------------------------------
+def batch_from_worlds(worlds):
+    batch = BatchedUniverses(
+        len(worlds), max(len(w) for w in worlds),
+        worlds[0].width, worlds[0].height
+    )
+    for k, world in enumerate(worlds):
+        batch.load(k, world.bodies)
+        batch.G[k] = world.G
+        batch.restitution[k] = world.restitution
+        batch.boundary_restitution[k] = world.boundary_restitution
+        batch.damping[k] = world.damping
+    return batch
+
+
+
+
+
+# ======================================================================
+#                           TEACHING SECTION
+# ======================================================================
+#
+# File: batched.py
+#
+# Role of this file:
+# ------------------
+# A 5-body solar system spends almost all of its step time in Python
+# and NumPy call overhead, not arithmetic. Running 1000 such systems
+# one World at a time pays that overhead 1000 times; a process per
+# system pays process start-up on top. Storing all systems in one set
+# of arrays pays it once per stage for all of them.
+#
+# ----------------------------------------------------------------------
+#
+# =========================
+# LAYOUT
+# =========================
+#
+#   positions  (K, N, 2)   velocities (K, N, 2)
+#   masses     (K, N)      radii      (K, N)      active (K, N)
+#   ids, material_index, color_index   (K, N)     palette (list)
+#   G, restitution, boundary_restitution, damping   (K,)
+#
+# K universes with up to N bodies each. Universes with fewer bodies
+# leave the remaining slots inactive: zero mass (no pull), zero radius,
+# zero velocity, masked out of collisions and boundaries.
+#
+# load(k, store) / unload(k) copy a BodyStore in and out. Ids,
+# materials and colours are not simulated, only carried: colours are
+# remapped into one batch-wide palette on load, and unload returns a
+# BodyStore with the same ids, materials and colours as the loaded one
+# (serials are new), ready for a World or the renderer.
+#
+# ----------------------------------------------------------------------
+#
+# =========================
+# STAGES (per step)
+# =========================
+#
+# 1. Gravity      : (K, N, N) pair arrays, batched matmul with masses;
+#                   processed in blocks of BATCH_BLOCK entries
+# 2. Integration  : kick-drift-kick leapfrog (the World's default
+#                   integrator); end-of-step forces reused unless a
+#                   contact or wall moved something
+# 3. Collisions   : loop over the N(N−1)/2 pair slots (i < j order, as
+#                   the World), each resolved for ALL universes where
+#                   it is a candidate in one vectorized update
+# 4. Boundaries   : same order as BodyStore.handle_boundary_collisions
+# 5. Damping      : velocities *= damping[k] (per step, as World.damping)
+#
+# Each universe evolves exactly like a World with the same bodies and
+# parameters, up to floating-point rounding:
+#   python -m benchmarks.bench_batched   (run from python/)
+#
+# Best for many SMALL universes: the gravity arrays are O(K N²).
+#
+# ======================================================================
+#                       IMPROVEMENT SECTION
+# ======================================================================
+#
+# 1. Sparse Collision Slots
+#    - Only loop over pair slots that were candidates last step.
+#
+# 2. Batched Integrators
+#    - Yoshida / block steps along the batch axis.
+#
+# ======================================================================
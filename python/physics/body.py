@@ -6,53 +6,144 @@
 # ============================================================
 
 
+from physics.body_store import BodyStore, MATERIAL_NAMES
+
+
 class Body:
-    def __init__(self, position, velocity, mass, radius, color, body_id):
-        # ----------------------------------------------------
-        # Core Physical Properties
-        # ----------------------------------------------------
-        self.position = position
-        self.velocity = velocity
-        self.mass = mass
-        self.radius = radius
+    # A Body is a view into one row of a BodyStore.
+    # Standalone bodies own a private one-row store until they are
+    # appended to a shared store (e.g. the simulation's body list).
+    __slots__ = ("_store", "_index")
 
+    def __init__(self, position, velocity, mass, radius, color, body_id, material=None):
         # ----------------------------------------------------
-        # Visual & Identity Properties
+        # Core Physical Properties + Visual & Identity Properties
         # ----------------------------------------------------
-        self.color = color
-        self.id = body_id
+        store = BodyStore(capacity=1)
+        store.add(position, velocity, mass, radius, color, body_id, material)
+
+        self._store = store
+        self._index = 0
+        store._views[0] = self
+
+    # --------------------------------------------------------
+    # Detach (called by the store when this row is removed)
+    # --------------------------------------------------------
+    def _detach(self):
+        store = BodyStore(capacity=1)
+        store.add(self.position, self.velocity, self.mass, self.radius,
+                  self.color, self.id, self.material)
+
+        self._store = store
+        self._index = 0
+        store._views[0] = self
+
+    # --------------------------------------------------------
+    # Row Accessors
+    # --------------------------------------------------------
+    @property
+    def store(self):
+        return self._store
+
+    @property
+    def index(self):
+        return self._index
+
+    @property
+    def position(self):
+        return self._store.positions[self._index]
+
+    @position.setter
+    def position(self, value):
+        self._store.positions[self._index] = value
+
+    @property
+    def velocity(self):
+        return self._store.velocities[self._index]
+
+    @velocity.setter
+    def velocity(self, value):
+        self._store.velocities[self._index] = value
+
+    @property
+    def mass(self):
+        return float(self._store.masses[self._index])
+
+    @mass.setter
+    def mass(self, value):
+        self._store.masses[self._index] = value
+        self._store.inv_masses[self._index] = 1.0 / value if value > 0 else 0.0
+
+    @property
+    def inverse_mass(self):
+        return float(self._store.inv_masses[self._index])
+
+    @property
+    def radius(self):
+        return float(self._store.radii[self._index])
+
+    @radius.setter
+    def radius(self, value):
+        self._store.radii[self._index] = value
+
+    @property
+    def color(self):
+        return self._store.palette[self._store.color_index[self._index]]
+
+    @color.setter
+    def color(self, value):
+        self._store.color_index[self._index] = self._store.color_to_index(value)
+
+    @property
+    def material(self):
+        index = self._store.material_index[self._index]
+        return MATERIAL_NAMES[index] if index >= 0 else None
+
+    @property
+    def id(self):
+        return int(self._store.ids[self._index])
+
+    @id.setter
+    def id(self, value):
+        self._store.ids[self._index] = value
 
     # --------------------------------------------------------
     # Position Update (Motion Integration)
     # --------------------------------------------------------
     def update(self, dt):
         # Update position using velocity and delta time
-        self.position[0] += self.velocity[0] * dt
-        self.position[1] += self.velocity[1] * dt
+        position = self.position
+        velocity = self.velocity
+        position[0] += velocity[0] * dt
+        position[1] += velocity[1] * dt
 
     # --------------------------------------------------------
     # Boundary Collision Handling
     # --------------------------------------------------------
     def handle_boundary_collision(self, width, height, restitution=0.9):
+        position = self.position
+        velocity = self.velocity
+        radius = self.radius
+
         # Left wall
-        if self.position[0] - self.radius < 0:
-            self.position[0] = self.radius
-            self.velocity[0] *= -restitution
+        if position[0] - radius < 0:
+            position[0] = radius
+            velocity[0] *= -restitution
 
         # Right wall
-        if self.position[0] + self.radius > width:
-            self.position[0] = width - self.radius
-            self.velocity[0] *= -restitution
+        if position[0] + radius > width:
+            position[0] = width - radius
+            velocity[0] *= -restitution
 
         # Top wall
-        if self.position[1] - self.radius < 0:
-            self.position[1] = self.radius
-            self.velocity[1] *= -restitution
+        if position[1] - radius < 0:
+            position[1] = radius
+            velocity[1] *= -restitution
 
         # Bottom wall
-        if self.position[1] + self.radius > height:
-            self.position[1] = height - self.radius
-            self.velocity[1] *= -restitution
+        if position[1] + radius > height:
+            position[1] = height - radius
+            velocity[1] *= -restitution
 
 
 
@@ -71,10 +162,13 @@ class Body:
 # collision, and rendering is represented as a Body instance.
 #
 # The Body class itself is intentionally lightweight:
-#   - It stores physical state
+#   - It is a view into one row of a BodyStore (physics/body_store.py)
 #   - It updates its own position
 #   - It handles boundary collisions
 #
+# The state itself lives in the store's NumPy arrays, so whole-array
+# kernels and per-body code (input, rendering) see the same data.
+#
 # Higher-level interactions (gravity, body-body collisions, rendering)
 # are handled externally to keep responsibilities clean.
 #
@@ -88,8 +182,8 @@ class Body:
 #
 # ----------------------------------------------------------------------
 #
-# __init__(self, position, velocity, mass, radius, color, body_id)
-# ----------------------------------------------------------------
+# __init__(self, position, velocity, mass, radius, color, body_id, material=None)
+# ------------------------------------------------------------------------------
 # Inputs:
 #   - position : list[float, float]
 #   - velocity : list[float, float]
@@ -97,10 +191,11 @@ class Body:
 #   - radius   : int / float
 #   - color    : tuple[int, int, int]
 #   - body_id  : int
+#   - material : str or None (key of utils.constants.MATERIALS)
 # Purpose:
-#   - Initializes the physical and visual state of the body
-#   - Stores identity for tracking and debugging
-#   - Acts as a data container for simulation systems
+#   - Creates a standalone body backed by a private one-row store
+#   - bodies.append(body) on a BodyStore moves it into the shared store
+#     (the same Body object stays valid and now points at the new row)
 #
 # ----------------------------------------------------------------------
 #
@@ -140,13 +235,14 @@ class Body:
 # DATA MODEL SUMMARY
 # =========================
 #
-# Body Attributes:
-#   position : [x, y]
-#   velocity : [vx, vy]
-#   mass     : scalar mass value
+# Body Attributes (all read from / written to the backing store):
+#   position : [x, y]    (NumPy row view, writable)
+#   velocity : [vx, vy]  (NumPy row view, writable)
+#   mass     : scalar mass value (setting it refreshes inverse_mass)
 #   radius   : collision & rendering size
 #   color    : RGB tuple for rendering
 #   id       : unique identifier
+#   material : material name or None
 #
 # ----------------------------------------------------------------------
 #
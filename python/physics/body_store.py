@@ -0,0 +1,410 @@
+# ============================================================
+# Body Store (Structure of Arrays)
+# ============================================================
+# Holds the state of every body in contiguous NumPy arrays.
+# Body objects are lightweight views into one row of a store.
+# ============================================================
+
+import numpy as np
+
+import utils.constants as C
+
+
+# Material names in a fixed order (row material index → name)
+MATERIAL_NAMES = tuple(C.MATERIALS.keys())
+_MATERIAL_INDEX = {name: i for i, name in enumerate(MATERIAL_NAMES)}
+
+# Smallest capacity allocated when a store first grows
+MIN_CAPACITY = 16
+
+# Per-row columns (checkpoints save exactly these)
+COLUMNS = (
+    "positions", "velocities", "masses", "inv_masses", "radii",
+    "material_index", "color_index", "ids", "serials",
+)
+
+
+class BodyStore:
+    def __init__(self, capacity=MIN_CAPACITY):
+        # ----------------------------------------------------
+        # Row Count & Allocation
+        # ----------------------------------------------------
+        self.count = 0
+        self.capacity = 0
+
+        # Next serial handed out (stable per-body key, never reused)
+        self.next_serial = 0
+
+        # ----------------------------------------------------
+        # Colour Palette (row colour index → RGB tuple)
+        # ----------------------------------------------------
+        self.palette = []
+        self._palette_index = {}
+
+        # ----------------------------------------------------
+        # Cached Body views (one slot per row, created lazily)
+        # ----------------------------------------------------
+        self._views = []
+
+        self._allocate(max(int(capacity), 1))
+
+    # --------------------------------------------------------
+    # Column Allocation (amortized doubling growth)
+    # --------------------------------------------------------
+    def _allocate(self, capacity):
+        n = self.count
+
+        positions = np.zeros((capacity, 2), dtype=np.float64)
+        velocities = np.zeros((capacity, 2), dtype=np.float64)
+        masses = np.zeros(capacity, dtype=np.float64)
+        inv_masses = np.zeros(capacity, dtype=np.float64)
+        radii = np.zeros(capacity, dtype=np.float64)
+        material_index = np.full(capacity, -1, dtype=np.int16)
+        color_index = np.zeros(capacity, dtype=np.uint16)
+        ids = np.zeros(capacity, dtype=np.int64)
+        serials = np.zeros(capacity, dtype=np.int64)
+
+        if self.capacity:
+            positions[:n] = self.positions[:n]
+            velocities[:n] = self.velocities[:n]
+            masses[:n] = self.masses[:n]
+            inv_masses[:n] = self.inv_masses[:n]
+            radii[:n] = self.radii[:n]
+            material_index[:n] = self.material_index[:n]
+            color_index[:n] = self.color_index[:n]
+            ids[:n] = self.ids[:n]
+            serials[:n] = self.serials[:n]
+
+        self.positions = positions
+        self.velocities = velocities
+        self.masses = masses
+        self.inv_masses = inv_masses
+        self.radii = radii
+        self.material_index = material_index
+        self.color_index = color_index
+        self.ids = ids
+        self.serials = serials
+
+        self._views.extend([None] * (capacity - len(self._views)))
+        self.capacity = capacity
+
+    def reserve(self, capacity):
+        if capacity > self.capacity:
+            self._allocate(max(capacity, self.capacity * 2, MIN_CAPACITY))
+
+    # --------------------------------------------------------
+    # Store over existing column arrays (e.g. memory-mapped from
+    # a checkpoint); nothing is copied until the store grows
+    # --------------------------------------------------------
+    @classmethod
+    def from_columns(cls, columns, palette=(), next_serial=None):
+        store = cls()
+        n = len(columns["positions"])
+        for name in COLUMNS:
+            setattr(store, name, columns[name])
+        store.count = store.capacity = n
+        store._views = [None] * n
+
+        for color in palette:
+            store.color_to_index(color)
+        if next_serial is None:
+            next_serial = int(store.serials[:n].max()) + 1 if n else 0
+        store.next_serial = next_serial
+        return store
+
+    # --------------------------------------------------------
+    # Palette / Material Lookup
+    # --------------------------------------------------------
+    def color_to_index(self, color):
+        color = tuple(color)
+        index = self._palette_index.get(color)
+        if index is None:
+            index = len(self.palette)
+            self.palette.append(color)
+            self._palette_index[color] = index
+        return index
+
+    def palette_array(self):
+        # (palette_size, 3) uint8 array, handy for vectorized renderers
+        if not self.palette:
+            return np.zeros((0, 3), dtype=np.uint8)
+        return np.array(self.palette, dtype=np.uint8)
+
+    # --------------------------------------------------------
+    # Adding Bodies
+    # --------------------------------------------------------
+    def next_id(self):
+        # One past the largest id in use: every spawner numbers from
+        # here, so ids never collide
+        n = self.count
+        return int(self.ids[:n].max()) + 1 if n else 1
+
+    def add(self, position, velocity, mass, radius, color, body_id, material=None):
+        self.reserve(self.count + 1)
+        i = self.count
+
+        self.positions[i] = position
+        self.velocities[i] = velocity
+        self.masses[i] = mass
+        self.inv_masses[i] = 1.0 / mass if mass > 0 else 0.0
+        self.radii[i] = radius
+        self.material_index[i] = _MATERIAL_INDEX.get(material, -1)
+        self.color_index[i] = self.color_to_index(color)
+        self.ids[i] = body_id
+        self.serials[i] = self.next_serial
+
+        self.next_serial += 1
+        self.count += 1
+        return self.view(i)
+
+    def add_many(self, positions, velocities, masses, radii, color, ids, material=None):
+        # Bulk insert of k bodies sharing one colour / material
+        masses = np.asarray(masses, dtype=np.float64)
+        k = len(masses)
+        self.reserve(self.count + k)
+        start, end = self.count, self.count + k
+
+        self.positions[start:end] = positions
+        self.velocities[start:end] = velocities
+        self.masses[start:end] = masses
+        self.inv_masses[start:end] = 0.0
+        np.divide(1.0, masses, out=self.inv_masses[start:end], where=masses > 0)
+        self.radii[start:end] = radii
+        self.material_index[start:end] = _MATERIAL_INDEX.get(material, -1)
+        self.color_index[start:end] = self.color_to_index(color)
+        self.ids[start:end] = ids
+        self.serials[start:end] = np.arange(self.next_serial, self.next_serial + k)
+
+        self.next_serial += k
+        self.count = end
+        return start, end
+
+    # --------------------------------------------------------
+    # List-style API (keeps existing callers working)
+    # --------------------------------------------------------
+    def append(self, body):
+        # Copy a (usually standalone) Body into this store and
+        # re-point the same object at its new row
+        if body._store is self:
+            return
+
+        self.add(
+            body.position,
+            body.velocity,
+            body.mass,
+            body.radius,
+            body.color,
+            body.id,
+            body.material
+        )
+        i = self.count - 1
+        body._store = self
+        body._index = i
+        self._views[i] = body
+
+    def remove(self, body):
+        if body._store is not self:
+            raise ValueError("body does not belong to this store")
+        self.remove_at(body._index)
+
+    def remove_at(self, index):
+        # Swap-remove: the last row moves into the freed slot
+        n = self.count
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("body index out of range")
+
+        removed = self._views[index]
+        if removed is not None:
+            removed._detach()
+
+        last = n - 1
+        if index != last:
+            self.positions[index] = self.positions[last]
+            self.velocities[index] = self.velocities[last]
+            self.masses[index] = self.masses[last]
+            self.inv_masses[index] = self.inv_masses[last]
+            self.radii[index] = self.radii[last]
+            self.material_index[index] = self.material_index[last]
+            self.color_index[index] = self.color_index[last]
+            self.ids[index] = self.ids[last]
+            self.serials[index] = self.serials[last]
+
+            moved = self._views[last]
+            self._views[index] = moved
+            if moved is not None:
+                moved._index = index
+        else:
+            self._views[index] = None
+
+        self._views[last] = None
+        self.count = last
+
+    def clear(self):
+        for i in range(self.count):
+            view = self._views[i]
+            if view is not None:
+                view._detach()
+                self._views[i] = None
+        self.count = 0
+
+    def view(self, index):
+        body = self._views[index]
+        if body is None:
+            from physics.body import Body
+            body = Body.__new__(Body)
+            body._store = self
+            body._index = index
+            self._views[index] = body
+        return body
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        n = self.count
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("body index out of range")
+        return self.view(index)
+
+    def __iter__(self):
+        for i in range(self.count):
+            yield self.view(i)
+
+    def __reversed__(self):
+        for i in range(self.count - 1, -1, -1):
+            yield self.view(i)
+
+    # --------------------------------------------------------
+    # Whole-Array Kernels (mirror the per-body methods)
+    # --------------------------------------------------------
+    def update(self, dt):
+        n = self.count
+        self.positions[:n] += self.velocities[:n] * dt
+
+    def handle_boundary_collisions(self, width, height, restitution=0.9):
+        n = self.count
+        pos = self.positions[:n]
+        vel = self.velocities[:n]
+        r = self.radii[:n]
+
+        # Checked in the same order as Body.handle_boundary_collision
+        for axis, limit in ((0, width), (1, height)):
+            p = pos[:, axis]
+            v = vel[:, axis]
+
+            hit = p - r < 0
+            p[hit] = r[hit]
+            v[hit] *= -restitution
+
+            hit = p + r > limit
+            p[hit] = limit - r[hit]
+            v[hit] *= -restitution
+
+    def apply_damping(self, coeff):
+        self.velocities[:self.count] *= coeff
+
+
+
+
+
+# ======================================================================
+#                           TEACHING SECTION
+# ======================================================================
+#
+# File: body_store.py
+#
+# Role of this file:
+# ------------------
+# This file stores every body of a simulation in a handful of NumPy
+# arrays ("structure of arrays") instead of one Python object per body.
+# Physics kernels can then process all bodies with a single array
+# operation instead of an interpreted loop.
+#
+# ----------------------------------------------------------------------
+#
+# =========================
+# CLASS: BodyStore
+# =========================
+#
+# Columns (row i describes one body):
+#   positions      : float64 (capacity, 2)
+#   velocities     : float64 (capacity, 2)
+#   masses         : float64 (capacity,)
+#   inv_masses     : float64 (capacity,)  cached 1 / mass (0 for mass 0)
+#   radii          : float64 (capacity,)
+#   material_index : int16   (capacity,)  index into MATERIAL_NAMES, -1 = none
+#   color_index    : uint16  (capacity,)  index into store.palette
+#   ids            : int64   (capacity,)
+#   serials        : int64   (capacity,)  store-assigned key, never reused
+#
+# Only the first `count` rows are live. Kernels slice `[:count]`.
+#
+# Row indices change on swap-remove; serials do not, so systems that
+# keep per-body state across frames key it by serial (the AABB tree
+# compares them to tell moved rows from added / removed bodies).
+#
+# Memory per body: 76 bytes of column data.
+#
+# ----------------------------------------------------------------------
+#
+# add(...) / add_many(...)
+# ------------------------
+# Appends one row (returning its Body view) or k rows in bulk.
+# When full, capacity doubles → amortized O(1) per insertion.
+#
+# next_id()
+# ---------
+# Largest id in use + 1. World.add_body, the presets and the UI's N key
+# all number new bodies from it, so their ids never collide.
+#
+# append(body)
+# ------------
+# List-compatible: copies a standalone Body into the store and
+# re-points that same object at its new row.
+#
+# remove(body) / remove_at(index)
+# -------------------------------
+# Swap-remove in O(1): the last row is moved into the freed slot and
+# its view is re-pointed. Row order is therefore NOT stable.
+# A removed Body keeps its values in a private one-row store.
+#
+# from_columns(columns, palette, next_serial)
+# -------------------------------------------
+# Builds a store whose columns ARE the given arrays (all of COLUMNS,
+# `count` rows each, capacity = count). Loading a memory-mapped
+# checkpoint this way reads pages only as kernels touch them; the
+# first insertion copies everything into fresh, larger arrays.
+#
+# update / handle_boundary_collisions / apply_damping
+# ---------------------------------------------------
+# Whole-array versions of Body.update, Body.handle_boundary_collision
+# and the damping step of the simulation loop.
+#
+# ----------------------------------------------------------------------
+#
+# =========================
+# IMPORTANT NOTE ON VIEWS
+# =========================
+#
+# body.position returns a row view of store.positions. Growing the store
+# reallocates the arrays, so do not keep the returned row across a spawn;
+# read body.position again instead.
+#
+# ======================================================================
+#                       IMPROVEMENT SECTION
+# ======================================================================
+#
+# 1. Shared Memory Backing
+#    - Allocate columns inside shared memory for multi-process kernels.
+#
+# 2. Float32 Mode
+#    - Halve bandwidth for very large scenes.
+#
+# 3. C++ Backend Compatibility
+#    - Columns map 1:1 onto a C++ SoA layout.
+#
+# ======================================================================
@@ -0,0 +1,372 @@
+# ============================================================
+# Broad Phase (Uniform-Grid Spatial Hash)
+# ============================================================
+# Finds the few body pairs that may touch, so collision
+# resolution does not have to test every pair.
+# ============================================================
+
+import numpy as np
+
+
+# Cell size = CELL_FACTOR * this percentile of the radii
+RADIUS_PERCENTILE = 90
+CELL_FACTOR = 2.0
+
+# Upper bound on grid cells per body (keeps the grid sparse-safe)
+MAX_CELLS_PER_BODY = 4
+
+# Half of the 3x3 neighbourhood (the other half is covered by
+# the neighbouring cell looking back), excluding the cell itself
+HALF_NEIGHBOURS = ((1, -1), (1, 0), (1, 1), (0, 1))
+
+# Oversized-vs-all tests are done in blocks of this many pairs
+OVERSIZED_BLOCK = 1 << 22
+
+
+# ------------------------------------------------------------
+# Concatenate index ranges [start, start + count) (vectorized)
+# ------------------------------------------------------------
+def _expand_ranges(starts, counts):
+    total = int(counts.sum())
+    offsets = np.repeat(np.cumsum(counts) - counts, counts)
+    return np.repeat(starts, counts) + (np.arange(total) - offsets)
+
+
+# ------------------------------------------------------------
+# Uniform grid rebuilt every frame (bodies bucketed by a stable
+# argsort of their cell ids)
+# ------------------------------------------------------------
+class SpatialHash:
+    def __init__(self, cell_size=None):
+        # Fixed cell size, or None to pick it from the radii
+        self.fixed_cell_size = cell_size
+
+        # Grid layout of the last build
+        self.cell_size = 0.0
+        self.origin = np.zeros(2)
+        self.shape = (0, 0)
+
+        # Bucket arrays of the last build
+        self.order = np.zeros(0, dtype=np.intp)      # body indices grouped by cell
+        self.starts = np.zeros(0, dtype=np.intp)     # first slot of each cell
+        self.counts = np.zeros(0, dtype=np.intp)     # bodies per cell
+        self.cells = np.zeros((0, 2), dtype=np.intp)  # (cx, cy) of each slot
+        self.gridded = np.zeros(0, dtype=np.intp)    # bodies stored in the grid
+        self.oversized = np.zeros(0, dtype=np.intp)  # bodies too big for a cell
+        self.serials = np.zeros(0, dtype=np.int64)   # store rows of the last build
+
+        # Statistics of the last query
+        self.pair_tests = 0
+
+    # --------------------------------------------------------
+    # Cell size from the radius distribution
+    # --------------------------------------------------------
+    def choose_cell_size(self, radii):
+        if self.fixed_cell_size is not None:
+            return self.fixed_cell_size
+        size = CELL_FACTOR * float(np.percentile(radii, RADIUS_PERCENTILE))
+        return size if size > 0 else 1.0
+
+    # --------------------------------------------------------
+    # Bucket bodies by cell
+    # --------------------------------------------------------
+    def build(self, positions, radii):
+        n = len(radii)
+        if n == 0:
+            self.order = self.gridded = self.oversized = np.zeros(0, dtype=np.intp)
+            self.counts = self.starts = np.zeros(0, dtype=np.intp)
+            self.cells = np.zeros((0, 2), dtype=np.intp)
+            return
+
+        lo = positions.min(axis=0)
+        span = positions.max(axis=0) - lo
+        cell = self.choose_cell_size(radii)
+
+        # Never allocate more than MAX_CELLS_PER_BODY cells per body
+        max_cells = MAX_CELLS_PER_BODY * n + 16
+        while (int(span[0] / cell) + 1) * (int(span[1] / cell) + 1) > max_cells:
+            cell *= 2.0
+
+        gx = int(span[0] / cell) + 1
+        gy = int(span[1] / cell) + 1
+        self.cell_size = cell
+        self.origin = lo
+        self.shape = (gx, gy)
+
+        # Bodies wider than a cell are tested separately; every
+        # other body only reaches into the 3x3 cells around it
+        small = 2.0 * radii <= cell
+        self.gridded = np.flatnonzero(small)
+        self.oversized = np.flatnonzero(~small)
+
+        cells = ((positions[self.gridded] - lo) / cell).astype(np.intp)
+        np.minimum(cells, (gx - 1, gy - 1), out=cells)
+
+        # Histogram + prefix sum give each bucket's slot range; a
+        # stable argsort of the cell ids lays the bodies out bucket
+        # by bucket (on uint16 ids NumPy's stable sort is a radix
+        # sort)
+        cell_id = cells[:, 0] * gy + cells[:, 1]
+        if gx * gy <= np.iinfo(np.uint16).max:
+            cell_id = cell_id.astype(np.uint16)
+
+        self.counts = np.bincount(cell_id, minlength=gx * gy)
+        self.starts = np.cumsum(self.counts) - self.counts
+        perm = np.argsort(cell_id, kind="stable")
+        self.order = self.gridded[perm]
+        self.cells = cells[perm]
+
+    # --------------------------------------------------------
+    # Oversized bodies against all bodies (AABB-filtered)
+    # --------------------------------------------------------
+    def _oversized_pairs(self, positions, radii):
+        n = len(radii)
+        others = np.arange(n)
+        is_big = np.zeros(n, dtype=bool)
+        is_big[self.oversized] = True
+
+        firsts = []
+        seconds = []
+        rows = max(1, OVERSIZED_BLOCK // n)
+        for k in range(0, len(self.oversized), rows):
+            big = self.oversized[k:k + rows]
+            reach = radii[big, None] + radii[None, :]
+            hit = np.abs(positions[big, 0, None] - positions[None, :, 0]) <= reach
+            hit &= np.abs(positions[big, 1, None] - positions[None, :, 1]) <= reach
+
+            # Skip self pairs; pairs of two oversized bodies only once
+            hit &= ~is_big[None, :] | (others[None, :] > big[:, None])
+
+            r, c = np.nonzero(hit)
+            firsts.append(big[r])
+            seconds.append(c)
+
+        self.pair_tests += len(self.oversized) * n
+        return np.concatenate(firsts), np.concatenate(seconds)
+
+    # --------------------------------------------------------
+    # Candidate pairs (i < j, sorted) whose AABBs overlap
+    # --------------------------------------------------------
+    def candidate_pairs(self, positions, radii):
+        self.build(positions, radii)
+        n = len(radii)
+        gx, gy = self.shape
+
+        firsts = []
+        seconds = []
+
+        if len(self.order):
+            cx = self.cells[:, 0]
+            cy = self.cells[:, 1]
+            cell_id = cx * gy + cy
+            slot = np.arange(len(self.order))
+
+            # Same cell: every later body of the bucket
+            later = self.starts[cell_id] + self.counts[cell_id] - slot - 1
+            firsts.append(np.repeat(self.order, later))
+            seconds.append(self.order[_expand_ranges(slot + 1, later)])
+
+            # Half of the neighbouring cells
+            for ox, oy in HALF_NEIGHBOURS:
+                nx = cx + ox
+                ny = cy + oy
+                valid = (nx >= 0) & (nx < gx) & (ny >= 0) & (ny < gy)
+                neighbour = nx[valid] * gy + ny[valid]
+                count = self.counts[neighbour]
+                firsts.append(np.repeat(self.order[valid], count))
+                seconds.append(self.order[_expand_ranges(self.starts[neighbour], count)])
+
+        a = np.concatenate(firsts) if firsts else np.zeros(0, dtype=np.intp)
+        b = np.concatenate(seconds) if seconds else np.zeros(0, dtype=np.intp)
+        self.pair_tests = len(a)
+
+        # AABB overlap filter
+        reach = radii[a] + radii[b]
+        delta = np.abs(positions[a] - positions[b])
+        hit = (delta[:, 0] <= reach) & (delta[:, 1] <= reach)
+        a = a[hit]
+        b = b[hit]
+
+        # Oversized bodies: tested against every body
+        if len(self.oversized):
+            big_a, big_b = self._oversized_pairs(positions, radii)
+            a = np.concatenate((a, big_a))
+            b = np.concatenate((b, big_b))
+
+        # Canonical (i < j) order, sorted like the brute-force loop
+        i = np.minimum(a, b)
+        j = np.maximum(a, b)
+        sort = np.argsort(i * n + j, kind="stable")
+        return i[sort], j[sort]
+
+
+    # --------------------------------------------------------
+    # Same query for all bodies of a BodyStore
+    # --------------------------------------------------------
+    def candidate_pairs_for(self, store):
+        n = len(store)
+        self.serials = store.serials[:n].copy()
+        return self.candidate_pairs(store.positions[:n], store.radii[:n])
+
+    # --------------------------------------------------------
+    # Re-bucket a BodyStore without a pair query
+    # --------------------------------------------------------
+    def sync(self, store):
+        n = len(store)
+        self.serials = store.serials[:n].copy()
+        self.build(store.positions[:n], store.radii[:n])
+
+    # --------------------------------------------------------
+    # Take over another hash's buckets (what queries need)
+    # --------------------------------------------------------
+    def copy_from(self, other):
+        self.cell_size = other.cell_size
+        self.origin = other.origin.copy()
+        self.shape = other.shape
+        self.order = other.order.copy()
+        self.starts = other.starts.copy()
+        self.counts = other.counts.copy()
+        self.oversized = other.oversized.copy()
+        self.serials = other.serials.copy()
+
+    # --------------------------------------------------------
+    # Rows of the bodies whose AABB overlaps a region
+    # --------------------------------------------------------
+    def query_region(self, store, x0, y0, x1, y1):
+        n = len(store)
+        if len(self.serials) != n or not np.array_equal(self.serials, store.serials[:n]):
+            self.sync(store)
+
+        # Cells the region reaches, grown by the largest gridded
+        # radius (half a cell): bodies are bucketed by their center
+        candidates = [self.oversized]
+        if len(self.order):
+            gx, gy = self.shape
+            reach = 0.5 * self.cell_size
+            cx0, cy0 = np.floor((np.array([x0, y0]) - reach - self.origin) / self.cell_size)
+            cx1, cy1 = np.floor((np.array([x1, y1]) + reach - self.origin) / self.cell_size)
+            cx0, cy0 = max(int(cx0), 0), max(int(cy0), 0)
+            cx1, cy1 = min(int(cx1), gx - 1), min(int(cy1), gy - 1)
+
+            # Cells (cx, cy0..cy1) of one grid column are adjacent
+            # cell ids, so each column is one slot range
+            if cx0 <= cx1 and cy0 <= cy1:
+                first = np.arange(cx0, cx1 + 1) * gy + cy0
+                last = first + (cy1 - cy0)
+                begin = self.starts[first]
+                counts = self.starts[last] + self.counts[last] - begin
+                candidates.append(self.order[_expand_ranges(begin, counts)])
+
+        rows = np.concatenate(candidates)
+        positions = store.positions[:n][rows]
+        radii = store.radii[:n][rows]
+        inside = ((positions[:, 0] + radii >= x0) & (positions[:, 0] - radii <= x1)
+                  & (positions[:, 1] + radii >= y0) & (positions[:, 1] - radii <= y1))
+        return np.sort(rows[inside])
+
+
+# ------------------------------------------------------------
+# Reference: all overlapping pairs by brute force
+# ------------------------------------------------------------
+def brute_force_pairs(positions, radii):
+    n = len(radii)
+    i, j = np.triu_indices(n, k=1)
+    reach = radii[i] + radii[j]
+    delta = np.abs(positions[i] - positions[j])
+    hit = (delta[:, 0] <= reach) & (delta[:, 1] <= reach)
+    return i[hit], j[hit]
+
+
+
+
+
+# ======================================================================
+#                           TEACHING SECTION
+# ======================================================================
+#
+# File: broad_phase.py
+#
+# Role of this file:
+# ------------------
+# Collision detection is split in two phases:
+#   - Broad phase  : cheaply find pairs that MIGHT touch (this file)
+#   - Narrow phase : exact test + response (physics/collision.py)
+#
+# Testing every pair is O(n²) even though almost none touch. A uniform
+# grid reduces the work to roughly O(n) for typical scenes.
+#
+# ----------------------------------------------------------------------
+#
+# =========================
+# CLASS: SpatialHash
+# =========================
+#
+# build(positions, radii)
+# -----------------------
+#   1. Cell size = 2 * (90th percentile radius), so most bodies fit
+#      inside one cell and can only touch bodies in the 3x3 cells
+#      around them
+#   2. Bodies wider than a cell ("oversized") are kept in a separate
+#      list and tested against everyone
+#   3. Bodies are bucketed by cell id:
+#        counts = histogram of cell ids         (np.bincount)
+#        starts = prefix sum of counts           (np.cumsum)
+#        order  = bodies laid out bucket by bucket, in body order
+#                 within a bucket    (np.argsort(cell_id, kind="stable"))
+#      This is not a counting sort: NumPy has no vectorized scatter
+#      that places equal keys in order, so order comes from a stable
+#      argsort. While the grid has at most 65535 cells the ids are
+#      cast to uint16, for which NumPy's stable sort is a radix sort
+#      (≈ 3x faster than on int64 ids at 2000–20000 bodies).
+#      Only flat arrays are rebuilt; no dicts or lists per cell.
+#
+# candidate_pairs(positions, radii)
+# ---------------------------------
+#   - Same cell pairs + 4 of the 8 neighbour cells (the other 4 are
+#     covered from the other side, so no pair appears twice)
+#   - Oversized bodies against all bodies
+#   - Pairs whose bounding boxes do not overlap are dropped
+#   - Returns (i, j) arrays with i < j, sorted like the nested
+#     brute-force loop, so resolving them in order visits the same
+#     touching pairs in the same order
+#   - Note: the pairs are found from the positions at the start of the
+#     sweep. In densely packed piles a positional correction can push a
+#     body into a NEW contact mid-sweep; the brute-force loop resolves it
+#     in the same sweep, the broad phase one frame later.
+#
+# candidate_pairs_for(store) runs the same query on a BodyStore; the
+# AABB tree broad phase (physics/aabb_tree.py) offers the same method.
+#
+# query_region(store, x0, y0, x1, y1)
+# -----------------------------------
+#   - Rows (sorted) of the bodies whose AABB overlaps the region, e.g.
+#     the camera view (renderer/camera.py)
+#   - Reuses the buckets of the last build: one slot range per grid
+#     column, so the cost follows the bodies near the region, not n
+#   - Re-buckets first (sync) if the store's rows changed since
+#
+# copy_from(other) copies the buckets of another hash, so a physics
+# snapshot (core/physics_worker.py) can answer view queries without
+# re-bucketing and without touching the live hash.
+#
+# pair_tests holds the number of pairs examined by the last query.
+#
+# ----------------------------------------------------------------------
+#
+# brute_force_pairs(positions, radii)
+# -----------------------------------
+# O(n²) reference producing exactly the same pair list. The broad phase
+# benchmark checks both agree before timing anything:
+#   python -m benchmarks.bench_broad_phase   (run from python/)
+#
+# ======================================================================
+#                       IMPROVEMENT SECTION
+# ======================================================================
+#
+# 1. Hierarchical Grids
+#    - One grid per radius class for extreme size ranges.
+#
+# 2. Incremental Updates
+#    - Only re-bucket bodies that changed cell.
+#
+# ======================================================================
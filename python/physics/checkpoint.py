@@ -0,0 +1,308 @@
+# ============================================================
+# World Checkpoints (Binary, Columnar, Memory-Mappable)
+# ============================================================
+# Saves every body column plus the World's parameters to one
+# file and restores them, on this machine or another. Columns
+# are stored raw and aligned, so loading maps the file instead
+# of parsing it, and saving writes from a copy on a background
+# thread.
+# ============================================================
+
+import json
+import os
+import queue
+import struct
+import threading
+from time import perf_counter
+
+import numpy as np
+
+from physics.body_store import COLUMNS, MATERIAL_NAMES, BodyStore
+from physics.world import BROAD_PHASES, INTEGRATORS, World
+
+
+# File layout version (bump when the layout changes)
+VERSION = 1
+
+MAGIC = b"UNIVCKPT"
+
+# magic, version, header bytes (little endian)
+_PREAMBLE = struct.Struct("<8sII")
+
+# Column data starts at multiples of this many bytes
+ALIGN = 64
+
+# World attributes saved with the bodies
+WORLD_FIELDS = (
+    "width", "height", "G", "damping", "restitution", "boundary_restitution",
+    "gravity_enabled", "collisions_enabled", "boundaries_enabled",
+    "gravity_solver", "steps",
+)
+
+
+def _align(offset):
+    return -(-offset // ALIGN) * ALIGN
+
+
+# ------------------------------------------------------------
+# Consistent copy of a World (call between two steps)
+# ------------------------------------------------------------
+def capture(world, meta=None):
+    store = world.bodies
+    n = len(store)
+    columns = {name: getattr(store, name)[:n].copy() for name in COLUMNS}
+
+    params = {field: getattr(world, field) for field in WORLD_FIELDS}
+    params["integrator"] = world.integrator.name
+    params["broad_phase"] = next(
+        name for name, cls in BROAD_PHASES.items() if isinstance(world.broad_phase, cls)
+    )
+
+    header = {
+        "count": n,
+        "next_serial": int(store.next_serial),
+        "palette": [[int(v) for v in color] for color in store.palette],
+        "materials": list(MATERIAL_NAMES),
+        "world": params,
+        "meta": dict(meta or {}),
+    }
+    return header, columns
+
+
+# ------------------------------------------------------------
+# Write: preamble, JSON header, aligned raw columns
+# ------------------------------------------------------------
+def write_checkpoint(path, header, columns):
+    # Column offsets are relative to the first aligned byte
+    # after the header
+    layout = []
+    offset = 0
+    for name in COLUMNS:
+        array = columns[name]
+        offset = _align(offset)
+        layout.append({"name": name, "dtype": array.dtype.str,
+                       "shape": list(array.shape), "offset": offset})
+        offset += array.nbytes
+
+    blob = json.dumps(dict(header, version=VERSION, columns=layout)).encode()
+    data_start = _align(_PREAMBLE.size + len(blob))
+
+    # Write next to the target, then swap it in: a crash mid-write
+    # never leaves a truncated checkpoint behind
+    partial = path + ".partial"
+    with open(partial, "wb") as f:
+        f.write(_PREAMBLE.pack(MAGIC, VERSION, len(blob)))
+        f.write(blob)
+        for entry in layout:
+            f.seek(data_start + entry["offset"])
+            f.write(np.ascontiguousarray(columns[entry["name"]]).data)
+    os.replace(partial, path)
+
+
+def save_checkpoint(world, path, meta=None):
+    write_checkpoint(path, *capture(world, meta))
+
+
+# ------------------------------------------------------------
+# Read: header + columns (memory-mapped, copy-on-write)
+# ------------------------------------------------------------
+def read_checkpoint(path, mmap=True):
+    with open(path, "rb") as f:
+        preamble = f.read(_PREAMBLE.size)
+        if len(preamble) < _PREAMBLE.size:
+            raise ValueError(f"{path} is not a checkpoint")
+        magic, version, size = _PREAMBLE.unpack(preamble)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a checkpoint")
+        if version > VERSION:
+            raise ValueError(f"checkpoint version {version} is newer than supported ({VERSION})")
+        header = json.loads(f.read(size))
+    data_start = _align(_PREAMBLE.size + size)
+
+    columns = {}
+    for entry in header["columns"]:
+        dtype = np.dtype(entry["dtype"])
+        shape = tuple(entry["shape"])
+        offset = data_start + entry["offset"]
+        count = int(np.prod(shape))
+
+        # Writes go to private pages, never back to the file
+        if mmap and count:
+            array = np.memmap(path, dtype, "c", offset, shape).view(np.ndarray)
+        else:
+            array = np.fromfile(path, dtype, count=count, offset=offset).reshape(shape)
+        columns[entry["name"]] = array
+    return header, columns
+
+
+# ------------------------------------------------------------
+# Load into an existing World (returns the saved meta dict)
+# ------------------------------------------------------------
+def restore_checkpoint(world, path, mmap=True):
+    header, columns = read_checkpoint(path, mmap)
+
+    # Material indices follow the names, in case the table changed
+    materials = header["materials"]
+    if tuple(materials) != MATERIAL_NAMES:
+        lookup = np.array([MATERIAL_NAMES.index(m) if m in MATERIAL_NAMES else -1
+                           for m in materials] + [-1], dtype=np.int16)
+        columns["material_index"] = lookup[columns["material_index"]]
+
+    params = header["world"]
+    for field in WORLD_FIELDS:
+        setattr(world, field, params[field])
+    world.integrator = INTEGRATORS[params["integrator"]]()
+    world.broad_phase = BROAD_PHASES[params["broad_phase"]]()
+
+    palette = [tuple(color) for color in header["palette"]]
+    world.replace_bodies(BodyStore.from_columns(columns, palette, header["next_serial"]))
+    return header["meta"]
+
+
+def load_checkpoint(path, mmap=True):
+    world = World()
+    meta = restore_checkpoint(world, path, mmap)
+    return world, meta
+
+
+# ------------------------------------------------------------
+# Background saves: copy now, write on a thread
+# ------------------------------------------------------------
+class CheckpointWriter:
+    def __init__(self, on_written=None, on_failed=None):
+        # on_written(path, seconds) / on_failed(path, error) run on
+        # the writer thread
+        self.on_written = on_written
+        self.on_failed = on_failed
+        self.error = None
+        self._jobs = queue.SimpleQueue()
+        self._thread = None
+
+    def save(self, world, path, meta=None):
+        # The copy is the only part the caller waits for
+        header, columns = capture(world, meta)
+        self._jobs.put((path, header, columns))
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="checkpoint", daemon=True)
+            self._thread.start()
+
+    def close(self):
+        # Finish the queued saves
+        if self._thread is not None:
+            self._jobs.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            path, header, columns = job
+            start = perf_counter()
+
+            # A failed save is reported; the thread keeps serving the
+            # next ones
+            try:
+                write_checkpoint(path, header, columns)
+            except Exception as exc:
+                self.error = exc
+                if self.on_failed is not None:
+                    self.on_failed(path, exc)
+                continue
+            if self.on_written is not None:
+                self.on_written(path, perf_counter() - start)
+
+
+
+
+
+# ======================================================================
+#                           TEACHING SECTION
+# ======================================================================
+#
+# File: checkpoint.py
+#
+# Role of this file:
+# ------------------
+# A long-running scene lives only in memory. A checkpoint stores the
+# whole World so a run can be stopped, resumed, or moved to another
+# machine, and continue exactly where it left off.
+#
+# ----------------------------------------------------------------------
+#
+# =========================
+# FILE LAYOUT (VERSION 1)
+# =========================
+#
+#   0   "UNIVCKPT"            8 bytes magic
+#   8   version               uint32 little endian
+#   12  header size           uint32
+#   16  header                JSON (utf-8)
+#   ..  zero padding          to a multiple of ALIGN (64) bytes
+#   ..  columns               raw little-endian arrays, one per
+#                             BodyStore column, each 64-byte aligned
+#
+# Header:
+#   count, next_serial, palette, materials (names by index)
+#   world   : G, damping, restitutions, toggles, gravity_solver,
+#             integrator, broad_phase, steps, width, height
+#   meta    : caller data, e.g. the UI's id counter (body_counter)
+#   columns : name, dtype ("<f8", ...), shape, offset from data start
+#
+# Columnar (one array per field, not one record per body) means each
+# column is a single read or mapping, in exactly the layout BodyStore
+# computes on. Newer versions may add fields; readers refuse versions
+# newer than VERSION instead of misreading them.
+#
+# ----------------------------------------------------------------------
+#
+# =========================
+# SAVE
+# =========================
+#
+# capture(world, meta)       : copies the live rows (between two steps,
+#                              so positions and velocities belong to the
+#                              same instant)
+# write_checkpoint(path, ...) : writes "<path>.partial", then renames it
+#                              over path (atomic on one file system)
+# CheckpointWriter.save(...) : capture on the caller's thread, write on
+#                              a background thread; close() waits for
+#                              queued saves. In the app the capture runs
+#                              as a physics-worker command (key: F5), so
+#                              neither the physics nor the render thread
+#                              waits for the disk. on_written / on_failed
+#                              report each job (HUD); any exception is
+#                              caught per job, so one failed save never
+#                              stops the writer thread.
+#
+# ----------------------------------------------------------------------
+#
+# =========================
+# LOAD
+# =========================
+#
+# read_checkpoint(path, mmap=True)
+#   - Columns are np.memmap views in copy-on-write mode: loading is
+#     O(header), pages are read when first touched, and edits stay in
+#     memory (the file is never modified)
+# restore_checkpoint(world, path)  : into an existing World (key: F9)
+# load_checkpoint(path)            : → (World, meta)
+#
+# The bodies become a BodyStore over the mapped arrays
+# (BodyStore.from_columns); adding a body copies them into regular
+# arrays. Integrator caches are not saved: the first step recomputes
+# the accelerations the saved run would have reused, so a resumed run
+# continues bit for bit (benchmarks/bench_checkpoint.py checks this).
+#
+# ======================================================================
+#                       IMPROVEMENT SECTION
+# ======================================================================
+#
+# 1. Compression
+#    - Optional zstd per column, at the cost of mapping.
+#
+# 2. Solver State
+#    - Save block-timestep levels so block runs resume identically.
+#
+# ======================================================================
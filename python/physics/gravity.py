@@ -1,11 +1,26 @@
 # ============================================================
 # Gravity Calculation
 # ============================================================
-# Applies Newtonian gravity between two bodies.
+# Applies Newtonian gravity between two bodies (scalar
+# reference path) or between all bodies of a BodyStore at once
+# (vectorized, tiled path).
 # ============================================================
 
 import math
 
+import numpy as np
+
+
+# Tile edge used by the vectorized all-pairs kernel. Scratch memory
+# is a few (TILE x TILE) float64 buffers, independent of body count.
+GRAVITY_TILE = 256
+
+# Subset kernels process this many (target x source) pairs at a time
+TARGET_BLOCK = 1 << 16
+
+# Preallocated scratch buffers, keyed by tile size
+_SCRATCH = {}
+
 
 # ------------------------------------------------------------
 # Apply mutual gravitational force between two bodies
@@ -63,6 +78,207 @@ def apply_gravity(body_a, body_b, G, dt):
 
 
 
+# ------------------------------------------------------------
+# Scratch buffers for the tiled kernel (allocated once)
+# ------------------------------------------------------------
+def _scratch_buffers(tile):
+    buffers = _SCRATCH.get(tile)
+    if buffers is None:
+        buffers = (
+            np.empty((tile, tile)),                     # dx / force x
+            np.empty((tile, tile)),                     # dy / force y
+            np.empty((tile, tile)),                     # pair factor
+            np.empty((tile, tile)),                     # distance
+            np.empty((tile, tile)),                     # softening
+            np.triu(np.ones((tile, tile), dtype=bool), k=1)  # i < j mask
+        )
+        _SCRATCH[tile] = buffers
+    return buffers
+
+
+# ------------------------------------------------------------
+# Accelerations of all bodies (vectorized all-pairs)
+# ------------------------------------------------------------
+def gravity_accelerations(positions, masses, radii, G, out=None, tile=GRAVITY_TILE):
+    n = len(masses)
+    if out is None:
+        out = np.zeros((n, 2))
+    else:
+        out[:] = 0.0
+
+    dx_buf, dy_buf, f_buf, d_buf, s_buf, upper = _scratch_buffers(tile)
+    x = positions[:, 0]
+    y = positions[:, 1]
+
+    # Only tiles on or above the diagonal are visited: every
+    # unordered pair is evaluated once and applied to both bodies
+    # (Newton's third law).
+    for i0 in range(0, n, tile):
+        i1 = min(i0 + tile, n)
+        ni = i1 - i0
+
+        for j0 in range(i0, n, tile):
+            j1 = min(j0 + tile, n)
+            nj = j1 - j0
+
+            dx = dx_buf[:ni, :nj]
+            dy = dy_buf[:ni, :nj]
+            f = f_buf[:ni, :nj]
+            d = d_buf[:ni, :nj]
+            soft = s_buf[:ni, :nj]
+
+            # Relative position vectors (from i to j)
+            np.subtract(x[None, j0:j1], x[i0:i1, None], out=dx)
+            np.subtract(y[None, j0:j1], y[i0:i1, None], out=dy)
+
+            # Squared distance and distance
+            np.multiply(dx, dx, out=f)
+            np.multiply(dy, dy, out=d)
+            f += d
+            np.sqrt(f, out=d)
+
+            # Same softening as apply_gravity: min(rA, rB) * 0.1
+            np.minimum(radii[i0:i1, None], radii[None, j0:j1], out=soft)
+            soft *= 0.1
+            soft *= soft
+            f += soft
+
+            # Pair factor G / (r * (r² + ε²)); zero for r == 0
+            f *= d
+            if i0 == j0:
+                f *= upper[:ni, :nj]
+            np.divide(G, f, out=f, where=f > 0)
+
+            # Force direction scaled by the pair factor
+            dx *= f
+            dy *= f
+
+            # a_i += Σ_j f m_j d_ij   and   a_j -= Σ_i f m_i d_ij
+            out[i0:i1, 0] += dx @ masses[j0:j1]
+            out[i0:i1, 1] += dy @ masses[j0:j1]
+            out[j0:j1, 0] -= masses[i0:i1] @ dx
+            out[j0:j1, 1] -= masses[i0:i1] @ dy
+
+    return out
+
+
+# ------------------------------------------------------------
+# Accelerations of selected target bodies from all bodies
+# ------------------------------------------------------------
+def gravity_accelerations_for(targets, positions, masses, radii, G, out=None):
+    k = len(targets)
+    n = len(masses)
+    if out is None:
+        out = np.zeros((k, 2))
+    if k == 0:
+        return out
+
+    # Rows of targets per block, so memory stays O(TARGET_BLOCK)
+    rows = min(k, max(1, TARGET_BLOCK // max(n, 1)))
+    dx_buf, dy_buf, f_buf, d_buf, s_buf = (np.empty((rows, n)) for _ in range(5))
+    x = positions[:, 0]
+    y = positions[:, 1]
+
+    for s0 in range(0, k, rows):
+        t = targets[s0:s0 + rows]
+        nt = len(t)
+        dx = dx_buf[:nt]
+        dy = dy_buf[:nt]
+        f = f_buf[:nt]
+        d = d_buf[:nt]
+        soft = s_buf[:nt]
+
+        np.subtract(x[None, :], x[t, None], out=dx)
+        np.subtract(y[None, :], y[t, None], out=dy)
+        np.multiply(dx, dx, out=f)
+        np.multiply(dy, dy, out=d)
+        f += d
+        np.sqrt(f, out=d)
+
+        # Same softening and pair factor as gravity_accelerations
+        np.minimum(radii[t, None], radii[None, :], out=soft)
+        soft *= 0.1
+        soft *= soft
+        f += soft
+        f *= d
+        np.divide(G, f, out=f, where=f > 0)
+
+        dx *= f
+        dy *= f
+        out[s0:s0 + rows, 0] = dx @ masses
+        out[s0:s0 + rows, 1] = dy @ masses
+
+    return out
+
+
+# ------------------------------------------------------------
+# Nearest other body of each target: (distance, index)
+# ------------------------------------------------------------
+def nearest_neighbours(targets, positions):
+    k = len(targets)
+    n = len(positions)
+    dist = np.full(k, np.inf)
+    index = np.full(k, -1, dtype=np.intp)
+    if n < 2:
+        return dist, index
+
+    rows = max(1, TARGET_BLOCK // n)
+    for s0 in range(0, k, rows):
+        t = targets[s0:s0 + rows]
+        d = positions[None, :, :] - positions[t, None, :]
+        r2 = d[..., 0] * d[..., 0] + d[..., 1] * d[..., 1]
+        r2[np.arange(len(t)), t] = np.inf
+
+        j = r2.argmin(axis=1)
+        dist[s0:s0 + rows] = np.sqrt(r2[np.arange(len(t)), j])
+        index[s0:s0 + rows] = j
+
+    return dist, index
+
+
+# ------------------------------------------------------------
+# Apply mutual gravity between all bodies of a store
+# ------------------------------------------------------------
+def apply_gravity_all(store, G, dt):
+    n = len(store)
+    if n < 2:
+        return
+
+    acc = gravity_accelerations(
+        store.positions[:n], store.masses[:n], store.radii[:n], G
+    )
+    store.velocities[:n] += acc * dt
+
+
+# ------------------------------------------------------------
+# Total gravitational potential energy (diagnostics)
+# ------------------------------------------------------------
+def gravity_potential_energy(positions, masses, radii, G):
+    n = len(masses)
+    energy = 0.0
+
+    # One row of pairs (i, j > i) at a time keeps memory O(n)
+    for i in range(n - 1):
+        d = positions[i + 1:] - positions[i]
+        r = np.sqrt(d[:, 0] * d[:, 0] + d[:, 1] * d[:, 1])
+        eps = np.minimum(radii[i], radii[i + 1:]) * 0.1
+
+        # Potential of the softened force G m m / (r² + ε²):
+        #   U(r) = −G m m (π/2 − atan(r / ε)) / ε
+        u = (np.pi / 2 - np.arctan(r / eps)) / eps
+        energy -= G * masses[i] * float(masses[i + 1:] @ u)
+
+    return energy
+
+
+# ------------------------------------------------------------
+# Total kinetic energy (diagnostics)
+# ------------------------------------------------------------
+def kinetic_energy(velocities, masses):
+    return 0.5 * float(masses @ (velocities * velocities).sum(axis=1))
+
+
+
 
 
 # ======================================================================
@@ -77,8 +293,13 @@ def apply_gravity(body_a, body_b, G, dt):
 # It is responsible for calculating gravitational force and
 # converting that force into velocity changes over time.
 #
-# This function is called for every unique pair of bodies in
-# the simulation loop.
+# apply_gravity is the scalar reference implementation for one pair.
+# The simulation runs World.step (physics/world.py): its integrator
+# (physics/integrator.py) calls gravity_accelerations, which computes
+# the same interaction for every pair of a BodyStore with NumPy, and
+# turns the accelerations into motion itself. apply_gravity_all wraps
+# gravity_accelerations in the original one-kick form (v += a * dt)
+# for scripts that do not use a World.
 #
 # ----------------------------------------------------------------------
 #
@@ -178,6 +399,50 @@ def apply_gravity(body_a, body_b, G, dt):
 # ----------------------------------------------------------------------
 #
 # =========================
+# FUNCTION: apply_gravity_all
+# =========================
+#
+# apply_gravity_all(store, G, dt)
+# gravity_accelerations(positions, masses, radii, G, out=None, tile=256)
+#
+# ----------------------------------------------------------------------
+# Purpose:
+#   - gravity_accelerations: accelerations of all bodies in one pass;
+#     this is the "pairwise" solver World's integrator calls
+#   - apply_gravity_all: kicks every velocity by a * dt with them
+#     (same physics as apply_gravity; not used by World)
+#
+# How it works:
+#   - Pairs are processed in (tile x tile) blocks
+#   - Only blocks on/above the diagonal are visited; each pair factor
+#
+#       f = G / (r * (r² + ε²)),   ε = min(rA, rB) * 0.1
+#
+#     is computed once and applied to both bodies (third law):
+#
+#       aA += f * mB * (xB − xA)
+#       aB −= f * mA * (xB − xA)
+#
+#   - Coincident bodies (r = 0) contribute nothing, as in apply_gravity
+#   - Scratch buffers are allocated once per tile size, so memory stays
+#     bounded (≈ 2.5 MB at tile 256) instead of growing as N²
+#
+# gravity_accelerations_for(targets, positions, masses, radii, G)
+#   - Same physics for a subset of bodies only: O(k * n) instead of
+#     O(n²). Used by block timesteps, where few bodies are due per
+#     substep. Agrees with gravity_accelerations to rounding.
+#
+# nearest_neighbours(targets, positions) → (distance, index)
+#   - Nearest other body of each target (timestep criteria)
+#
+# Tolerance vs. the scalar path:
+#   - Same formula, different floating-point operation order
+#   - Velocities agree with repeated apply_gravity calls to a relative
+#     error of 1e-9 (observed ≈ 1e-14)
+#
+# ----------------------------------------------------------------------
+#
+# =========================
 # WHY PAIRWISE GRAVITY
 # =========================
 #
@@ -197,7 +462,8 @@ def apply_gravity(body_a, body_b, G, dt):
 #    - Adjust softening dynamically based on mass or velocity.
 #
 # 3. Energy Tracking
-#    - Monitor kinetic + potential energy for stability checks.
+#    - gravity_potential_energy / kinetic_energy give the total energy;
+#      the integrator benchmark uses them to measure drift.
 #
 # 4. Fixed Timestep Physics
 #    - Improve determinism and reproducibility.
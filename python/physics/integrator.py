@@ -0,0 +1,257 @@
+# ============================================================
+# Integrators
+# ============================================================
+# Advance positions and velocities of a whole BodyStore by one
+# time step under gravity. Each integrator calls an
+# acceleration function accel(positions, masses, radii) → (n, 2)
+# so any gravity solver can be plugged in.
+# ============================================================
+
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+
+# Yoshida 4th-order composition weights (w1, w0, w1)
+_CBRT2 = 2.0 ** (1.0 / 3.0)
+YOSHIDA_W1 = 1.0 / (2.0 - _CBRT2)
+YOSHIDA_W0 = -_CBRT2 / (2.0 - _CBRT2)
+
+
+# ------------------------------------------------------------
+# Base class: force evaluation counting + acceleration cache
+# (abstract: subclasses implement _advance)
+# ------------------------------------------------------------
+class Integrator(ABC):
+    name = ""
+
+    def __init__(self):
+        # Calls of the acceleration function and body-body pairs
+        # they covered (benchmark statistics)
+        self.force_evaluations = 0
+        self.interactions = 0
+
+        # Accelerations at the end of the last step and the state
+        # they were computed for
+        self._acc = None
+        self._positions = None
+        self._masses = None
+        self._radii = None
+
+        # Force law the accelerations came from (solver, G, ...)
+        self._field = None
+
+    # --------------------------------------------------------
+    # Evaluate accelerations (all bodies, or only targets)
+    # --------------------------------------------------------
+    def _evaluate(self, accel, x, m, r, targets=None):
+        self.force_evaluations += 1
+        if targets is None:
+            self.interactions += len(m) * len(m)
+            return accel(x, m, r)
+        self.interactions += len(targets) * len(m)
+        return accel(x, m, r, targets)
+
+    # --------------------------------------------------------
+    # Is the remembered state still the current one? It is not
+    # after collisions, boundaries, dragging or spawning.
+    # --------------------------------------------------------
+    def _cache_valid(self, x, m, r):
+        return (
+            self._acc is not None
+            and self._positions.shape == x.shape
+            and np.array_equal(self._positions, x)
+            and np.array_equal(self._masses, m)
+            and np.array_equal(self._radii, r)
+        )
+
+    # --------------------------------------------------------
+    # Accelerations at the start of a step: reuse the previous
+    # step's final evaluation when nothing moved in between
+    # --------------------------------------------------------
+    def _start(self, accel, x, m, r):
+        if self._cache_valid(x, m, r):
+            return self._acc
+        return self._evaluate(accel, x, m, r)
+
+    def _remember(self, acc, x, m, r):
+        self._acc = acc
+        self._positions = x.copy()
+        self._masses = m.copy()
+        self._radii = r.copy()
+
+    # --------------------------------------------------------
+    # Kick-drift-kick substep of size h; returns a(x_new)
+    # --------------------------------------------------------
+    def _kick_drift_kick(self, accel, x, v, m, r, h, a0):
+        v += a0 * (0.5 * h)
+        x += v * h
+        a1 = self._evaluate(accel, x, m, r)
+        v += a1 * (0.5 * h)
+        return a1
+
+    # --------------------------------------------------------
+    # Advance all bodies of a store by dt; `field` identifies
+    # what accel computes (another solver or G drops the cache)
+    # --------------------------------------------------------
+    def step(self, store, dt, accel, field=None):
+        n = len(store)
+        if n == 0:
+            return
+        if field != self._field:
+            self._acc = None
+            self._field = field
+        self._advance(
+            store.positions[:n], store.velocities[:n],
+            store.masses[:n], store.radii[:n], dt, accel
+        )
+
+    @abstractmethod
+    def _advance(self, x, v, m, r, dt, accel):
+        ...
+
+
+# ------------------------------------------------------------
+# Semi-implicit Euler: kick, then drift (1st order)
+# ------------------------------------------------------------
+class SymplecticEuler(Integrator):
+    name = "euler"
+
+    def _advance(self, x, v, m, r, dt, accel):
+        v += self._evaluate(accel, x, m, r) * dt
+        x += v * dt
+
+
+# ------------------------------------------------------------
+# Leapfrog, kick-drift-kick form (2nd order)
+# ------------------------------------------------------------
+class Leapfrog(Integrator):
+    name = "leapfrog"
+
+    def _advance(self, x, v, m, r, dt, accel):
+        a0 = self._start(accel, x, m, r)
+        a1 = self._kick_drift_kick(accel, x, v, m, r, dt, a0)
+        self._remember(a1, x, m, r)
+
+
+# ------------------------------------------------------------
+# Velocity Verlet, position form (2nd order)
+# ------------------------------------------------------------
+class VelocityVerlet(Integrator):
+    name = "verlet"
+
+    def _advance(self, x, v, m, r, dt, accel):
+        a0 = self._start(accel, x, m, r)
+        x += v * dt + a0 * (0.5 * dt * dt)
+        a1 = self._evaluate(accel, x, m, r)
+        v += (a0 + a1) * (0.5 * dt)
+        self._remember(a1, x, m, r)
+
+
+# ------------------------------------------------------------
+# Yoshida: three leapfrog substeps (w1, w0, w1) → 4th order
+# ------------------------------------------------------------
+class Yoshida4(Integrator):
+    name = "yoshida4"
+
+    def _advance(self, x, v, m, r, dt, accel):
+        a = self._start(accel, x, m, r)
+        for w in (YOSHIDA_W1, YOSHIDA_W0, YOSHIDA_W1):
+            a = self._kick_drift_kick(accel, x, v, m, r, w * dt, a)
+        self._remember(a, x, m, r)
+
+
+# ------------------------------------------------------------
+# Fixed-step integrators by name (physics/world.py adds "block")
+# ------------------------------------------------------------
+FIXED_STEP_INTEGRATORS = {
+    SymplecticEuler.name: SymplecticEuler,
+    Leapfrog.name: Leapfrog,
+    VelocityVerlet.name: VelocityVerlet,
+    Yoshida4.name: Yoshida4,
+}
+
+
+
+
+
+# ======================================================================
+#                           TEACHING SECTION
+# ======================================================================
+#
+# File: integrator.py
+#
+# Role of this file:
+# ------------------
+# Integration turns accelerations into motion. The original loop kicked
+# velocities in apply_gravity and drifted positions in Body.update:
+#
+#   v += a(x) * dt
+#   x += v * dt
+#
+# That is semi-implicit ("symplectic") Euler: stable, but only first
+# order, so orbits need very small steps to stay closed.
+#
+# Mirrors cpp/include/physics/integrator.h.
+#
+# ----------------------------------------------------------------------
+#
+# =========================
+# SCHEMES
+# =========================
+#
+# euler     : the original kick + drift               1st order, 1 eval
+# leapfrog  : kick(dt/2) drift(dt) kick(dt/2)          2nd order, 1 eval*
+# verlet    : x += v dt + a dt²/2,  v += (a0 + a1) dt/2 2nd order, 1 eval*
+# yoshida4  : leapfrog with sub-steps w1, w0, w1       4th order, 3 evals*
+#
+#   w1 = 1 / (2 − 2^(1/3)) ≈ 1.3512,  w0 = 1 − 2 w1 ≈ −1.7024
+#   (the middle substep runs backwards in time)
+#
+# * The acceleration at the end of a step is reused at the start of the
+#   next one. The cache is only used if positions, masses and radii are
+#   unchanged (np.array_equal), so collisions, boundary bounces and
+#   dragging simply cost one extra evaluation. The World passes its
+#   (gravity solver, G) as `field`; switching the solver (key B) or
+#   changing G drops the cache too.
+#
+# Leapfrog and velocity Verlet are the same method written two ways;
+# they differ only in rounding.
+#
+# ----------------------------------------------------------------------
+#
+# =========================
+# USAGE
+# =========================
+#
+#   integrator = FIXED_STEP_INTEGRATORS["leapfrog"]()
+#   integrator.step(store, dt, accel)
+#
+# New schemes subclass Integrator and implement _advance(x, v, m, r, dt,
+# accel), which updates x and v in place; Integrator is an abc.ABC, so a
+# subclass without _advance fails when it is created, not mid-step.
+#
+# accel(positions, masses, radii, targets=None) → accelerations (of the
+# target rows only if targets is given); World binds G and the selected
+# gravity solver. force_evaluations counts accel calls, interactions the
+# body-body pairs they covered.
+#
+# Why symplectic schemes:
+#   - Energy error stays bounded instead of drifting
+#   - Orbits neither decay nor spiral outwards over long runs
+#   - Higher order → same error at much larger dt
+#
+# Measured with the solar-system preset:
+#   python -m benchmarks.bench_integrators   (run from python/)
+#
+# ======================================================================
+#                       IMPROVEMENT SECTION
+# ======================================================================
+#
+# 1. Higher Orders
+#    - 6th/8th-order Yoshida compositions for long-term studies.
+#
+# 2. Adaptive Steps
+#    - Individual (block) timesteps: physics/block_timestep.py.
+#
+# ======================================================================
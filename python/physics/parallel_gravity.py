@@ -0,0 +1,268 @@
+# ============================================================
+# Parallel Gravity (Shared Memory + Process Pool)
+# ============================================================
+# Spreads direct-summation gravity over several CPU cores.
+# Body arrays live in multiprocessing.shared_memory blocks that
+# every worker maps once; per step only (start, end) chunk
+# bounds travel to the workers, and each worker writes its
+# accelerations straight into the shared output array.
+# ============================================================
+
+import atexit
+import multiprocessing as mp
+import os
+from multiprocessing import shared_memory
+
+import numpy as np
+
+import utils.constants as C
+from physics.gravity import gravity_accelerations_for
+
+
+# Chunks per worker (more chunks = better balance, more overhead)
+CHUNKS_PER_WORKER = 4
+
+# Smallest shared capacity (rows); grows by doubling
+MIN_CAPACITY = 1024
+
+# Shared arrays: name → (row shape, dtype)
+_LAYOUT = {
+    "positions": ((2,), np.float64),
+    "masses": ((), np.float64),
+    "radii": ((), np.float64),
+    "targets": ((), np.intp),
+    "acc": ((2,), np.float64),
+}
+
+# Backends are expensive to start (processes), so they are reused
+_BACKENDS = {}
+
+
+# ------------------------------------------------------------
+# Worker side: shared blocks mapped once per process
+# ------------------------------------------------------------
+_worker_blocks = {}
+
+
+def _worker_arrays(names, capacity):
+    arrays = {}
+    for key, name in names.items():
+        block = _worker_blocks.get(name)
+        if block is None:
+            # A new generation of blocks: drop the old mappings
+            for old in [k for k in _worker_blocks if k.split(":")[0] == key]:
+                _worker_blocks.pop(old)[0].close()
+            shm = shared_memory.SharedMemory(name=name.split(":", 1)[1])
+            shape, dtype = _LAYOUT[key]
+            block = (shm, np.ndarray((capacity,) + shape, dtype=dtype, buffer=shm.buf))
+            _worker_blocks[name] = block
+        arrays[key] = block[1]
+    return arrays
+
+
+def _worker_chunk(task):
+    names, capacity, n, start, end, G = task
+    a = _worker_arrays(names, capacity)
+    gravity_accelerations_for(
+        a["targets"][start:end], a["positions"][:n], a["masses"][:n], a["radii"][:n], G,
+        out=a["acc"][start:end]
+    )
+
+
+# ------------------------------------------------------------
+# Parent side: shared arrays + persistent pool
+# ------------------------------------------------------------
+class ParallelGravity:
+    def __init__(self, workers=C.GRAVITY_WORKERS):
+        self.workers = workers if workers > 0 else (os.cpu_count() or 1)
+        self.capacity = 0
+        self._blocks = {}
+        self._names = {}
+        self._arrays = {}
+        self._pool = None
+
+    # --------------------------------------------------------
+    # Worker processes (spawned, so safe next to threads)
+    # --------------------------------------------------------
+    def _start_pool(self):
+        # One BLAS thread per worker, or workers fight over cores
+        saved = {}
+        for var in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+            saved[var] = os.environ.get(var)
+            os.environ[var] = "1"
+        try:
+            self._pool = mp.get_context("spawn").Pool(self.workers)
+        finally:
+            for var, value in saved.items():
+                if value is None:
+                    os.environ.pop(var, None)
+                else:
+                    os.environ[var] = value
+
+    # --------------------------------------------------------
+    # Shared arrays with room for at least n rows
+    # --------------------------------------------------------
+    def _reserve(self, n):
+        if n <= self.capacity:
+            return
+
+        capacity = max(MIN_CAPACITY, self.capacity)
+        while capacity < n:
+            capacity *= 2
+
+        self._release_blocks()
+        for key, (shape, dtype) in _LAYOUT.items():
+            size = capacity * int(np.prod(shape, dtype=np.intp)) * np.dtype(dtype).itemsize
+            shm = shared_memory.SharedMemory(create=True, size=size)
+            self._blocks[key] = shm
+            self._names[key] = f"{key}:{shm.name}"
+            self._arrays[key] = np.ndarray((capacity,) + shape, dtype=dtype, buffer=shm.buf)
+        self.capacity = capacity
+
+    def _release_blocks(self):
+        self._arrays = {}
+        for shm in self._blocks.values():
+            shm.close()
+            shm.unlink()
+        self._blocks = {}
+        self._names = {}
+
+    # --------------------------------------------------------
+    # Accelerations of all bodies, or of the target rows only
+    # --------------------------------------------------------
+    def accelerations(self, positions, masses, radii, G, out=None, targets=None):
+        n = len(masses)
+        k = n if targets is None else len(targets)
+        if out is None:
+            out = np.empty((k, 2))
+        if k == 0:
+            return out
+
+        if self._pool is None:
+            self._start_pool()
+        self._reserve(n)
+
+        a = self._arrays
+        a["positions"][:n] = positions
+        a["masses"][:n] = masses
+        a["radii"][:n] = radii
+        a["targets"][:k] = np.arange(n) if targets is None else targets
+
+        # Every target costs one row of n pairs: equal-sized chunks
+        # are balanced; several per worker absorb slow workers
+        chunks = min(k, self.workers * CHUNKS_PER_WORKER)
+        bounds = np.linspace(0, k, chunks + 1).astype(np.intp)
+        tasks = [
+            (self._names, self.capacity, n, int(bounds[c]), int(bounds[c + 1]), G)
+            for c in range(chunks)
+        ]
+        self._pool.map(_worker_chunk, tasks, chunksize=1)
+
+        out[:] = a["acc"][:k]
+        return out
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+        self._release_blocks()
+        self.capacity = 0
+
+
+# ------------------------------------------------------------
+# Shared backend per worker count (closed at exit)
+# ------------------------------------------------------------
+def get_backend(workers=C.GRAVITY_WORKERS):
+    backend = _BACKENDS.get(workers)
+    if backend is None:
+        backend = ParallelGravity(workers)
+        _BACKENDS[workers] = backend
+    return backend
+
+
+@atexit.register
+def _close_backends():
+    for backend in _BACKENDS.values():
+        backend.close()
+    _BACKENDS.clear()
+
+
+# ------------------------------------------------------------
+# Same signature as the other gravity solvers
+# ------------------------------------------------------------
+def parallel_gravity_accelerations(positions, masses, radii, G, out=None, targets=None):
+    return get_backend().accelerations(positions, masses, radii, G, out, targets)
+
+
+
+
+
+# ======================================================================
+#                           TEACHING SECTION
+# ======================================================================
+#
+# File: parallel_gravity.py
+#
+# Role of this file:
+# ------------------
+# NumPy gravity runs on one core. Direct summation is embarrassingly
+# parallel over target bodies: every worker computes the accelerations
+# of its own rows against all bodies. This file runs that on a pool of
+# processes (threads would be serialized by the GIL between NumPy calls).
+#
+# ----------------------------------------------------------------------
+#
+# =========================
+# HOW DATA MOVES
+# =========================
+#
+# 1. Shared memory
+#    - positions, masses, radii, targets and acc live in
+#      multiprocessing.shared_memory blocks
+#    - The parent copies the current arrays in (O(n), no pickling)
+#    - Workers map each block once and keep the mapping; blocks are
+#      only recreated when the body count outgrows the capacity
+#
+# 2. Persistent pool
+#    - Started on first use, reused every step, closed at exit
+#    - "spawn" start method: safe even when other threads are running
+#    - Each worker is limited to one BLAS thread
+#
+# 3. Chunks
+#    - Targets are split into workers * CHUNKS_PER_WORKER equal chunks
+#    - A task is just (block names, n, start, end, G): a few bytes
+#    - Workers write accelerations in place into the shared acc array
+#
+# ----------------------------------------------------------------------
+#
+# =========================
+# ACCURACY
+# =========================
+#
+# Each row is computed with gravity_accelerations_for, the same pair
+# formula (softening min(rA, rB) * 0.1) as apply_gravity and
+# gravity_accelerations. Results agree with both to rounding; the
+# benchmark checks this before timing:
+#   python -m benchmarks.bench_parallel_gravity   (run from python/)
+#
+# The parallel path evaluates every pair twice (once per side) instead
+# of using Newton's third law, so one worker is up to 2x slower than
+# gravity_accelerations; the speed-up comes from the extra cores.
+#
+# ----------------------------------------------------------------------
+#
+# Solver name "parallel" (World / key B); C.GRAVITY_WORKERS sets the
+# worker count (0 = all cores).
+#
+# ======================================================================
+#                       IMPROVEMENT SECTION
+# ======================================================================
+#
+# 1. Third-Law Tiles
+#    - Hand out upper-triangle tiles and reduce per-worker partial sums.
+#
+# 2. Parallel Barnes–Hut
+#    - Share the flat tree arrays and split the traversal by target.
+#
+# ======================================================================
@@ -0,0 +1,243 @@
+# ============================================================
+# Particle-Mesh Gravity
+# ============================================================
+# Computes gravity for very large body counts on a grid:
+# mass is deposited with cloud-in-cell weights, the field is
+# obtained with FFT convolutions and interpolated back.
+# ============================================================
+
+import numpy as np
+
+import utils.constants as C
+
+
+# Meshes are expensive to set up (kernel FFTs), so they are reused
+_MESHES = {}
+
+
+# ------------------------------------------------------------
+# Grid mesh over a width x height domain whose lower corner is
+# at origin
+# ------------------------------------------------------------
+class ParticleMesh:
+    def __init__(self, width=C.WIDTH, height=C.HEIGHT, grid=C.PM_GRID,
+                 boundary=C.PM_BOUNDARY, softening=None, origin=(0.0, 0.0)):
+        if boundary not in ("isolated", "periodic"):
+            raise ValueError(f"unknown boundary: {boundary!r}")
+
+        self.width = width
+        self.height = height
+        self.origin = origin
+        self.nx, self.ny = grid
+        self.boundary = boundary
+
+        # Cell size; softening defaults to one cell
+        self.hx = width / self.nx
+        self.hy = height / self.ny
+        if softening is None:
+            softening = max(self.hx, self.hy)
+        self.softening = softening
+
+        # ----------------------------------------------------
+        # Force kernels (FFT order offsets)
+        # ----------------------------------------------------
+        # Isolated: grid doubled and zero padded so images never wrap
+        # Periodic: minimum-image offsets on the base grid
+        if boundary == "isolated":
+            self.shape = (2 * self.nx, 2 * self.ny)
+        else:
+            self.shape = (self.nx, self.ny)
+
+        ox = np.fft.fftfreq(self.shape[0], 1.0 / self.shape[0]) * self.hx
+        oy = np.fft.fftfreq(self.shape[1], 1.0 / self.shape[1]) * self.hy
+        dx, dy = np.meshgrid(ox, oy, indexing="ij")
+
+        # Acceleration at offset d from a unit mass: −d / (|d|² + ε²)^(3/2)
+        inv_r3 = (dx * dx + dy * dy + softening * softening) ** -1.5
+        self._kernel_x = np.fft.rfft2(-dx * inv_r3)
+        self._kernel_y = np.fft.rfft2(-dy * inv_r3)
+
+    # --------------------------------------------------------
+    # Cloud-in-cell stencil (4 cells + weights per body)
+    # --------------------------------------------------------
+    def _stencil(self, positions):
+        gx = (positions[:, 0] - self.origin[0]) / self.hx - 0.5
+        gy = (positions[:, 1] - self.origin[1]) / self.hy - 0.5
+
+        if self.boundary == "periodic":
+            ix = np.floor(gx).astype(np.intp)
+            iy = np.floor(gy).astype(np.intp)
+            fx = gx - ix
+            fy = gy - iy
+            ix0 = ix % self.nx
+            iy0 = iy % self.ny
+            ix1 = (ix + 1) % self.nx
+            iy1 = (iy + 1) % self.ny
+        else:
+            # Bodies outside the domain are pinned to its edge cells
+            gx = np.clip(gx, 0.0, self.nx - 1.000001)
+            gy = np.clip(gy, 0.0, self.ny - 1.000001)
+            ix0 = gx.astype(np.intp)
+            iy0 = gy.astype(np.intp)
+            fx = gx - ix0
+            fy = gy - iy0
+            ix1 = ix0 + 1
+            iy1 = iy0 + 1
+
+        ny = self.shape[1]
+        cells = (
+            ix0 * ny + iy0,
+            ix1 * ny + iy0,
+            ix0 * ny + iy1,
+            ix1 * ny + iy1,
+        )
+        weights = (
+            (1.0 - fx) * (1.0 - fy),
+            fx * (1.0 - fy),
+            (1.0 - fx) * fy,
+            fx * fy,
+        )
+        return cells, weights
+
+    # --------------------------------------------------------
+    # Accelerations of all bodies
+    # --------------------------------------------------------
+    def accelerations(self, positions, masses, G, out=None):
+        n = len(masses)
+        if out is None:
+            out = np.empty((n, 2))
+        if n == 0:
+            return out
+
+        cells, weights = self._stencil(positions)
+        size = self.shape[0] * self.shape[1]
+
+        # Mass deposit (cloud-in-cell)
+        rho = np.zeros(size)
+        for c, w in zip(cells, weights):
+            rho += np.bincount(c, weights=masses * w, minlength=size)
+        rho_hat = np.fft.rfft2(rho.reshape(self.shape))
+
+        # Field on the grid (convolution with the force kernels)
+        field_x = np.fft.irfft2(rho_hat * self._kernel_x, s=self.shape).ravel()
+        field_y = np.fft.irfft2(rho_hat * self._kernel_y, s=self.shape).ravel()
+
+        # Interpolate back with the same weights (no self-force)
+        out[:] = 0.0
+        for c, w in zip(cells, weights):
+            out[:, 0] += field_x[c] * w
+            out[:, 1] += field_y[c] * w
+        out *= G
+        return out
+
+
+# ------------------------------------------------------------
+# Cached mesh lookup
+# ------------------------------------------------------------
+def get_mesh(width=C.WIDTH, height=C.HEIGHT, grid=C.PM_GRID, boundary=C.PM_BOUNDARY,
+             origin=(0.0, 0.0)):
+    key = (width, height, tuple(grid), boundary, tuple(origin))
+    mesh = _MESHES.get(key)
+    if mesh is None:
+        mesh = ParticleMesh(width, height, grid, boundary, origin=origin)
+        _MESHES[key] = mesh
+    return mesh
+
+
+# ------------------------------------------------------------
+# Accelerations with the same signature as the other solvers
+# (the World passes its own domain)
+# ------------------------------------------------------------
+def particle_mesh_accelerations(positions, masses, radii, G, grid=C.PM_GRID,
+                                boundary=C.PM_BOUNDARY, out=None, width=C.WIDTH,
+                                height=C.HEIGHT, origin=(0.0, 0.0)):
+    mesh = get_mesh(width, height, grid, boundary, origin)
+    return mesh.accelerations(positions, masses, G, out)
+
+
+
+
+
+# ======================================================================
+#                           TEACHING SECTION
+# ======================================================================
+#
+# File: particle_mesh.py
+#
+# Role of this file:
+# ------------------
+# Particle-mesh (PM) gravity replaces the sum over body pairs by a sum
+# over grid cells. Cost per step is O(N + M log M) for N bodies and M
+# grid cells, so dense scenes with 10⁵–10⁶ bodies stay tractable.
+#
+# ----------------------------------------------------------------------
+#
+# =========================
+# STEP-BY-STEP EXPLANATION
+# =========================
+#
+# 1. Mass Deposit (cloud-in-cell, CIC)
+#    - Each body spreads its mass over the 4 nearest cell centres,
+#      weighted by overlap (bilinear weights)
+#
+# 2. Field Solve (FFT)
+#    - The acceleration field is the convolution of the mass grid with
+#      the softened point-mass kernel
+#
+#        K(d) = −G * d / (|d|² + ε²)^(3/2)
+#
+#    - numpy.fft turns the convolution into a product:
+#        a_hat = rho_hat * K_hat
+#    - This is the Green's-function solution of Poisson's equation for
+#      the simulation's 1/r² force law, so PM forces match the other
+#      solvers at separations larger than a cell
+#
+# 3. Interpolation (CIC)
+#    - Each body reads the field at its 4 cells with the SAME weights
+#    - Using identical weights cancels the self-force
+#
+# ----------------------------------------------------------------------
+#
+# =========================
+# BOUNDARIES
+# =========================
+#
+# isolated  : grid zero-padded to 2x size; no periodic images.
+#             Bodies outside the domain are pinned to the edge cells.
+# periodic  : base grid with wrap-around; the kernel uses minimum-image
+#             offsets (nearest image only).
+#
+# ----------------------------------------------------------------------
+#
+# =========================
+# CONFIGURATION
+# =========================
+#
+# C.PM_GRID     : (nx, ny) grid resolution over the domain
+# C.PM_BOUNDARY : "isolated" or "periodic"
+#
+# particle_mesh_accelerations(positions, masses, radii, G) has the same
+# signature as gravity_accelerations / barnes_hut_accelerations (radii
+# are unused), so integrators can call any solver the same way.
+# The domain (width, height, origin) defaults to the window; the World
+# passes its own (C.WORLD_WIDTH x C.WORLD_HEIGHT from 0, 0), so a large
+# world gets a mesh over all of it. Cells grow with the domain: the
+# same grid over a 16x larger world resolves 16x coarser.
+#
+# Softening is one cell size: PM does not resolve close encounters,
+# which is why it suits dense, roughly uniform scenes (dust clouds).
+#
+# ======================================================================
+#                       IMPROVEMENT SECTION
+# ======================================================================
+#
+# 1. P³M
+#    - Add a short-range direct correction for close pairs.
+#
+# 2. Higher-Order Assignment
+#    - Triangular-shaped-cloud deposit for smoother forces.
+#
+# 3. Ewald Periodic Kernel
+#    - Include all periodic images instead of the nearest one.
+#
+# ======================================================================
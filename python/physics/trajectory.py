@@ -0,0 +1,367 @@
+# ============================================================
+# Trajectory Recording (Keyframes + Per-Step Deltas)
+# ============================================================
+# Records a run as an append-only stream of chunks: a full
+# keyframe every KEYFRAME_INTERVAL steps (and whenever bodies
+# appear or disappear) and a compact position delta for every
+# other step. A side index of keyframe offsets lets the reader
+# jump to any step without reading the stream before it.
+# ============================================================
+
+import json
+import os
+import struct
+
+import numpy as np
+
+import utils.constants as C
+
+
+# File layout version (bump when the layout changes)
+VERSION = 1
+
+MAGIC = b"UNIVTRAJ"
+
+# magic, version, header bytes (little endian)
+_PREAMBLE = struct.Struct("<8sII")
+
+# Chunk header: kind, frame, payload bytes
+_CHUNK = struct.Struct("<BqI")
+KEYFRAME = 1
+DELTA = 2
+
+# Keyframe payload header: bodies, palette JSON bytes
+_KEYFRAME = struct.Struct("<II")
+
+# Index record: byte offset of the keyframe of one interval
+_OFFSET = struct.Struct("<q")
+
+# Delta position encodings → bytes per body per step
+ENCODINGS = {"float64": 16, "float32": 8, "float16": 4, "quantized": 4}
+
+
+# ------------------------------------------------------------
+# One recorded step (same column names as a BodyStore)
+# ------------------------------------------------------------
+class RecordedFrame:
+    def __init__(self, frame, positions, radii, color_index, ids, serials, palette):
+        self.frame = frame
+        self.count = len(radii)
+        self.positions = positions
+        self.radii = radii
+        self.color_index = color_index
+        self.ids = ids
+        self.serials = serials
+        self.palette = palette
+
+    def __len__(self):
+        return self.count
+
+
+# ------------------------------------------------------------
+# Writer: fed by World.step through world.recorder
+# ------------------------------------------------------------
+class TrajectoryWriter:
+    def __init__(self, path, world, dt, encoding=C.TRAJECTORY_ENCODING,
+                 interval=C.TRAJECTORY_KEYFRAME_INTERVAL, quantum=C.TRAJECTORY_QUANTUM):
+        if encoding not in ENCODINGS:
+            raise ValueError(f"unknown trajectory encoding: {encoding}")
+        self.path = path
+        self.encoding = encoding
+        self.interval = interval
+        self.quantum = quantum
+
+        # Frames written (frame 0 = the state when recording began)
+        self.frame = 0
+        self.bytes_written = 0
+
+        # Positions as the reader will decode them: deltas are taken
+        # against these, so rounding never accumulates
+        self._decoded = None
+        self._serials = None
+
+        self._file = open(path, "wb")
+        self._index = open(path + ".idx", "wb")
+
+        header = {
+            "dt": dt, "encoding": encoding, "interval": interval, "quantum": quantum,
+            "start_step": world.steps, "width": world.width, "height": world.height,
+        }
+        blob = json.dumps(dict(header, version=VERSION)).encode()
+        self._write(_PREAMBLE.pack(MAGIC, VERSION, len(blob)) + blob)
+        self._keyframe(world.bodies)
+
+    def _write(self, data):
+        self._file.write(data)
+        self.bytes_written += memoryview(data).nbytes
+
+    def _chunk(self, kind, *parts):
+        size = sum(memoryview(part).nbytes for part in parts)
+        self._write(_CHUNK.pack(kind, self.frame, size))
+        for part in parts:
+            self._write(part)
+
+    # --------------------------------------------------------
+    # Full state (exact float64 positions)
+    # --------------------------------------------------------
+    def _keyframe(self, store):
+        n = len(store)
+        if self.frame % self.interval == 0:
+            self._index.write(_OFFSET.pack(self._file.tell()))
+
+        palette = json.dumps([[int(v) for v in color] for color in store.palette]).encode()
+        self._decoded = store.positions[:n].copy()
+        self._serials = store.serials[:n].copy()
+        self._chunk(
+            KEYFRAME, _KEYFRAME.pack(n, len(palette)), palette,
+            self._decoded, store.radii[:n], store.ids[:n], self._serials,
+            store.color_index[:n],
+        )
+
+    # --------------------------------------------------------
+    # Positions of one step in the chosen encoding (None: the
+    # change does not fit, write a keyframe instead)
+    # --------------------------------------------------------
+    def _encode(self, positions):
+        if self.encoding == "float64":
+            return positions.copy()
+        if self.encoding == "float32":
+            return positions.astype(np.float32)
+
+        delta = positions - self._decoded
+        if self.encoding == "float16":
+            if len(delta) and np.abs(delta).max() > np.finfo(np.float16).max:
+                return None
+            data = delta.astype(np.float16)
+            self._decoded += data
+        else:
+            steps = np.rint(delta / self.quantum)
+            if len(steps) and np.abs(steps).max() > np.iinfo(np.int16).max:
+                return None
+            data = steps.astype(np.int16)
+            self._decoded += data * self.quantum
+        return data
+
+    def record(self, world):
+        self.frame += 1
+        store = world.bodies
+        n = len(store)
+
+        # Bodies added / removed / reordered: deltas no longer line up
+        same_rows = n == len(self._serials) and np.array_equal(store.serials[:n], self._serials)
+        if self.frame % self.interval == 0 or not same_rows:
+            self._keyframe(store)
+            return
+
+        data = self._encode(store.positions[:n])
+        if data is None:
+            self._keyframe(store)
+        else:
+            self._chunk(DELTA, data)
+
+    def close(self):
+        self._file.close()
+        self._index.close()
+
+
+# ------------------------------------------------------------
+# Reader: sequential playback + O(1) keyframe seek
+# ------------------------------------------------------------
+class TrajectoryReader:
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        magic, version, size = _PREAMBLE.unpack(self._file.read(_PREAMBLE.size))
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a trajectory")
+        if version > VERSION:
+            raise ValueError(f"trajectory version {version} is newer than supported ({VERSION})")
+        self.header = json.loads(self._file.read(size))
+        self.dt = self.header["dt"]
+        self.encoding = self.header["encoding"]
+        self.interval = self.header["interval"]
+        self.quantum = self.header["quantum"]
+
+        self._index = open(path + ".idx", "rb")
+        self._slots = os.path.getsize(path + ".idx") // _OFFSET.size
+
+        # Bytes of chunks read so far (seeks read one interval at most)
+        self.bytes_read = 0
+
+        self.state = None
+        self.frames = self._count_frames()
+
+    @property
+    def frame(self):
+        return self.state.frame if self.state is not None else -1
+
+    # --------------------------------------------------------
+    # Chunks
+    # --------------------------------------------------------
+    def _read_chunk(self):
+        # (kind, frame, payload), or None at the end / a torn tail
+        head = self._file.read(_CHUNK.size)
+        if len(head) < _CHUNK.size:
+            return None
+        kind, frame, size = _CHUNK.unpack(head)
+        payload = self._file.read(size)
+        if len(payload) < size:
+            return None
+        self.bytes_read += _CHUNK.size + size
+        return kind, frame, payload
+
+    def _apply(self, kind, frame, payload):
+        if kind == KEYFRAME:
+            n, palette_bytes = _KEYFRAME.unpack_from(payload)
+            offset = _KEYFRAME.size
+            palette = [tuple(color) for color in json.loads(payload[offset:offset + palette_bytes])]
+            offset += palette_bytes
+
+            columns = []
+            for dtype, shape in ((np.float64, (n, 2)), (np.float64, n), (np.int64, n),
+                                 (np.int64, n), (np.uint16, n)):
+                count = int(np.prod(shape))
+                columns.append(np.frombuffer(payload, dtype, count, offset).reshape(shape))
+                offset += count * np.dtype(dtype).itemsize
+            positions, radii, ids, serials, color_index = columns
+            self.state = RecordedFrame(frame, positions.copy(), radii, color_index, ids,
+                                       serials, palette)
+            return
+
+        # Delta: same decoding steps as the writer's _encode
+        positions = self.state.positions
+        if self.encoding == "float64":
+            positions[:] = np.frombuffer(payload, np.float64).reshape(-1, 2)
+        elif self.encoding == "float32":
+            positions[:] = np.frombuffer(payload, np.float32).reshape(-1, 2)
+        elif self.encoding == "float16":
+            positions += np.frombuffer(payload, np.float16).reshape(-1, 2)
+        else:
+            positions += np.frombuffer(payload, np.int16).reshape(-1, 2) * self.quantum
+        self.state.frame = frame
+
+    def _count_frames(self):
+        # Walk from the last keyframe in the index to the end
+        if not self._slots:
+            return 0
+        self._index.seek((self._slots - 1) * _OFFSET.size)
+        self._file.seek(_OFFSET.unpack(self._index.read(_OFFSET.size))[0])
+        last = -1
+        while (chunk := self._read_chunk()) is not None:
+            last = chunk[1]
+        self.state = None
+        return last + 1
+
+    # --------------------------------------------------------
+    # Playback
+    # --------------------------------------------------------
+    def next(self):
+        chunk = self._read_chunk()
+        if chunk is None:
+            return None
+        self._apply(*chunk)
+        return self.state
+
+    def seek(self, frame):
+        frame = min(max(int(frame), 0), self.frames - 1)
+
+        # Forward within the current interval: keep decoding
+        if not (self.frame <= frame and self.frame // self.interval == frame // self.interval):
+            self._index.seek(frame // self.interval * _OFFSET.size)
+            self._file.seek(_OFFSET.unpack(self._index.read(_OFFSET.size))[0])
+            self.state = None
+
+        while self.frame < frame:
+            if self.next() is None:
+                break
+        return self.state
+
+    def close(self):
+        self._file.close()
+        self._index.close()
+
+
+
+
+
+# ======================================================================
+#                           TEACHING SECTION
+# ======================================================================
+#
+# File: trajectory.py
+#
+# Role of this file:
+# ------------------
+# A checkpoint (physics/checkpoint.py) is one instant; a trajectory is
+# the whole run, cheap enough to record every step and replay later
+# without physics (core/replay.py, key: L).
+#
+# ----------------------------------------------------------------------
+#
+# =========================
+# FILE LAYOUT (VERSION 1)
+# =========================
+#
+# <path>
+#   "UNIVTRAJ", version, header size, JSON header
+#       dt, encoding, interval, quantum, start_step, width, height
+#   chunks, appended in step order:
+#       kind (uint8) | frame (int64) | payload bytes (uint32) | payload
+#   KEYFRAME payload: bodies, palette JSON, positions (float64), radii,
+#                     ids, serials, color_index
+#   DELTA payload   : positions of the same rows in `encoding`
+#
+# <path>.idx
+#   one int64 per interval: byte offset of the keyframe written at
+#   frame k * interval
+#
+# Keyframes are written at every multiple of `interval` and whenever
+# the body set changes (spawn, removal, checkpoint load): deltas only
+# carry positions, row for row.
+#
+# Both files are only ever appended to, so a crash loses at most the
+# last partial chunk (the reader stops at a torn tail).
+#
+# ----------------------------------------------------------------------
+#
+# =========================
+# ENCODINGS (per body per step)
+# =========================
+#
+#   float64    16 bytes  exact
+#   float32     8 bytes  absolute, ~1e-7 relative error
+#   float16     4 bytes  delta from the last decoded position
+#   quantized   4 bytes  delta in int16 multiples of `quantum`
+#
+# The delta encodings are closed-loop: the writer subtracts the
+# position the READER will have decoded, not the previous true one, so
+# rounding errors never add up. The error stays below half a float16
+# step of one step's motion / half a quantum, and drops to zero at
+# every keyframe. A motion too large for the format forces a keyframe.
+#
+# ----------------------------------------------------------------------
+#
+# =========================
+# SEEKING
+# =========================
+#
+#   offset = idx[frame // interval]       (one 8-byte read)
+#   decode that keyframe, then at most interval - 1 deltas
+#
+# The cost is O(1) in the length of the recording: a seek never reads
+# the stream before the keyframe. Playing forward reads the next chunk
+# only. bytes_read counts what a reader has read.
+#
+# Recording costs one subtraction, one cast and one buffered write per
+# step (benchmarks/bench_trajectory.py measures it against step time).
+#
+# ======================================================================
+#                       IMPROVEMENT SECTION
+# ======================================================================
+#
+# 1. Index Rebuild
+#    - Recreate a lost .idx by scanning the keyframe chunks once.
+#
+# 2. Velocities / Colors Over Time
+#    - Record more columns for analysis, not just drawing.
+#
+# ======================================================================
@@ -0,0 +1,315 @@
+# ============================================================
+# World (Headless Physics Engine)
+# ============================================================
+# Owns the bodies and advances them in time. Knows nothing
+# about windows, fonts or input: it never imports pygame, so
+# batch jobs can run it on machines without a display.
+# ============================================================
+
+from time import perf_counter
+
+import utils.constants as C
+from physics.body_store import BodyStore
+from physics.gravity import gravity_accelerations, gravity_accelerations_for
+from physics.barnes_hut import barnes_hut_accelerations
+from physics.particle_mesh import particle_mesh_accelerations
+from physics.parallel_gravity import parallel_gravity_accelerations
+from physics.integrator import FIXED_STEP_INTEGRATORS
+from physics.block_timestep import BlockTimestep
+from physics.broad_phase import SpatialHash
+from physics.aabb_tree import AABBTreeBroadPhase
+from physics.collision import resolve_collisions_batched
+
+
+# ------------------------------------------------------------
+# Gravity solvers (name → accelerations(positions, masses, radii, G))
+# ------------------------------------------------------------
+GRAVITY_SOLVERS = {
+    "pairwise": gravity_accelerations,
+    "barnes_hut": barnes_hut_accelerations,
+    "particle_mesh": particle_mesh_accelerations,
+    "parallel": parallel_gravity_accelerations,
+}
+
+# ------------------------------------------------------------
+# Integrators (name → class)
+# ------------------------------------------------------------
+INTEGRATORS = dict(FIXED_STEP_INTEGRATORS)
+INTEGRATORS[BlockTimestep.name] = BlockTimestep
+
+# ------------------------------------------------------------
+# Collision broad phases (name → class)
+# ------------------------------------------------------------
+BROAD_PHASES = {
+    "grid": SpatialHash,
+    "aabb_tree": AABBTreeBroadPhase,
+}
+
+
+class World:
+    def __init__(self, width=C.WIDTH, height=C.HEIGHT, G=C.G, damping=1.0,
+                 restitution=0.6, boundary_restitution=0.9,
+                 gravity_solver=C.GRAVITY_SOLVERS[0], broad_phase=C.BROAD_PHASE,
+                 integrator=C.INTEGRATOR):
+        # ----------------------------------------------------
+        # Bodies
+        # ----------------------------------------------------
+        self.bodies = BodyStore()
+
+        # ----------------------------------------------------
+        # Domain & Physical Parameters
+        # ----------------------------------------------------
+        self.width = width
+        self.height = height
+        self.G = G
+        self.damping = damping
+        self.restitution = restitution
+        self.boundary_restitution = boundary_restitution
+
+        # ----------------------------------------------------
+        # Toggles
+        # ----------------------------------------------------
+        self.gravity_enabled = True
+        self.collisions_enabled = True
+        self.boundaries_enabled = True
+
+        # ----------------------------------------------------
+        # Solvers
+        # ----------------------------------------------------
+        self.gravity_solver = gravity_solver
+        self.integrator = INTEGRATORS[integrator]()
+        self.broad_phase = BROAD_PHASES[broad_phase]()
+
+        # Step whose positions the broad phase last indexed
+        self._indexed_step = -1
+
+        # ----------------------------------------------------
+        # Statistics of the last substep
+        # ----------------------------------------------------
+        self.pair_tests = 0
+        self.contacts = 0
+        self.steps = 0
+
+        # Seconds spent per phase, summed over all substeps so far
+        self.phase_times = {"gravity": 0.0, "collisions": 0.0, "boundaries": 0.0}
+
+        # (phase, start, end) spans while a profile capture runs
+        self.trace = None
+
+        # Trajectory writer fed after every step while recording
+        # (physics/trajectory.py)
+        self.recorder = None
+
+    # --------------------------------------------------------
+    # Body Management
+    # --------------------------------------------------------
+    def add_body(self, position, velocity, mass, radius, color, body_id=None, material=None):
+        # Auto-number past the largest id in use
+        if body_id is None:
+            body_id = self.bodies.next_id()
+        return self.bodies.add(position, velocity, mass, radius, color, body_id, material)
+
+    def remove_body(self, body):
+        self.bodies.remove(body)
+
+    def replace_bodies(self, store):
+        # Swap in another BodyStore (e.g. a loaded checkpoint)
+        self.bodies = store
+        self._indexed_step = -1
+
+    def __len__(self):
+        return len(self.bodies)
+
+    # --------------------------------------------------------
+    # Rows of the bodies whose AABB overlaps a region
+    # --------------------------------------------------------
+    @property
+    def indexed(self):
+        # True when the broad phase holds the current step's bodies
+        return self._indexed_step == self.steps
+
+    def query_region(self, x0, y0, x1, y1):
+        # The collision pass indexes the bodies every substep; index
+        # them here only if it did not run for the current state
+        if not self.indexed:
+            self.broad_phase.sync(self.bodies)
+            self._indexed_step = self.steps
+        return self.broad_phase.query_region(self.bodies, x0, y0, x1, y1)
+
+    # --------------------------------------------------------
+    # Time Stepping
+    # --------------------------------------------------------
+    def step(self, dt, substeps=1):
+        h = dt / substeps
+
+        # Damping is specified per step; spread it over the substeps
+        damping = self.damping ** (1.0 / substeps)
+
+        for _ in range(substeps):
+            self._substep(h, damping)
+
+        if self.recorder is not None:
+            self.recorder.record(self)
+
+    # --------------------------------------------------------
+    # Accelerations from the selected gravity solver
+    # --------------------------------------------------------
+    def accelerations(self, positions, masses, radii, targets=None):
+        # Direct summation can evaluate just the target rows
+        if targets is not None and self.gravity_solver == "pairwise":
+            return gravity_accelerations_for(targets, positions, masses, radii, self.G)
+        if targets is not None and self.gravity_solver == "parallel":
+            return parallel_gravity_accelerations(positions, masses, radii, self.G, targets=targets)
+
+        # The mesh covers this World's domain (0, 0)–(width, height)
+        if self.gravity_solver == "particle_mesh":
+            acc = particle_mesh_accelerations(
+                positions, masses, radii, self.G,
+                width=self.width, height=self.height, origin=(0.0, 0.0)
+            )
+            return acc if targets is None else acc[targets]
+
+        acc = GRAVITY_SOLVERS[self.gravity_solver](positions, masses, radii, self.G)
+        return acc if targets is None else acc[targets]
+
+    def _substep(self, dt, damping):
+        bodies = self.bodies
+        times = self.phase_times
+        start = perf_counter()
+
+        # Integrate motion under mutual gravity, or drift freely
+        if self.gravity_enabled:
+            self.integrator.step(bodies, dt, self.accelerations, (self.gravity_solver, self.G))
+        else:
+            bodies.update(dt)
+        now = perf_counter()
+        times["gravity"] += now - start
+        if self.trace is not None:
+            self.trace.append(("gravity", start, now))
+        start = now
+
+        # Body-body collisions (broad phase → batched narrow phase)
+        if self.collisions_enabled:
+            pairs_i, pairs_j = self.broad_phase.candidate_pairs_for(bodies)
+            self.pair_tests = self.broad_phase.pair_tests
+            self._indexed_step = self.steps + 1
+            self.contacts = resolve_collisions_batched(
+                bodies, pairs_i, pairs_j, self.restitution
+            )
+        else:
+            self.pair_tests = 0
+            self.contacts = 0
+        now = perf_counter()
+        times["collisions"] += now - start
+        if self.trace is not None:
+            self.trace.append(("collisions", start, now))
+        start = now
+
+        # Boundary collisions + damping
+        if self.boundaries_enabled:
+            bodies.handle_boundary_collisions(self.width, self.height, self.boundary_restitution)
+        if damping != 1.0:
+            bodies.apply_damping(damping)
+        now = perf_counter()
+        times["boundaries"] += now - start
+        if self.trace is not None:
+            self.trace.append(("boundaries", start, now))
+
+        self.steps += 1
+
+
+
+
+
+# ======================================================================
+#                           TEACHING SECTION
+# ======================================================================
+#
+# File: world.py
+#
+# Role of this file:
+# ------------------
+# World is the physics engine on its own: bodies + parameters + step().
+# The interactive loop (core/simulation_loop.py) drives a World and adds
+# input and rendering around it; batch jobs drive a World directly.
+#
+# Mirrors cpp/include/physics/world.h so the engine can later move to
+# the C++ backend behind the same interface.
+#
+# ----------------------------------------------------------------------
+#
+# =========================
+# CLASS: World
+# =========================
+#
+# World(width, height, G, damping, restitution, boundary_restitution,
+#       gravity_solver, broad_phase, integrator)
+#
+# Attributes:
+#   bodies              : BodyStore
+#   gravity_enabled     : bool
+#   collisions_enabled  : bool
+#   boundaries_enabled  : bool
+#   gravity_solver      : key of GRAVITY_SOLVERS
+#   integrator          : Integrator instance (physics/integrator.py,
+#                         physics/block_timestep.py)
+#   damping             : velocity factor applied once per step()
+#   pair_tests/contacts : collision statistics of the last substep
+#   phase_times         : cumulative seconds in "gravity" (integration),
+#                         "collisions" and "boundaries" (+ damping);
+#                         core/telemetry.py reads the per-frame growth
+#   trace               : None, or a list receiving (phase, start, end)
+#                         per substep while core/profiler.py captures
+#
+# add_body(position, velocity, mass, radius, color, body_id=None, material=None)
+#   - Adds a body (auto-numbered id when body_id is None), returns its view
+#
+# remove_body(body)
+#   - Swap-removes the body from the store
+#
+# replace_bodies(store)
+#   - Makes `store` the World's bodies (checkpoint restore) and marks
+#     the broad-phase index stale
+#
+# query_region(x0, y0, x1, y1)
+#   - Sorted rows of the bodies whose bounding box overlaps the region,
+#     answered by the broad phase's index (e.g. camera culling).
+#     Positions changed after the last collision pass (boundary pushes,
+#     dragging while paused) are not re-indexed: pad the region a little
+#
+# indexed
+#   - True when the broad phase was built from the current step (the
+#     collision pass ran), so its buckets can be reused or copied
+#
+# step(dt, substeps=1)
+#   - Splits dt into equal substeps; each substep runs:
+#       1. integrate         (integrator + gravity solver if gravity is
+#                             enabled, otherwise a plain drift)
+#       2. collisions        (if enabled)
+#       3. boundaries        (if enabled)
+#       4. damping           (damping^(1/substeps), so the total per
+#                             step() call does not depend on substeps)
+#   - Then, if world.recorder is set (a TrajectoryWriter), appends the
+#     new positions to the recording
+#
+# ----------------------------------------------------------------------
+#
+# =========================
+# WHY NO PYGAME HERE
+# =========================
+#
+# - Render-less servers can run simulations at full CPU speed
+# - Physics can be tested and benchmarked without a display
+# - Keeps the dependency direction clean: core → physics, never back
+#
+# ======================================================================
+#                       IMPROVEMENT SECTION
+# ======================================================================
+#
+# 1. Energy Diagnostics
+#    - Report kinetic and potential energy per step.
+#
+# 2. Event Hooks
+#    - Callbacks for contacts and boundary hits.
+#
+# ======================================================================
@@ -0,0 +1,155 @@
+# ============================================================
+# Camera (Pan / Zoom / Follow)
+# ============================================================
+# Maps world coordinates to screen pixels and back, and gives
+# the world region in view so the renderer can ask the broad
+# phase for the visible bodies instead of drawing all of them.
+# ============================================================
+
+import numpy as np
+
+import utils.constants as C
+
+
+class Camera:
+    def __init__(self, width=C.WIDTH, height=C.HEIGHT):
+        # Screen size in pixels
+        self.width = width
+        self.height = height
+        self.reset()
+
+    # --------------------------------------------------------
+    # Home view: world (0, 0) at the top-left, 1 px per unit
+    # --------------------------------------------------------
+    def reset(self):
+        self.center = [self.width / 2, self.height / 2]     # world point at screen center
+        self.zoom = 1.0                                     # screen pixels per world unit
+        self.following = False
+
+    @property
+    def is_home(self):
+        return (self.zoom == 1.0 and not self.following
+                and self.center == [self.width / 2, self.height / 2])
+
+    # --------------------------------------------------------
+    # World ⇄ screen
+    # --------------------------------------------------------
+    def world_to_screen(self, positions):
+        # (n, 2) (or (2,)) world positions → screen positions
+        return (np.asarray(positions) - self.center) * self.zoom + (self.width / 2, self.height / 2)
+
+    def screen_to_world(self, x, y):
+        return (
+            self.center[0] + (x - self.width / 2) / self.zoom,
+            self.center[1] + (y - self.height / 2) / self.zoom,
+        )
+
+    # --------------------------------------------------------
+    # World region on screen (x0, y0, x1, y1), grown by margin
+    # --------------------------------------------------------
+    def view_rect(self, margin=0.0):
+        half_w = self.width / 2 / self.zoom + margin
+        half_h = self.height / 2 / self.zoom + margin
+        x, y = self.center
+        return (x - half_w, y - half_h, x + half_w, y + half_h)
+
+    # --------------------------------------------------------
+    # Controls
+    # --------------------------------------------------------
+    def pan(self, dx, dy):
+        # Drag by (dx, dy) screen pixels: the world moves with the mouse
+        self.center[0] -= dx / self.zoom
+        self.center[1] -= dy / self.zoom
+        self.following = False
+
+    def zoom_at(self, factor, x, y):
+        # Keep the world point under screen (x, y) in place
+        zoom = min(max(self.zoom * factor, C.CAMERA_MIN_ZOOM), C.CAMERA_MAX_ZOOM)
+        wx, wy = self.screen_to_world(x, y)
+        self.zoom = zoom
+        if not self.following:
+            self.center[0] = wx - (x - self.width / 2) / zoom
+            self.center[1] = wy - (y - self.height / 2) / zoom
+
+    def follow(self, position):
+        self.center = [float(position[0]), float(position[1])]
+
+
+# ------------------------------------------------------------
+# Rows of the bodies to draw this frame (sorted); `world` is a
+# World or a physics snapshot (anything with query_region)
+# ------------------------------------------------------------
+def visible_rows(world, camera, active_index=None):
+    rows = world.query_region(*camera.view_rect(C.CULL_MARGIN))
+
+    # The active body may have been dragged since the last index
+    if active_index is not None:
+        at = np.searchsorted(rows, active_index)
+        if at == len(rows) or rows[at] != active_index:
+            rows = np.insert(rows, at, active_index)
+    return rows
+
+
+
+
+
+# ======================================================================
+#                           TEACHING SECTION
+# ======================================================================
+#
+# File: camera.py
+#
+# Role of this file:
+# ------------------
+# Physics works in world units; the window shows some region of the
+# world. Without a camera both are the same 800 x 800 square, and every
+# body is drawn even when it is far outside the window.
+#
+# ----------------------------------------------------------------------
+#
+# =========================
+# CLASS: Camera
+# =========================
+#
+#   screen = (world - center) * zoom + screen_size / 2
+#   world  = center + (screen - screen_size / 2) / zoom
+#
+# center  : world point shown at the middle of the window
+# zoom    : screen pixels per world unit, C.CAMERA_MIN_ZOOM..MAX_ZOOM
+#
+# Home view (reset, key H): center = window center, zoom = 1, so world
+# and screen coordinates coincide as before the camera existed.
+#
+# Controls (core/input.py):
+#   mouse wheel        : zoom_at the cursor (the point under it stays)
+#   middle mouse drag  : pan
+#   F                  : follow the active body (the loop re-centers on
+#                        its interpolated position every frame)
+#
+# ----------------------------------------------------------------------
+#
+# =========================
+# CULLING (visible_rows)
+# =========================
+#
+# The view rect (grown by C.CULL_MARGIN world units) goes to
+# World.query_region, which answers from the broad phase's grid or AABB
+# tree, already built by the collision pass. The loop asks the physics
+# snapshot instead (Snapshot.query_region), which carries a copy of that
+# grid, so culling never touches the World the physics thread steps. Only bodies near the view
+# are touched, so drawing cost follows what is visible rather than the
+# number of bodies. The margin covers motion since the index was built
+# (interpolation, boundary pushes); the active body is always included
+# because it can be dragged while paused.
+#
+# ======================================================================
+#                       IMPROVEMENT SECTION
+# ======================================================================
+#
+# 1. Smooth Camera
+#    - Ease center and zoom towards their targets instead of jumping.
+#
+# 2. Minimap
+#    - Draw the whole world and the view rect in a corner.
+#
+# ======================================================================
@@ -0,0 +1,157 @@
+# ============================================================
+# Dirty-Rectangle Rendering
+# ============================================================
+# Instead of filling and flipping the whole window every frame,
+# only the regions drawn last frame are restored from a cached
+# background, and only the regions drawn this frame or last
+# frame are pushed to the display. Large changes fall back to
+# one full flip.
+# ============================================================
+
+import pygame
+
+import utils.constants as C
+
+
+class DirtyRectRenderer:
+    def __init__(self, screen, background=C.BACKGROUND_COLOR, full_fraction=C.DIRTY_FULL_FRACTION):
+        self.screen = screen
+        self.full_fraction = full_fraction
+        self.set_background(background)
+
+        self._previous = set()      # rects drawn last frame
+        self._current = []          # rects drawn this frame
+
+        # Statistics of the last present()
+        self.full_frame = True
+        self.updated_rects = 0
+        self.updated_area = 0
+
+    # --------------------------------------------------------
+    # Background: a color or a pre-composed Surface
+    # --------------------------------------------------------
+    def set_background(self, background):
+        if isinstance(background, pygame.Surface):
+            self.background = background.copy()
+        else:
+            self.background = pygame.Surface(self.screen.get_size()).convert(self.screen)
+            self.background.fill(background)
+        self.invalidate()
+
+    # --------------------------------------------------------
+    # Next present() redraws and pushes the whole window
+    # --------------------------------------------------------
+    def invalidate(self):
+        self._full = True
+
+    # --------------------------------------------------------
+    # Erase last frame's drawings (start of a frame)
+    # --------------------------------------------------------
+    def begin_frame(self):
+        if self._full:
+            self.screen.blit(self.background, (0, 0))
+        elif self._previous:
+            background = self.background
+            self.screen.blits(
+                [(background, rect, rect) for rect in self._previous], doreturn=False
+            )
+        self._current = []
+
+    # --------------------------------------------------------
+    # Regions drawn this frame: (x, y, w, h) tuples or Rects
+    # --------------------------------------------------------
+    def mark(self, rect):
+        self._current.append(tuple(rect))
+
+    def mark_many(self, rects):
+        self._current.extend(rects)
+
+    # --------------------------------------------------------
+    # Push changed regions to the display (end of a frame)
+    # --------------------------------------------------------
+    def present(self):
+        current = set(self._current)
+
+        # Everything drawn this frame (a rect at the same place may
+        # hold new pixels: a counter, a splat image) plus everything
+        # erased from last frame
+        changed = current | self._previous
+        area = sum(w * h for _, _, w, h in changed)
+        width, height = self.screen.get_size()
+
+        if self._full or area > self.full_fraction * width * height:
+            pygame.display.flip()
+            self.full_frame = True
+            self.updated_rects = 1
+            self.updated_area = width * height
+        else:
+            if changed:
+                pygame.display.update(list(changed))
+            self.full_frame = False
+            self.updated_rects = len(changed)
+            self.updated_area = area
+
+        self._previous = current
+        self._full = False
+
+
+
+
+
+# ======================================================================
+#                           TEACHING SECTION
+# ======================================================================
+#
+# File: dirty_rects.py
+#
+# Role of this file:
+# ------------------
+# screen.fill + pygame.display.flip touch all 800 x 800 pixels twice per
+# frame: once to clear, once to send the window to the display. When a
+# few bodies move over a still background, almost all of that work
+# reproduces the previous frame.
+#
+# ----------------------------------------------------------------------
+#
+# =========================
+# ONE FRAME
+# =========================
+#
+# begin_frame()  : blit the cached background over every rect drawn
+#                  last frame (one blits call), or over the whole
+#                  screen after invalidate()
+# draw …, mark() : draw as usual and record the rects drawn
+#                  (draw_bodies reports body / label rects itself)
+# present()      : changed = previous | current rects
+#                  - a body that moved leaves its old rect (restored
+#                    background) and its new rect (drawn) in `changed`
+#                  - a rect at the same place in both frames is pushed
+#                    too: its pixels may differ (HUD counters, the
+#                    telemetry panel, the splat image), and only the
+#                    caller knows
+#                  - the screen outside both sets is never touched
+#                  pygame.display.update(changed), or one flip when the
+#                  changed area exceeds DIRTY_FULL_FRACTION of the window
+#                  (many small updates cost more than one big one)
+#
+# Everything the screen shows must be drawn via this renderer and
+# marked; drawing elsewhere needs invalidate() (e.g. switching screens,
+# window re-exposed).
+#
+# Statistics of the last frame: full_frame, updated_rects, updated_area.
+#
+# ======================================================================
+#                       IMPROVEMENT SECTION
+# ======================================================================
+#
+# 1. Rect Merging
+#    - Merge heavily overlapping rects before display.update.
+#
+# 2. Static Layers
+#    - Bake bodies that have not moved for a while into the background.
+#
+# 3. Unchanged Rects
+#    - Let callers mark a rect as unchanged (same sprite, same place)
+#      so still bodies are not re-sent to the display.
+#
+# ======================================================================
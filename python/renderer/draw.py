@@ -21,44 +21,65 @@ def clear_screen(screen, color):
 # ------------------------------------------------------------
 def draw_text(screen, text, pos, font, color):
     text_surface = font.render(text, True, color)
-    screen.blit(text_surface, pos)
+    return screen.blit(text_surface, pos)
 
 
 # ------------------------------------------------------------
-# Draw a physics body (currently rendered as a circle)
+# Draw one physics body as a circle (legacy per-body path; the
+# simulation draws with renderer/sprites.draw_bodies)
 # ------------------------------------------------------------
-def draw_body(screen, body, font):
+def draw_body(screen, body, text_cache):
+    radius = body.radius
+    center = (int(body.position[0]), int(body.position[1]))
+
     pygame.draw.circle(
         screen,
         body.color,
-        (int(body.position[0]), int(body.position[1])),
-        body.radius
+        center,
+        radius
     )
 
-    # Draw body ID at the center
-    text_surface = font.render(str(body.id), True, (0, 0, 0))
-    text_rect = text_surface.get_rect(
-        center=(
-            int(body.position[0]),
-            int(body.position[1])
-        )
-    )
-    screen.blit(text_surface, text_rect)
+    # Draw body ID at the center (cached; too small bodies skip it)
+    if radius >= C.LABEL_MIN_RADIUS:
+        text_surface = text_cache.render(str(body.id), C.LABEL_FONT_SIZE, (0, 0, 0))
+        text_rect = text_surface.get_rect(center=center)
+        screen.blit(text_surface, text_rect)
 
 
 # ------------------------------------------------------------
-# Draw visual highlight for the active body
+# Outline of the world's boundary box as seen by the camera
 # ------------------------------------------------------------
-def draw_active_shadow(screen, body):
-    SHADOW_COLOR = C.LIGHT_GRAY
-    SHADOW_RADIUS = body.radius + 4
+def draw_world_bounds(screen, camera, width, height, color):
+    x0, y0 = camera.world_to_screen((0.0, 0.0)).tolist()
+    x1, y1 = camera.world_to_screen((width, height)).tolist()
+    corners = [(x0, y0), (x1, y0), (x1, y1), (x0, y1)]
 
-    pygame.draw.circle(
-        screen,
-        SHADOW_COLOR,
-        (int(body.position[0]), int(body.position[1])),
-        SHADOW_RADIUS
-    )
+    # Four thin lines instead of one rect: their dirty rects stay thin
+    return [
+        pygame.draw.line(screen, color, corners[k], corners[(k + 1) % 4])
+        for k in range(4)
+    ]
+
+
+# ------------------------------------------------------------
+# Frame timing overlay (core/telemetry.py stats, in ms)
+# ------------------------------------------------------------
+def draw_telemetry(screen, font, stats, counters, pos=(C.WIDTH - 300, 80)):
+    x, y = pos
+    line_height = font.get_linesize()
+
+    header = f"{'phase':<11}{'mean':>7}{'p50':>7}{'p95':>7}{'p99':>7}"
+    area = draw_text(screen, header, (x, y), font, C.ACCENT_COLOR)
+    y += line_height
+
+    for name, s in stats.items():
+        text = f"{name:<11}{s['mean']:>7.2f}{s['p50']:>7.2f}{s['p95']:>7.2f}{s['p99']:>7.2f}"
+        area.union_ip(draw_text(screen, text, (x, y), font, C.TEXT_COLOR))
+        y += line_height
+
+    text = "  ".join(f"{name} {value}" for name, value in counters.items())
+    area.union_ip(draw_text(screen, text, (x, y), font, C.LIGHT_GRAY))
+    return area
 
 
 
@@ -118,6 +139,7 @@ def draw_active_shadow(screen, body):
 #   - Renders text onto the screen
 #   - Used for UI elements and labels
 #   - Abstracts text rendering logic
+#   - Returns the Rect it covered (for dirty-rect rendering)
 #
 # ----------------------------------------------------------------------
 #
@@ -125,18 +147,28 @@ def draw_active_shadow(screen, body):
 # FUNCTION: draw_body
 # =========================
 #
-# draw_body(screen, body, font)
+# draw_body(screen, body, text_cache)
 #
 # ----------------------------------------------------------------------
 # Inputs:
-#   - screen : pygame.Surface
-#   - body   : Body
-#   - font   : pygame.font.Font
+#   - screen     : pygame.Surface
+#   - body       : Body
+#   - text_cache : TextCache (renderer/text_cache.py)
+#
+# Status:
+#   - Legacy: the simulation loop draws all bodies (with camera,
+#     culling and the active-body ring) through
+#     renderer/sprites.draw_bodies. draw_body is kept as the per-body
+#     baseline that benchmarks/suite.py times ("draw" stage) against
+#     the batched path ("draw_batched"). Positions are used as screen
+#     coordinates; there is no camera mapping.
 #
 # Purpose:
 #   - Draws a physical body as a circle
 #   - Visualizes body position and size
-#   - Displays the body ID for identification
+#   - Displays the body ID for identification; the label surface comes
+#     from the cache, and bodies smaller than C.LABEL_MIN_RADIUS get no
+#     label (it would not fit)
 #
 # Rendering details:
 #   - Circle center → body.position
@@ -146,23 +178,38 @@ def draw_active_shadow(screen, body):
 # ----------------------------------------------------------------------
 #
 # =========================
-# FUNCTION: draw_active_shadow
+# FUNCTION: draw_world_bounds
 # =========================
 #
-# draw_active_shadow(screen, body)
+# draw_world_bounds(screen, camera, width, height, color)
 #
 # ----------------------------------------------------------------------
 # Inputs:
-#   - screen : pygame.Surface
-#   - body   : Body
+#   - camera        : Camera (renderer/camera.py)
+#   - width, height : world size (boundary collision box)
 #
 # Purpose:
-#   - Highlights the currently active body
-#   - Improves user interaction clarity
-#   - Makes control focus visually obvious
+#   - Shows where the walls are once the camera has zoomed or panned
+#     away from the home view
+#   - Returns the four line rects (for dirty-rect rendering)
+#
+# ----------------------------------------------------------------------
+#
+# =========================
+# FUNCTION: draw_telemetry
+# =========================
+#
+# draw_telemetry(screen, font, stats, counters, pos)
+#
+# ----------------------------------------------------------------------
+# Inputs:
+#   - stats    : FrameTimer.stats() → {phase: {mean, p50, p95, p99}} ms
+#   - counters : last frame's counts (steps, bodies, pair tests, contacts)
+#   - pos      : top-left corner of the table
 #
-# Visual behavior:
-#   - Draws a slightly larger circle
-#   - Uses a neutral highlight color
+# Purpose:
+#   - Shows where frame time goes (toggle with T)
+#   - A monospace font keeps the columns aligned
+#   - Returns the Rect covering the whole table
 #
 # ---------------------------------------------------------
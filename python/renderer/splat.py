@@ -0,0 +1,221 @@
+# ============================================================
+# Splat Renderer (Level of Detail for Huge Body Counts)
+# ============================================================
+# Bodies too small to be worth a circle are accumulated into an
+# image with NumPy (np.bincount, bilinear sub-pixel weights),
+# written into a Surface via pygame.surfarray and added onto
+# the screen.
+# Only the larger bodies still go through the sprite path.
+# ============================================================
+
+import numpy as np
+import pygame
+
+import utils.constants as C
+from renderer.sprites import draw_bodies
+
+
+# ------------------------------------------------------------
+# Density colour map: dark → purple → orange → pale yellow
+# ------------------------------------------------------------
+_ANCHORS = np.array([
+    (0, 0, 0),
+    (70, 15, 110),
+    (185, 45, 90),
+    (250, 140, 35),
+    (255, 250, 200),
+], dtype=np.float64)
+
+COLORMAP = np.stack([
+    np.interp(np.linspace(0, 1, 256), np.linspace(0, 1, len(_ANCHORS)), _ANCHORS[:, c])
+    for c in range(3)
+], axis=1).astype(np.uint8)
+
+
+# ------------------------------------------------------------
+# Bilinear footprint: each body spreads over the 4 pixels whose
+# centers surround it, so slow motion stays smooth. Indices are
+# into a grid padded by one pixel on every side, so no corner
+# needs its own bounds check.
+# ------------------------------------------------------------
+def _footprint(positions, width, height):
+    u = positions[:, 0] - 0.5
+    v = positions[:, 1] - 0.5
+    x0 = np.floor(u)
+    y0 = np.floor(v)
+
+    # Bodies with at least one corner on screen
+    keep = (x0 >= -1) & (x0 < width) & (y0 >= -1) & (y0 < height)
+    fx = u[keep] - x0[keep]
+    fy = v[keep] - y0[keep]
+    gx = 1 - fx
+    gy = 1 - fy
+
+    stride = height + 2
+    base = (x0[keep].astype(np.intp) + 1) * stride + y0[keep].astype(np.intp) + 1
+    index = np.concatenate((base, base + stride, base + 1, base + stride + 1))
+    share = np.concatenate((gx * gy, fx * gy, gx * fy, fx * fy))
+    return index, share, keep
+
+
+# Flat padded image of summed weights (1 per body without weights)
+def _accumulate(positions, weights, width, height):
+    index, share, keep = _footprint(positions, width, height)
+    if weights is not None:
+        share *= np.tile(weights[keep], 4)
+    return np.bincount(index, share, (width + 2) * (height + 2))
+
+
+# ------------------------------------------------------------
+# Sum of weights per pixel, (width, height) like surfarray
+# ------------------------------------------------------------
+def accumulate(positions, weights, width, height):
+    image = _accumulate(positions, weights, width, height)
+    return image.reshape(width + 2, height + 2)[1:-1, 1:-1]
+
+
+# ------------------------------------------------------------
+# Add small bodies into the screen; returns the touched Rect
+# ------------------------------------------------------------
+def splat_bodies(screen, positions, color_index, palette, mode=C.SPLAT_MODE, gain=C.SPLAT_GAIN):
+    width, height = screen.get_size()
+    if len(positions) == 0:
+        return None
+
+    # Pixels any body can reach (the cloud's bounding box)
+    x_lo = max(int(np.floor(positions[:, 0].min() - 0.5)), 0)
+    x_hi = min(int(np.floor(positions[:, 0].max() - 0.5)) + 2, width)
+    y_lo = max(int(np.floor(positions[:, 1].min() - 0.5)), 0)
+    y_hi = min(int(np.floor(positions[:, 1].max() - 0.5)) + 2, height)
+    if x_lo >= x_hi or y_lo >= y_hi:
+        return None
+    box = (slice(x_lo + 1, x_hi + 1), slice(y_lo + 1, y_hi + 1))
+
+    def crop(image):
+        return image.reshape(width + 2, height + 2)[box].astype(np.float32)
+
+    # Splat image of the box, same pixel format as the screen
+    layer = pygame.Surface((x_hi - x_lo, y_hi - y_lo), 0, screen)
+    pixels = pygame.surfarray.pixels3d(layer)
+
+    if mode == "density":
+        # Bodies per pixel on a log scale through the colour map
+        counts = crop(_accumulate(positions, None, width, height))
+        level = np.log1p(counts) * np.float32(255 / np.log1p(C.SPLAT_DENSITY_SATURATION))
+        level = np.minimum(level, 255).astype(np.intp)
+        for c in range(3):
+            pixels[:, :, c] = COLORMAP[:, c][level]
+    else:
+        # Every body adds a fraction of its own colour: one scalar
+        # image per colour present (dust usually shares one)
+        if color_index.min() == color_index.max():
+            groups = [(int(color_index[0]), positions)]
+        else:
+            groups = [(k, positions[color_index == k]) for k in np.unique(color_index).tolist()]
+        layers = [
+            (palette[k] * gain, crop(_accumulate(group, None, width, height)))
+            for k, group in groups
+        ]
+        channel = np.empty(layers[0][1].shape, np.float32)
+        scratch = np.empty_like(channel)
+        for c in range(3):
+            channel.fill(0)
+            for color, image in layers:
+                channel += np.multiply(image, np.float32(color[c]), out=scratch)
+            np.minimum(channel, 255, out=channel)
+            pixels[:, :, c] = channel
+
+    del pixels              # unlock the layer before blitting it
+
+    # Saturating per-channel add, done by SDL
+    return screen.blit(layer, (x_lo, y_lo), special_flags=pygame.BLEND_RGB_ADD)
+
+
+# ------------------------------------------------------------
+# Level of detail: splats for small bodies, sprites for the rest
+# ------------------------------------------------------------
+def draw_bodies_lod(screen, store, sprites, text_cache, positions=None, active_index=None,
+                    dirty=None, rows=None, scale=1.0):
+    if rows is None:
+        rows = np.arange(len(store))
+    if positions is None:
+        positions = store.positions[rows]
+
+    # Few bodies: every body is a proper circle
+    if len(rows) < C.SPLAT_MIN_BODIES:
+        draw_bodies(screen, store, sprites, text_cache, positions, active_index, dirty, rows, scale)
+        return
+
+    # Small on screen (zoom included)
+    small = store.radii[rows] * scale < C.SPLAT_RADIUS
+    if active_index is not None:
+        small[rows == active_index] = False
+
+    palette = store.palette_array().astype(np.float64)
+    rect = splat_bodies(screen, positions[small], store.color_index[rows[small]], palette)
+    if rect is not None and dirty is not None:
+        dirty.mark(rect)
+
+    large = ~small
+    draw_bodies(
+        screen, store, sprites, text_cache, positions[large], active_index, dirty,
+        rows[large], scale
+    )
+
+
+
+
+# ======================================================================
+#                           TEACHING SECTION
+# ======================================================================
+#
+# File: splat.py
+#
+# Role of this file:
+# ------------------
+# At 100k bodies even one blit per body is too slow, and most of those
+# bodies are dust a pixel or two across. Drawn as points, what the eye
+# reads is their density. NumPy can sum 100k points into an image in a
+# few milliseconds, and pygame.surfarray exposes a Surface's pixels as
+# a NumPy array to write that image into.
+#
+# ----------------------------------------------------------------------
+#
+# =========================
+# PIPELINE (draw_bodies_lod)
+# =========================
+#
+# Same arguments as draw_bodies (rows = bodies to draw, positions one per
+# row, scale = camera zoom).
+#
+# 1. Fewer than C.SPLAT_MIN_BODIES bodies → draw_bodies (sprites) only
+# 2. Bodies with screen radius < C.SPLAT_RADIUS (and not the active body)
+#    → splat_bodies; all others → draw_bodies(rows=…) on top
+# 3. Bilinear weights to the 4 nearest pixel centers, np.bincount into
+#    a flat image padded by one pixel (off-screen corners land in the
+#    padding instead of needing a bounds check each)
+# 4. Crop to the cloud's bounding box, colour it channel by channel
+#    (float32) into a layer Surface via pygame.surfarray.pixels3d,
+#    then one blit with BLEND_RGB_ADD: SDL adds it onto the screen
+#    with per-channel saturation
+#
+# Modes (C.SPLAT_MODE):
+#   "additive" : each body adds C.SPLAT_GAIN x its colour; overlapping
+#                dust brightens towards white
+#   "density"  : bodies per pixel, log scaled (C.SPLAT_DENSITY_SATURATION
+#                bodies = top of the scale) through COLORMAP
+#
+# The touched rect is reported to the DirtyRectRenderer; a large splat
+# area makes it fall back to one full flip.
+#
+# ======================================================================
+#                       IMPROVEMENT SECTION
+# ======================================================================
+#
+# 1. Gaussian Splats
+#    - Blur the density image for smoother clouds at low counts.
+#
+# 2. Mass-Weighted Density
+#    - Weight splats by mass to show where the matter is, not the count.
+#
+# ======================================================================
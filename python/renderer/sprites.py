@@ -0,0 +1,253 @@
+# ============================================================
+# Circle Sprites (Pre-Rendered Bodies + Batched Blits)
+# ============================================================
+# Every (radius, color) circle is rasterized once into a small
+# Surface and reused. A frame draws all bodies with a single
+# Surface.blits call, ordered by sprite.
+# ============================================================
+
+from collections import OrderedDict
+from itertools import chain, repeat
+
+import numpy as np
+import pygame
+import pygame.gfxdraw
+
+import utils.constants as C
+
+
+# ------------------------------------------------------------
+# Memory-bounded LRU cache of circle sprites
+# ------------------------------------------------------------
+class SpriteCache:
+    def __init__(self, max_pixels=C.SPRITE_CACHE_PIXELS, antialias=C.SPRITE_ANTIALIAS):
+        self.max_pixels = max_pixels
+        self.antialias = antialias
+        self.pixels = 0
+        self._sprites = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    # --------------------------------------------------------
+    # Sprite of a circle; blit it at (x - radius, y - radius)
+    # --------------------------------------------------------
+    def get(self, radius, color):
+        radius = max(int(radius), 1)
+        key = (radius, tuple(color))
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self._sprites.move_to_end(key)
+            self.hits += 1
+            return sprite
+
+        self.misses += 1
+        sprite = self._rasterize(radius, key[1])
+        self._sprites[key] = sprite
+        self.pixels += sprite.get_width() * sprite.get_height()
+
+        # Evict least recently used sprites beyond the pixel budget
+        while self.pixels > self.max_pixels and len(self._sprites) > 1:
+            _, old = self._sprites.popitem(last=False)
+            self.pixels -= old.get_width() * old.get_height()
+        return sprite
+
+    def _rasterize(self, radius, color):
+        size = 2 * radius + 1
+
+        if self.antialias:
+            # Per-pixel alpha carries the smoothed edge
+            sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.gfxdraw.filled_circle(sprite, radius, radius, radius, color)
+            pygame.gfxdraw.aacircle(sprite, radius, radius, radius, color)
+            return sprite
+
+        # Hard edge: a color key is cheaper to blit than alpha
+        key = (255, 0, 255) if color != (255, 0, 255) else (0, 255, 0)
+        sprite = pygame.Surface((size, size))
+        sprite.fill(key)
+        pygame.draw.circle(sprite, color, (radius, radius), radius)
+        sprite.set_colorkey(key, pygame.RLEACCEL)
+        return sprite
+
+    def __len__(self):
+        return len(self._sprites)
+
+    def clear(self):
+        self._sprites.clear()
+        self.pixels = 0
+
+
+# ------------------------------------------------------------
+# Draw every body of a store: one blits call per frame
+# ------------------------------------------------------------
+def draw_bodies(screen, store, sprites, text_cache, positions=None, active_index=None,
+                dirty=None, rows=None, scale=1.0):
+    n = len(store)
+    body_radii = store.radii[:n]
+    colors = store.color_index[:n]
+    ids = store.ids[:n]
+
+    # Only some rows (e.g. visible, or not splatted); positions are
+    # then given per drawn row
+    if rows is not None:
+        if active_index is not None:
+            hit = np.flatnonzero(rows == active_index)
+            active_index = int(hit[0]) if len(hit) else None
+        body_radii = body_radii[rows]
+        colors = colors[rows]
+        ids = ids[rows]
+        n = len(rows)
+    if positions is None:
+        positions = store.positions[:n] if rows is None else store.positions[rows]
+    if n == 0:
+        return
+
+    # Screen radii (camera zoom)
+    if scale != 1.0:
+        body_radii = body_radii * scale
+
+    radii = np.maximum(body_radii.astype(np.intp), 1)
+    palette = store.palette
+    centers = positions.astype(np.intp)
+
+    # Too big for a sprite (deep zoom): drawn directly, clipped to
+    # the screen, under everything else
+    highlight = None
+    drawn = radii <= C.SPRITE_MAX_RADIUS
+    for i in np.flatnonzero(~drawn).tolist():
+        center = centers[i].tolist()
+        if i == active_index:
+            highlight = tuple(pygame.draw.circle(screen, C.LIGHT_GRAY, center, int(radii[i]) + 4))
+        rect = pygame.draw.circle(screen, palette[colors[i]], center, int(radii[i]))
+        if dirty is not None:
+            dirty.mark(rect)
+
+    # Same sprite → adjacent in the batch (fewer surface switches)
+    order = np.flatnonzero(drawn)
+    order = order[np.lexsort((colors[order], radii[order]))]
+    radii = radii[order]
+    colors = colors[order]
+    corners = centers[order] - radii[:, None]
+    xs = corners[:, 0].tolist()
+    ys = corners[:, 1].tolist()
+    starts = np.flatnonzero(
+        np.r_[True, (radii[1:] != radii[:-1]) | (colors[1:] != colors[:-1])]
+    ).tolist() if len(order) else []
+    ends = starts[1:] + [len(order)]
+
+    # Lazy (sprite, top-left) runs: no per-body list is built
+    runs = []
+
+    # Highlight ring under the active body
+    if active_index is not None and drawn[active_index]:
+        r = int(body_radii[active_index]) + 4
+        x, y = centers[active_index].tolist()
+        highlight = (x - r, y - r, 2 * r + 1, 2 * r + 1)
+        runs.append([(sprites.get(r, C.LIGHT_GRAY), highlight[:2])])
+
+    for start, end in zip(starts, ends):
+        sprite = sprites.get(radii[start], palette[colors[start]])
+        runs.append(zip(repeat(sprite), zip(xs[start:end], ys[start:end])))
+
+    # ID labels on top (bodies large enough to show one)
+    labelled = np.flatnonzero(body_radii >= C.LABEL_MIN_RADIUS)
+    if len(labelled):
+        label_ids = ids[labelled].tolist()
+        label_centers = centers[labelled].tolist()
+        labels = []
+        for body_id, (x, y) in zip(label_ids, label_centers):
+            label = text_cache.render(str(body_id), C.LABEL_FONT_SIZE, (0, 0, 0))
+            labels.append((label, (x - label.get_width() // 2, y - label.get_height() // 2)))
+        runs.append(labels)
+
+    screen.blits(chain.from_iterable(runs), doreturn=False)
+
+    # Report the drawn rects to a DirtyRectRenderer
+    if dirty is not None:
+        sizes = (2 * radii + 1).tolist()
+        dirty.mark_many(zip(xs, ys, sizes, sizes))
+        if highlight is not None:
+            dirty.mark(highlight)
+        if len(labelled):
+            dirty.mark_many(
+                (x, y, label.get_width(), label.get_height()) for label, (x, y) in labels
+            )
+
+
+
+
+
+# ======================================================================
+#                           TEACHING SECTION
+# ======================================================================
+#
+# File: sprites.py
+#
+# Role of this file:
+# ------------------
+# pygame.draw.circle rasterizes a circle from scratch on every call, and
+# draw_body is a Python call per body per frame. Most bodies share a
+# handful of radius / color combinations, so the circles can be drawn
+# once and copied (blitted) afterwards, and all copies of a frame can be
+# handed to pygame in a single Surface.blits call.
+#
+# ----------------------------------------------------------------------
+#
+# =========================
+# SpriteCache
+# =========================
+#
+# get(radius, color) → Surface of size (2r + 1)², circle centered at (r, r)
+#
+# - antialias=False : opaque surface + color key (RLE accelerated);
+#                     same pixels as pygame.draw.circle
+# - antialias=True  : per-pixel alpha with a gfxdraw smoothed edge
+# - Bounded by total pixels (C.SPRITE_CACHE_PIXELS), least recently used
+#   sprites are evicted first; big planets cost more budget than dust
+#
+# ----------------------------------------------------------------------
+#
+# =========================
+# draw_bodies
+# =========================
+#
+# draw_bodies(screen, store, sprites, text_cache, positions, active_index,
+#             dirty, rows)
+#
+# rows (optional index array) limits drawing to those bodies; positions
+# are then one per row (active_index still refers to the whole store).
+# scale multiplies the radii (camera zoom); the label threshold applies
+# to the scaled radius.
+#
+# 1. Integer radii / centers for all bodies (NumPy)
+# 2. Sort by (radius, color index): equal sprites become one run
+# 3. Each run is a lazy zip(repeat(sprite), corners): blits pulls the
+#    (sprite, top-left) pairs itself, no per-body list or Python loop
+# 4. Bodies wider than C.SPRITE_MAX_RADIUS on screen (deep zoom) skip
+#    the cache and are drawn with pygame.draw.circle, which clips to
+#    the screen instead of rasterizing a huge sprite
+# 5. Active body highlight (sprite of radius + 4) first, ID labels
+#    (TextCache, bodies ≥ C.LABEL_MIN_RADIUS) last
+# 6. screen.blits(chain(runs), doreturn=False): one call into pygame
+# 7. With dirty=DirtyRectRenderer, every drawn rect is reported to it
+#    (computed from the same arrays, not returned by blits)
+#
+# Draw order follows the sprite runs instead of the body order, so where
+# bodies overlap a different one may end up on top; labels are always
+# above every circle.
+#
+# draw_body in draw.py remains only as the per-body baseline that
+# benchmarks/suite.py times against draw_bodies.
+#
+# ======================================================================
+#                       IMPROVEMENT SECTION
+# ======================================================================
+#
+# 1. Sub-Pixel Positions
+#    - Keep a few offset variants per sprite for smoother slow motion.
+#
+# 2. Texture Atlas
+#    - Pack all sprites into one surface (GPU renderers bind it once).
+#
+# ======================================================================
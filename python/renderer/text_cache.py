@@ -0,0 +1,102 @@
+# ============================================================
+# Text Cache (Fonts + Rendered Labels)
+# ============================================================
+# Fonts are loaded once per size, and rendered text surfaces
+# are kept in a bounded LRU cache keyed by (text, size, color),
+# so a label is rasterized once instead of every frame.
+# ============================================================
+
+from collections import OrderedDict
+
+import pygame
+
+import utils.constants as C
+
+
+class TextCache:
+    def __init__(self, max_entries=C.TEXT_CACHE_SIZE, font_name=None):
+        self.max_entries = max_entries
+        self.font_name = font_name
+        self._fonts = {}
+        self._surfaces = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    # --------------------------------------------------------
+    # Font of the given size (system font lookup happens once)
+    # --------------------------------------------------------
+    def font(self, size):
+        font = self._fonts.get(size)
+        if font is None:
+            font = pygame.font.SysFont(self.font_name, size)
+            self._fonts[size] = font
+        return font
+
+    # --------------------------------------------------------
+    # Rendered surface for text (most recently used kept)
+    # --------------------------------------------------------
+    def render(self, text, size, color):
+        key = (text, size, color)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = self.font(size).render(text, True, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def __len__(self):
+        return len(self._surfaces)
+
+    def clear(self):
+        self._surfaces.clear()
+
+
+
+
+
+# ======================================================================
+#                           TEACHING SECTION
+# ======================================================================
+#
+# File: text_cache.py
+#
+# Role of this file:
+# ------------------
+# pygame.font.SysFont searches and loads a font file; Font.render
+# rasterizes glyphs into a new Surface. The simulation used to do the
+# first every frame and the second for every body every frame, so with
+# 1000 bodies drawing the ID labels cost more than the physics.
+#
+# ----------------------------------------------------------------------
+#
+# =========================
+# HOW IT WORKS
+# =========================
+#
+# font(size)                 : one pygame Font per size, created on first use
+# render(text, size, color)  : cached Surface; the least recently used
+#                              entry is dropped beyond max_entries
+#                              (C.TEXT_CACHE_SIZE)
+#
+# Body IDs and status labels (PAUSED, GRAVITY OFF, …) repeat from frame
+# to frame, so nearly every render() is a dictionary hit. Text that
+# changes every frame (telemetry numbers) gains nothing from caching
+# and is rendered directly.
+#
+# hits / misses count lookups, e.g. for the telemetry HUD.
+#
+# ======================================================================
+#                       IMPROVEMENT SECTION
+# ======================================================================
+#
+# 1. Glyph Atlas
+#    - Blit digits from one pre-rendered strip instead of whole labels.
+#
+# ======================================================================
@@ -1,5 +1,6 @@
 import pygame 
 import utils.constants as C
+from renderer.dirty_rects import DirtyRectRenderer
 
 def home_screen(screen,clock):
     font_title = pygame.font.SysFont(None,64)
@@ -8,29 +9,36 @@ def home_screen(screen,clock):
     start_rect = pygame.Rect(C.WIDTH // 2 -120 , C.HEIGHT // 2 -20 ,240 ,50 )
     exit_rect = pygame.Rect(C.WIDTH // 2 -120 , C.HEIGHT // 2 + 50 ,240 ,50 )
 
-    while True :
-        #------SCREEN SETTINGS----------------------
-        clock.tick(C.FPS)
-        screen.fill(C.BACKGROUND_COLOR)
+    #------STATIC SCREEN (composed once)----------------------
+    background = pygame.Surface(screen.get_size())
+    background.fill(C.BACKGROUND_COLOR)
+
+    title= font_title.render("ACT-3",True,C.WHITE)
+    background.blit(title,title.get_rect(center=(C.WIDTH//2 , 200)))
 
-        #------TITLE----------------------
-        title= font_title.render("ACT-3",True,C.WHITE)
-        screen.blit(title,title.get_rect(center=(C.WIDTH//2 , 200)))
+    pygame.draw.rect(background,C.ACCENT_COLOR,start_rect,border_radius=8)
+    pygame.draw.rect(background,C.RED, exit_rect,border_radius = 8)
 
-        #------BUTTONS ----------------------
-        pygame.draw.rect(screen,C.ACCENT_COLOR,start_rect,border_radius=8)
-        pygame.draw.rect(screen,C.RED, exit_rect,border_radius = 8)
+    start_text = font_btn.render("START",True,C.BLACK)
+    exit_text = font_btn.render("EXIT",True,C.WHITE)
 
-        start_text = font_btn.render("START",True,C.BLACK)
-        exit_text = font_btn.render("EXIT",True,C.WHITE)
+    background.blit(start_text,start_text.get_rect(center =start_rect.center))
+    background.blit(exit_text,start_text.get_rect(center =exit_rect.center))
 
-        screen.blit(start_text,start_text.get_rect(center =start_rect.center))
-        screen.blit(exit_text,start_text.get_rect(center =exit_rect.center))
+    # Nothing moves here: the window is only pushed when invalidated
+    renderer = DirtyRectRenderer(screen, background)
+
+    while True :
+        #------SCREEN SETTINGS----------------------
+        clock.tick(C.FPS)
+        renderer.begin_frame()
 
         #------EVENTS----------------------
         for event in pygame.event.get():
             if event.type == pygame.QUIT :
                 return "EXIT"
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED) :
+                renderer.invalidate()
             if event.type == pygame.MOUSEBUTTONDOWN and  event.button == 1 :
                 if start_rect.collidepoint(event.pos):
                     return "SIMULATION"
@@ -38,4 +46,4 @@ def home_screen(screen,clock):
                     return "EXIT"
                 
 
-        pygame.display.flip()
\ No newline at end of file
+        renderer.present()
\ No newline at end of file
@@ -0,0 +1,105 @@
+# ============================================================
+# Dust Cloud Preset
+# ============================================================
+# Spawns thousands of small dust grains in a slowly rotating
+# Gaussian blob: the dense, many-body scene the particle-mesh
+# gravity solver is made for.
+# ============================================================
+
+import math
+import numpy as np
+import utils.constants as C
+
+
+# ------------------------------------------------------------
+# Add `count` dust grains around center (key: C)
+# ------------------------------------------------------------
+def spawn_dust_cloud(bodies, center, count=C.DUST_CLOUD_COUNT, spread=150.0, seed=None):
+    rng = np.random.default_rng(seed)
+    dust = C.MATERIALS["dust"]
+
+    # Gaussian blob of dust grains around the center
+    positions = rng.normal(0.0, spread / 2.0, size=(count, 2)) + center
+
+    # Slow solid-body rotation so the cloud does not just collapse
+    offset = positions - center
+    omega = 0.2
+    velocities = np.column_stack((-offset[:, 1], offset[:, 0])) * omega
+
+    low, high = dust["radius_range"]
+    radii = rng.uniform(low, high, size=count)
+    masses = dust["density"] * math.pi * radii ** 2
+
+    # Number past the largest id in use, as World.add_body does
+    first_id = bodies.next_id()
+    ids = np.arange(first_id, first_id + count)
+
+    bodies.add_many(
+        positions,
+        velocities,
+        masses,
+        radii,
+        color=dust["color"],
+        ids=ids,
+        material="dust"
+    )
+
+
+
+
+
+
+# ======================================================================
+#                           TEACHING SECTION
+# ======================================================================
+#
+# File: dust_cloud.py
+#
+# Role of this file:
+# ------------------
+# The solar-system preset has five bodies; pairwise gravity handles it
+# easily. A dust cloud has C.DUST_CLOUD_COUNT (2000) bodies, where
+# O(N²) pairwise gravity becomes the bottleneck and particle-mesh
+# gravity (physics/particle_mesh.py, key B) pays off.
+#
+# ----------------------------------------------------------------------
+#
+# =========================
+# STEP-BY-STEP EXPLANATION
+# =========================
+#
+# 1. Positions
+#    - Normal distribution around center, σ = spread / 2 per axis
+#
+# 2. Velocities
+#    - Solid-body rotation v = ω × r with ω = 0.2 rad/s, so the cloud
+#      swirls instead of collapsing straight to its centre
+#
+# 3. Radii and Masses
+#    - Uniform in MATERIALS["dust"]["radius_range"], mass from the dust
+#      density (density · π r²), like spawned bodies
+#
+# 4. Ids
+#    - Consecutive, starting at bodies.next_id() (largest id in use + 1),
+#      so grains never share an id with bodies already in the world
+#
+# All grains go in with one BodyStore.add_many call (one colour, one
+# material) instead of thousands of Body objects.
+#
+# ----------------------------------------------------------------------
+#
+# Usage:
+#   spawn_dust_cloud(world.bodies, [x, y])                  # key C
+#   spawn_dust_cloud(store, center, count=500, seed=3)      # reproducible
+#
+# ======================================================================
+#                       IMPROVEMENT SECTION
+# ======================================================================
+#
+# 1. Keplerian Rotation
+#    - Speeds from the enclosed mass, for a cloud in equilibrium.
+#
+# 2. Size Distribution
+#    - Power-law radii (many fine grains, few large ones).
+#
+# ======================================================================
@@ -0,0 +1,325 @@
+# ============================================================
+# Ensemble Runner (Parameter Sweeps)
+# ============================================================
+# Runs many headless Worlds with different parameters over a
+# process pool and streams one JSON summary line per member to
+# a results file as members finish.
+#
+# Run from the python/ directory, e.g.:
+#   python -m simulation.ensemble --scene solar_system \
+#       --grid G=200,300,400 --grid restitution=0.5,0.8 \
+#       --seeds 0-3 --steps 600 --out sweep.jsonl
+# ============================================================
+
+import argparse
+import itertools
+import json
+import math
+import multiprocessing as mp
+import random
+import time
+import traceback
+
+import numpy as np
+
+import utils.constants as C
+from physics.gravity import gravity_potential_energy, kinetic_energy
+from physics.world import World
+from simulation.preset1 import spawn_system
+from simulation.dust_cloud import spawn_dust_cloud
+from simulation.scenes import spawn_clustered, spawn_mixed_materials
+
+
+# Member parameters and their defaults
+DEFAULTS = {
+    "scene": "solar_system",
+    "seed": 0,
+    "G": C.G,
+    "restitution": 0.6,
+    "boundary_restitution": 0.9,
+    "damping": 1.0,                 # DAMPING_COEFF (per 1 / FPS frame)
+    "integrator": C.INTEGRATOR,
+    "gravity_solver": "pairwise",
+    "dt": 1.0 / C.PHYSICS_HZ,
+    "steps": 600,                   # step budget
+    "max_seconds": None,            # optional wall-clock budget
+}
+
+# Names of the interactive constants, accepted for their parameter
+ALIASES = {
+    "DAMPING_COEFF": "damping",
+}
+
+
+# ------------------------------------------------------------
+# Scene generators: scene(world, seed)
+# ------------------------------------------------------------
+def _solar_system(world, seed):
+    random.seed(seed)
+    spawn_system(world.bodies, [world.width / 2, world.height / 2])
+
+
+def _dust_cloud(world, seed):
+    spawn_dust_cloud(world.bodies, [world.width / 2, world.height / 2], count=500, seed=seed)
+
+
+def _mixed(world, seed):
+    spawn_mixed_materials(world.bodies, 300, world.width, world.height, seed)
+
+
+def _clustered(world, seed):
+    spawn_clustered(world.bodies, 300, world.width, world.height, seed)
+
+
+SCENES = {
+    "solar_system": _solar_system,
+    "dust_cloud": _dust_cloud,
+    "mixed": _mixed,
+    "clustered": _clustered,
+}
+
+
+# ------------------------------------------------------------
+# Cartesian product of parameter axes → list of members
+# ------------------------------------------------------------
+def parameter_grid(**axes):
+    keys = list(axes)
+    return [dict(zip(keys, values)) for values in itertools.product(*axes.values())]
+
+
+def total_energy(world):
+    store = world.bodies
+    n = len(store)
+    return (
+        kinetic_energy(store.velocities[:n], store.masses[:n])
+        + gravity_potential_energy(store.positions[:n], store.masses[:n], store.radii[:n], world.G)
+    )
+
+
+# ------------------------------------------------------------
+# Run one member; never raises (errors become a result line)
+# ------------------------------------------------------------
+def run_member(member):
+    params = dict(DEFAULTS)
+    params.update(member)
+    result = {"params": member, "status": "ok"}
+    start = time.perf_counter()
+
+    try:
+        world = World(
+            G=params["G"],
+            restitution=params["restitution"],
+            boundary_restitution=params["boundary_restitution"],
+            gravity_solver=params["gravity_solver"],
+            integrator=params["integrator"],
+        )
+        dt = params["dt"]
+
+        # Same per-frame damping meaning as the interactive loop
+        world.damping = params["damping"] ** (dt * C.FPS)
+
+        scene = params["scene"]
+        (SCENES[scene] if isinstance(scene, str) else scene)(world, params["seed"])
+
+        e0 = total_energy(world)
+        contacts = 0
+        steps = 0
+        while steps < params["steps"]:
+            world.step(dt)
+            steps += 1
+            contacts += world.contacts
+
+            n = len(world)
+            if not np.isfinite(world.bodies.velocities[:n]).all():
+                result["status"] = "diverged"
+                break
+            if params["max_seconds"] is not None and time.perf_counter() - start > params["max_seconds"]:
+                result["status"] = "time_budget"
+                break
+
+        n = len(world)
+        e1 = total_energy(world)
+        speeds = np.sqrt((world.bodies.velocities[:n] ** 2).sum(axis=1))
+        result.update({
+            "bodies": n,
+            "steps": steps,
+            "sim_time": steps * dt,
+            "energy_start": e0,
+            "energy_end": e1,
+            "energy_drift": abs(e1 - e0) / abs(e0) if e0 else None,
+            "max_speed": float(speeds.max()) if n else 0.0,
+            "contacts": contacts,
+        })
+
+    except Exception as error:
+        result["status"] = "error"
+        result["error"] = repr(error)
+        result["traceback"] = traceback.format_exc()
+
+    result["wall_seconds"] = time.perf_counter() - start
+    return result
+
+
+def _json_safe(value):
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    if isinstance(value, dict):
+        return {k: _json_safe(v) for k, v in value.items()}
+    if callable(value):
+        return getattr(value, "__name__", repr(value))
+    return value
+
+
+# ------------------------------------------------------------
+# Run all members over a pool, streaming results to a JSONL file
+# ------------------------------------------------------------
+def run_ensemble(members, results_path, workers=None, on_result=None):
+    members = [dict(m, member=i) for i, m in enumerate(members)]
+    finished = []
+
+    with open(results_path, "a") as out:
+        with mp.get_context("spawn").Pool(workers) as pool:
+            for result in pool.imap_unordered(run_member, members):
+                out.write(json.dumps(_json_safe(result)) + "\n")
+                out.flush()
+                finished.append(result)
+                if on_result is not None:
+                    on_result(result)
+
+    return finished
+
+
+# ------------------------------------------------------------
+# Command line
+# ------------------------------------------------------------
+def _parse_value(text):
+    for cast in (int, float):
+        try:
+            return cast(text)
+        except ValueError:
+            pass
+    return text
+
+
+def _parse_seeds(text):
+    if "-" in text:
+        low, high = text.split("-")
+        return list(range(int(low), int(high) + 1))
+    return [int(s) for s in text.split(",")]
+
+
+def main(argv=None):
+    names = ", ".join(DEFAULTS)
+    aliases = ", ".join(f"{alias} = {name}" for alias, name in ALIASES.items())
+    parser = argparse.ArgumentParser(description="Headless parameter sweep")
+    parser.add_argument("--scene", default=DEFAULTS["scene"], choices=sorted(SCENES))
+    parser.add_argument("--grid", action="append", default=[], metavar="NAME=V1,V2,...",
+                        help=f"parameter axis (repeatable); NAME is one of {names} "
+                             f"(alias: {aliases})")
+    parser.add_argument("--seeds", default="0", help="e.g. 0-7 or 1,5,9")
+    parser.add_argument("--steps", type=int, default=DEFAULTS["steps"])
+    parser.add_argument("--max-seconds", type=float, default=None)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--out", default="ensemble_results.jsonl")
+    args = parser.parse_args(argv)
+
+    axes = {"seed": _parse_seeds(args.seeds)}
+    for spec in args.grid:
+        if "=" not in spec:
+            parser.error(f"--grid {spec}: expected NAME=V1,V2,...")
+        name, values = spec.split("=", 1)
+
+        # A misspelled name would silently leave the default in place
+        name = ALIASES.get(name, name)
+        if name not in DEFAULTS:
+            parser.error(f"--grid {spec}: unknown parameter {name!r} (choose from {names})")
+        axes[name] = [_parse_value(v) for v in values.split(",")]
+
+    members = parameter_grid(**axes)
+    for member in members:
+        member.update(scene=args.scene, steps=args.steps, max_seconds=args.max_seconds)
+
+    def report(result):
+        drift = result.get("energy_drift")
+        drift = f"{drift:.2e}" if drift is not None else "-"
+        print(f"member {result['params']['member']:>4}  {result['status']:>11}  "
+              f"drift {drift:>9}  {result['wall_seconds']:.2f} s")
+
+    print(f"{len(members)} members → {args.out}")
+    results = run_ensemble(members, args.out, args.workers, report)
+    failed = sum(r["status"] == "error" for r in results)
+    print(f"done: {len(results) - failed} ok, {failed} failed")
+
+
+if __name__ == "__main__":
+    main()
+
+
+
+
+
+# ======================================================================
+#                           TEACHING SECTION
+# ======================================================================
+#
+# File: ensemble.py
+#
+# Role of this file:
+# ------------------
+# Finding stable configurations means trying many combinations of G,
+# restitution, damping and seeds. Each combination ("member") is an
+# independent headless World, so members run in parallel on a process
+# pool without any window.
+#
+# ----------------------------------------------------------------------
+#
+# =========================
+# MEMBERS
+# =========================
+#
+# A member is a dict overriding DEFAULTS, e.g.
+#   {"scene": "solar_system", "seed": 3, "G": 250, "restitution": 0.8}
+#
+# parameter_grid(G=[200, 300], seed=[0, 1]) → all 4 combinations.
+#
+# scene is a SCENES name or a module-level function scene(world, seed)
+# (it must be importable by the worker processes).
+#
+# damping uses the interactive DAMPING_COEFF meaning (per 1/FPS frame)
+# and is rescaled to the step size like the simulation loop does. On
+# the command line --grid DAMPING_COEFF=... is accepted as an alias
+# (ALIASES); any other name that is not a DEFAULTS key is rejected, so
+# a typo cannot run a sweep whose members are all identical.
+#
+# Budgets: "steps" always; "max_seconds" optionally stops a slow member.
+#
+# ----------------------------------------------------------------------
+#
+# =========================
+# RESULTS
+# =========================
+#
+# One JSON line per member, written and flushed as soon as it finishes
+# (imap_unordered), so a long sweep can be watched or resumed:
+#
+#   params, status, bodies, steps, sim_time, energy_start, energy_end,
+#   energy_drift, max_speed, contacts, wall_seconds
+#
+# status: "ok", "diverged" (non-finite velocities), "time_budget" or
+#         "error" (with error + traceback). run_member catches every
+#         exception, so one broken member never aborts the sweep.
+#
+# Note: pool workers are daemon processes and cannot start their own
+# pools, so members should not use the "parallel" gravity solver.
+#
+# ======================================================================
+#                       IMPROVEMENT SECTION
+# ======================================================================
+#
+# 1. Resume
+#    - Skip members already present in the results file.
+#
+# 2. Adaptive Sweeps
+#    - Refine the grid around the most stable members.
+#
+# ======================================================================
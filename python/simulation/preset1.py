@@ -1,5 +1,4 @@
 # 4 planet solar system
-import pygame
 import utils.constants as C
 from physics.body import Body
 import random
@@ -17,7 +16,7 @@ def spawn_system(bodies,center) :
         mass= star_mass,
         radius=star_radius,
         color= C.YELLOW,
-        body_id= len(bodies) +1 
+        body_id= bodies.next_id()
     )
     bodies.append(star)
 
@@ -42,7 +41,7 @@ def spawn_system(bodies,center) :
             mass= mass,
             radius= radius,
             color = C.BLUE,
-            body_id=len(bodies) +1 
+            body_id=bodies.next_id()
         )
         bodies.append(planet)
 
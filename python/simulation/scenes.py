@@ -0,0 +1,118 @@
+# Generated scenes for benchmarks and batch runs
+import math
+import numpy as np
+import utils.constants as C
+
+
+# ------------------------------------------------------------
+# Mixed materials drawn with the interactive spawn weights
+# ------------------------------------------------------------
+def spawn_mixed_materials(bodies, count, width=C.WIDTH, height=C.HEIGHT, seed=None):
+    rng = np.random.default_rng(seed)
+    names = list(C.MATERIALS.keys())
+    weights = np.array(C.MATERIAL_WEIGHTS, dtype=np.float64)
+
+    choice = rng.choice(len(names), size=count, p=weights / weights.sum())
+    first_id = len(bodies) + 1
+
+    for k, name in enumerate(names):
+        picked = np.flatnonzero(choice == k)
+        if len(picked) == 0:
+            continue
+
+        material = C.MATERIALS[name]
+        low, high = material["radius_range"]
+        radii = rng.uniform(low, high, size=len(picked))
+        masses = material["density"] * math.pi * radii ** 2
+
+        positions = rng.uniform(0, [width, height], size=(len(picked), 2))
+        velocities = rng.normal(0.0, 20.0, size=(len(picked), 2))
+
+        bodies.add_many(
+            positions,
+            velocities,
+            masses,
+            radii,
+            color=material["color"],
+            ids=first_id + picked,
+            material=name
+        )
+
+
+# ------------------------------------------------------------
+# Uniform: dust spread evenly over the domain, slow random drift
+# ------------------------------------------------------------
+def spawn_uniform(bodies, count, width=C.WIDTH, height=C.HEIGHT, seed=None):
+    rng = np.random.default_rng(seed)
+    dust = C.MATERIALS["dust"]
+    low, high = dust["radius_range"]
+    radii = rng.uniform(low, high, size=count)
+    first_id = len(bodies) + 1
+
+    bodies.add_many(
+        rng.uniform(0, [width, height], size=(count, 2)),
+        rng.normal(0.0, 20.0, size=(count, 2)),
+        dust["density"] * math.pi * radii ** 2,
+        radii,
+        color=dust["color"],
+        ids=np.arange(first_id, first_id + count),
+        material="dust"
+    )
+
+
+# ------------------------------------------------------------
+# Clustered: a star with planets in tight orbits inside a wide
+# field of dust on slow circular orbits
+# ------------------------------------------------------------
+def spawn_clustered(bodies, count, width=C.WIDTH, height=C.HEIGHT, seed=None, planets=4):
+    rng = np.random.default_rng(seed)
+    center = np.array([width / 2.0, height / 2.0])
+    first_id = len(bodies) + 1
+
+    # Central star (same build as simulation/preset1.py)
+    star_radius = 45.0
+    star_mass = 3.5 * math.pi * star_radius ** 2
+    bodies.add(center, [0.0, 0.0], star_mass, star_radius, C.YELLOW, first_id)
+
+    # Planets from just outside the star's surface (grazing orbit)
+    # outwards, spaced by a constant ratio so their orbits stay apart
+    orbit = (star_radius + 15.0) * 1.6 ** np.arange(planets)
+    planet_radii = rng.uniform(6, 12, size=planets)
+    angle = rng.uniform(0, 2 * math.pi, size=planets)
+    _add_circular(bodies, center, star_mass, orbit, angle, planet_radii,
+                  math.pi * planet_radii ** 2, C.BLUE, first_id + 1, None)
+
+    # Dust on concentric rings far outside the planets; rings keep
+    # grains from passing each other at point-blank range
+    dust = C.MATERIALS["dust"]
+    outer = min(width, height) / 2.0
+    inner = outer * 0.3
+    rings = max(1, int(math.sqrt(count)))
+    ring = np.arange(count) % rings
+    dist = np.linspace(inner, outer, rings)[ring]
+
+    # Evenly spaced around each ring, random phase per ring
+    per_ring = np.bincount(ring, minlength=rings)
+    slot = np.arange(count) // rings
+    angle = 2 * math.pi * slot / per_ring[ring] + rng.uniform(0, 2 * math.pi, size=rings)[ring]
+
+    low, high = dust["radius_range"]
+    radii = rng.uniform(low, high, size=count)
+    _add_circular(bodies, center, star_mass, dist, angle, radii,
+                  dust["density"] * math.pi * radii ** 2, dust["color"],
+                  first_id + 1 + planets, "dust")
+
+
+def _add_circular(bodies, center, central_mass, dist, angle, radii, masses, color, first_id, material):
+    direction = np.column_stack((np.cos(angle), np.sin(angle)))
+    speed = np.sqrt(C.G * central_mass / dist)
+
+    bodies.add_many(
+        center + direction * dist[:, None],
+        np.column_stack((-direction[:, 1], direction[:, 0])) * speed[:, None],
+        masses,
+        radii,
+        color=color,
+        ids=np.arange(first_id, first_id + len(dist)),
+        material=material
+    )
@@ -14,6 +14,10 @@ HEIGHT = 800
 FPS    = 30
 TITLE  = "PROJECT - 0"
 
+# Size of the simulated world (may exceed the window: pan / zoom)
+WORLD_WIDTH  = WIDTH
+WORLD_HEIGHT = HEIGHT
+
 
 # ============================================================
 # Color Definitions
@@ -65,6 +69,111 @@ BODY_TERTIARY  = GREEN
 # Gravitational constant (scaled for simulation feel)
 G = 300
 
+# Gravity solvers selectable in the simulation loop (key: B cycles)
+GRAVITY_SOLVERS = ("pairwise", "barnes_hut", "particle_mesh", "parallel")
+
+# Worker processes of the "parallel" solver (0 = all CPU cores)
+GRAVITY_WORKERS = 0
+
+# Barnes–Hut opening angle (smaller = more accurate, slower)
+BH_THETA = 0.5
+
+# Particle-mesh grid resolution (cells over WIDTH x HEIGHT)
+PM_GRID = (128, 128)
+
+# Particle-mesh boundary: "isolated" or "periodic"
+PM_BOUNDARY = "isolated"
+
+# Bodies in a spawned dust cloud (key: C)
+DUST_CLOUD_COUNT = 2000
+
+# Time integrator: "euler", "leapfrog", "verlet", "yoshida4" or "block"
+INTEGRATOR = "leapfrog"
+
+# Block timesteps: accuracy factor and deepest level (dt / 2^level)
+BLOCK_ETA = 0.05
+BLOCK_MAX_LEVEL = 6
+
+# Fixed physics rate (steps per second), independent of FPS
+PHYSICS_HZ = 120
+
+# Most physics steps run in one frame; slower frames drop time
+MAX_SUBSTEPS = 8
+
+# Step physics on a background thread (False: inline, once per frame)
+PHYSICS_THREADED = True
+
+# Checkpoint file written by F5 and read by F9
+CHECKPOINT_PATH = "universe.ckpt"
+
+# Seconds a status message (checkpoint saved / failed, ...) stays
+# on the HUD
+STATUS_SECONDS = 4.0
+
+# Trajectory recording (R) / replay (L): file, delta encoding
+# ("float64", "float32", "float16" or "quantized"), steps between
+# keyframes, world units per step of "quantized"
+TRAJECTORY_PATH = "universe.traj"
+TRAJECTORY_ENCODING = "float16"
+TRAJECTORY_KEYFRAME_INTERVAL = 240
+TRAJECTORY_QUANTUM = 1 / 256
+
+# Replay seek step (PAGE UP / PAGE DOWN), seconds of recording
+REPLAY_SEEK_SECONDS = 5.0
+
+
+# ============================================================
+# Telemetry (Frame Timing)
+# ============================================================
+
+# Frames behind the HUD's rolling averages / percentiles (key: T)
+TELEMETRY_WINDOW = 120
+
+# Per-frame timing log: "*.csv" or "*.jsonl" path, None = off
+TELEMETRY_PATH = None
+
+# Frames buffered in memory before they are written to the log
+TELEMETRY_FLUSH_ROWS = 256
+
+# Rendered text surfaces kept by the label cache (LRU)
+TEXT_CACHE_SIZE = 4096
+
+# Body ID labels: font size, and smallest radius that shows one
+LABEL_FONT_SIZE = 18
+LABEL_MIN_RADIUS = 6
+
+# Circle sprite cache budget (total pixels) and edge smoothing
+SPRITE_CACHE_PIXELS = 4_000_000
+SPRITE_ANTIALIAS = False
+
+# Bodies with a larger screen radius are drawn without a sprite
+SPRITE_MAX_RADIUS = 256
+
+# Dirty-rect rendering: above this fraction of the window
+# changing in one frame, the whole window is flipped instead
+DIRTY_FULL_FRACTION = 0.5
+
+# Splat level of detail: from this many bodies on, bodies smaller
+# than SPLAT_RADIUS are splatted into a NumPy image
+SPLAT_MIN_BODIES = 30_000
+SPLAT_RADIUS = 4
+SPLAT_MODE = "additive"         # "additive" or "density"
+SPLAT_GAIN = 0.6
+SPLAT_DENSITY_SATURATION = 16
+
+# Camera zoom limits and step per mouse wheel notch
+CAMERA_MIN_ZOOM = 0.05
+CAMERA_MAX_ZOOM = 20.0
+CAMERA_ZOOM_STEP = 1.15
+
+# Culling: the view is grown by this many world units before the
+# broad phase is asked for visible bodies
+CULL_MARGIN = 32.0
+
+# Frames captured per profile (key: P) and where profiles go
+PROFILE_FRAMES = 120
+PROFILE_DIR = "profiles"
+
 
 # ============================================================
 # Material Definitions
@@ -110,6 +219,24 @@ MATERIALS = {
     },
 }
 
+# Spawn weights per material, in MATERIALS order (many small, few large)
+MATERIAL_WEIGHTS = [1000, 500, 100, 50, 1, 0.1]
+
+
+# ============================================================
+# Collision Broad Phase
+# ============================================================
+# "grid"      : uniform-grid spatial hash (rebuilt every frame)
+# "aabb_tree" : dynamic AABB tree (refitted, for extreme
+#               radius variance)
+BROAD_PHASE = "grid"
+
+# Extra space around each AABB tree box (pixels), so slow bodies
+# keep their box for many frames; the tree is rebuilt once its
+# boxes have grown this many times looser than after a build
+AABB_MARGIN = 12.0
+AABB_REBUILD_FACTOR = 1.5
+
 
 
 
@@ -140,9 +267,16 @@ MATERIALS = {
 #   - Integers representing screen dimensions
 # Purpose:
 #   - Define the simulation window size
-#   - Used for rendering and boundary collision checks
 #   - Centralizes screen scaling decisions
 #
+# WORLD_WIDTH, WORLD_HEIGHT
+# -------------------------
+# Inputs:
+#   - Numbers in world units
+# Purpose:
+#   - Boundary collision box of the simulated world; the camera
+#     (renderer/camera.py) decides which part of it the window shows
+#
 # ----------------------------------------------------------------------
 #
 # FPS
@@ -167,6 +301,180 @@ MATERIALS = {
 #
 # ----------------------------------------------------------------------
 #
+# INTEGRATOR
+# ----------
+# Inputs:
+#   - Name of a scheme in physics/integrator.py
+# Purpose:
+#   - Selects how the World advances positions/velocities under gravity
+#   - Higher-order schemes allow larger steps for the same energy error
+#
+# BLOCK_ETA / BLOCK_MAX_LEVEL
+# ---------------------------
+# Inputs:
+#   - Float accuracy factor / integer deepest level
+# Purpose:
+#   - Per-body steps of the "block" integrator: smaller eta = smaller
+#     steps; the finest step is dt / 2^BLOCK_MAX_LEVEL
+#
+# ----------------------------------------------------------------------
+#
+# PHYSICS_HZ / MAX_SUBSTEPS
+# -------------------------
+# Inputs:
+#   - Integer physics steps per second / integer step cap per frame
+# Purpose:
+#   - Physics always advances in steps of 1 / PHYSICS_HZ seconds
+#   - Rendering (FPS) and physics rate are independent
+#   - The cap prevents a "spiral of death" after a slow frame
+#
+# ----------------------------------------------------------------------
+#
+# PHYSICS_THREADED
+# ----------------
+# Inputs:
+#   - Boolean
+# Purpose:
+#   - True: the World steps on a worker thread and the loop draws its
+#     published snapshots (core/physics_worker.py), so slow steps do
+#     not stall input or drawing
+#   - False: same snapshots, stepped inline by the loop each frame
+#
+# ----------------------------------------------------------------------
+#
+# CHECKPOINT_PATH
+# ---------------
+# Inputs:
+#   - File path (relative to the working directory)
+# Purpose:
+#   - F5 saves the whole world there (physics/checkpoint.py), written
+#     on a background thread; F9 loads it back (memory-mapped)
+#
+# ----------------------------------------------------------------------
+#
+# STATUS_SECONDS
+# --------------
+# Inputs:
+#   - Seconds
+# Purpose:
+#   - How long one-off results (checkpoint saved / failed / loaded)
+#     stay on the HUD's status row
+#
+# ----------------------------------------------------------------------
+#
+# TRAJECTORY_PATH / TRAJECTORY_ENCODING / TRAJECTORY_KEYFRAME_INTERVAL /
+# TRAJECTORY_QUANTUM
+# ----------------------------------------------------------------------
+# Inputs:
+#   - File path / encoding name / integer steps / float world units
+# Purpose:
+#   - R records every physics step to TRAJECTORY_PATH
+#     (physics/trajectory.py): a full keyframe every INTERVAL steps,
+#     positions in between as ENCODING deltas (4 bytes per body for
+#     float16 / quantized, error below half a QUANTUM)
+#   - Shorter intervals: faster seeks, bigger files
+#
+# ----------------------------------------------------------------------
+#
+# REPLAY_SEEK_SECONDS
+# -------------------
+# Inputs:
+#   - Float seconds
+# Purpose:
+#   - How far PAGE UP / PAGE DOWN jump while replaying (key: L)
+#
+# ----------------------------------------------------------------------
+#
+# TELEMETRY_WINDOW / TELEMETRY_PATH / TELEMETRY_FLUSH_ROWS
+# --------------------------------------------------------
+# Inputs:
+#   - Integer frame count / log file path or None / integer row count
+# Purpose:
+#   - Rolling window of the per-phase timing HUD (core/telemetry.py)
+#   - Optional CSV / JSONL log with one row per frame for offline
+#     analysis of slow sessions; rows are written in batches
+#
+# TEXT_CACHE_SIZE / LABEL_FONT_SIZE / LABEL_MIN_RADIUS
+# ----------------------------------------------------
+# Inputs:
+#   - Integer entry count / integer point size / integer pixels
+# Purpose:
+#   - Bound of the rendered-label LRU cache (renderer/text_cache.py)
+#   - Size of body ID and status labels
+#   - Bodies smaller than LABEL_MIN_RADIUS are drawn without an ID
+#     label (dust), which also saves the blits
+#
+# SPRITE_CACHE_PIXELS / SPRITE_ANTIALIAS
+# --------------------------------------
+# Inputs:
+#   - Integer pixel budget / bool
+# Purpose:
+#   - Pre-rendered circle sprites (renderer/sprites.py) are evicted
+#     least-recently-used once their total area exceeds the budget
+#     (4M pixels ≈ 16 MB at 32 bits per pixel)
+#   - True smooths circle edges (alpha blending, slightly slower)
+#
+# SPRITE_MAX_RADIUS
+# -----------------
+# Inputs:
+#   - Radius in screen pixels
+# Purpose:
+#   - Zoomed-in bodies above it are drawn with pygame.draw.circle
+#     (clipped to the window) instead of a (2r + 1)² sprite
+#
+# DIRTY_FULL_FRACTION
+# -------------------
+# Inputs:
+#   - Float between 0 and 1
+# Purpose:
+#   - renderer/dirty_rects.py pushes only changed regions to the
+#     display; when they cover more than this fraction of the window,
+#     one full flip is cheaper than many partial updates
+#
+# SPLAT_MIN_BODIES / SPLAT_RADIUS
+# -------------------------------
+# Inputs:
+#   - Integer body count / radius in pixels
+# Purpose:
+#   - With at least SPLAT_MIN_BODIES bodies, bodies smaller than
+#     SPLAT_RADIUS are drawn as sub-pixel splats (renderer/splat.py)
+#     instead of circle sprites; larger bodies stay circles
+#
+# SPLAT_MODE / SPLAT_GAIN / SPLAT_DENSITY_SATURATION
+# --------------------------------------------------
+# Inputs:
+#   - "additive" or "density" / float / bodies per pixel
+# Purpose:
+#   - "additive": each splat adds SPLAT_GAIN x its body color, so
+#     about 1 / SPLAT_GAIN overlapping bodies saturate a pixel
+#   - "density": bodies per pixel through a color map, log scaled
+#     so SPLAT_DENSITY_SATURATION bodies reach the brightest color
+#
+# CAMERA_MIN_ZOOM / CAMERA_MAX_ZOOM / CAMERA_ZOOM_STEP
+# ----------------------------------------------------
+# Inputs:
+#   - Screen pixels per world unit / factor per wheel notch
+# Purpose:
+#   - Bounds and speed of the camera zoom (mouse wheel)
+#
+# CULL_MARGIN
+# -----------
+# Inputs:
+#   - World units
+# Purpose:
+#   - Bodies within this distance outside the view are still drawn;
+#     covers motion since the broad phase last indexed positions
+#
+# PROFILE_FRAMES / PROFILE_DIR
+# ----------------------------
+# Inputs:
+#   - Integer frame count / directory path
+# Purpose:
+#   - Length of an on-demand profile capture (core/profiler.py) and the
+#     directory receiving its .pstats and Chrome trace files
+#
+# ----------------------------------------------------------------------
+#
 # COLOR CONSTANTS (WHITE, BLACK, RED, etc.)
 # ----------------------------------------
 # Inputs:
@@ -211,6 +519,27 @@ MATERIALS = {
 #
 # ----------------------------------------------------------------------
 #
+# GRAVITY_SOLVERS / GRAVITY_WORKERS / BH_THETA
+# -------------------------------------------
+# Inputs:
+#   - Tuple of solver names / integer process count / float opening angle
+# Purpose:
+#   - Lists the gravity solvers the simulation loop can switch between
+#   - Sizes the process pool of the parallel solver
+#   - Tunes Barnes–Hut accuracy vs. speed
+#
+# ----------------------------------------------------------------------
+#
+# PM_GRID / PM_BOUNDARY / DUST_CLOUD_COUNT
+# ----------------------------------------
+# Inputs:
+#   - (nx, ny) tuple / boundary name / integer
+# Purpose:
+#   - Configure the particle-mesh solver's grid and boundary handling
+#   - Size of the dust clouds spawned for dense-scene experiments
+#
+# ----------------------------------------------------------------------
+#
 # MATERIALS
 # ---------
 # Inputs:
@@ -219,3 +548,23 @@ MATERIALS = {
 #   - Defines physical + visual properties of bodies
 #   - Used during body spawning
 #   - Enables diversity
+#
+# ----------------------------------------------------------------------
+#
+# MATERIAL_WEIGHTS
+# ----------------
+# Inputs:
+#   - List of relative spawn weights (same order as MATERIALS)
+# Purpose:
+#   - Shared by interactive spawning and generated benchmark scenes
+#
+# ----------------------------------------------------------------------
+#
+# BROAD_PHASE / AABB_MARGIN / AABB_REBUILD_FACTOR
+# -----------------------------------------------
+# Inputs:
+#   - Broad phase name / float margin in pixels / float > 1
+# Purpose:
+#   - Selects the collision broad phase used by the simulation loop
+#   - Trades tree query tightness against refit frequency
+#   - How loose a refitted tree may get before it is rebuilt
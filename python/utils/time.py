@@ -0,0 +1,106 @@
+# ============================================================
+# Time Stepping Utilities
+# ============================================================
+# Decouples the physics rate from the frame rate: frames feed
+# real time into an accumulator, physics consumes it in fixed
+# steps, and rendering interpolates between the last two
+# physics states.
+# ============================================================
+
+import utils.constants as C
+
+
+# ------------------------------------------------------------
+# Fixed-step accumulator
+# ------------------------------------------------------------
+class FixedTimestep:
+    def __init__(self, hz=C.PHYSICS_HZ, max_substeps=C.MAX_SUBSTEPS):
+        self.dt = 1.0 / hz
+        self.max_substeps = max_substeps
+        self.accumulator = 0.0
+
+        # Simulated seconds thrown away because of the step cap
+        self.dropped = 0.0
+
+    # --------------------------------------------------------
+    # Add one frame's real time; returns the steps to run now
+    # --------------------------------------------------------
+    def advance(self, frame_dt):
+        self.accumulator += frame_dt
+        steps = int(self.accumulator / self.dt)
+
+        # Spiral-of-death guard: run at most max_substeps and drop
+        # the backlog instead of carrying it into the next frame
+        if steps > self.max_substeps:
+            self.dropped += self.accumulator - self.max_substeps * self.dt
+            self.accumulator = 0.0
+            return self.max_substeps
+
+        self.accumulator -= steps * self.dt
+        return steps
+
+    # --------------------------------------------------------
+    # Fraction of a step left over (render interpolation factor)
+    # --------------------------------------------------------
+    @property
+    def alpha(self):
+        return self.accumulator / self.dt
+
+    def reset(self):
+        self.accumulator = 0.0
+
+
+
+
+
+# ======================================================================
+#                           TEACHING SECTION
+# ======================================================================
+#
+# File: time.py
+#
+# Role of this file:
+# ------------------
+# Using the frame time as the physics step makes the simulation depend
+# on the frame rate: one slow frame produces one huge step, bodies jump
+# through each other and orbits blow up.
+#
+# Fixed timestep ("Fix Your Timestep"):
+#
+#   accumulator += frame time
+#   while accumulator >= dt:
+#       step physics by dt
+#       accumulator -= dt
+#   draw with alpha = accumulator / dt
+#
+# ----------------------------------------------------------------------
+#
+# =========================
+# CLASS: FixedTimestep
+# =========================
+#
+# FixedTimestep(hz, max_substeps)
+#
+# advance(frame_dt) → number of steps of size .dt to run this frame
+#   - More than max_substeps → run max_substeps and drop the rest
+#     (.dropped counts the lost seconds). Without the cap a slow frame
+#     schedules more steps, which makes the next frame slower still
+#     ("spiral of death").
+#
+# alpha → leftover fraction of a step, in [0, 1)
+#
+# The blend itself is Snapshot.interpolated(alpha, rows)
+# (core/physics_worker.py): the worker keeps the positions before the
+# last step in each snapshot it publishes.
+#
+# ======================================================================
+#                       IMPROVEMENT SECTION
+# ======================================================================
+#
+# 1. Interpolate Rotation / Color
+#    - Once bodies carry more visual state.
+#
+# 2. Adaptive Rate
+#    - Lower PHYSICS_HZ automatically when steps are dropped repeatedly.
+#
+# ======================================================================